@@ -0,0 +1,9 @@
+"""Benchmarks for qntpy, in `asv` (airspeed velocity) format.
+
+Run them against the current environment, without network access, with:
+```
+asv run --python=same
+```
+`track_*` benchmarks report the overhead of an operation on quantities relative to the same operation on raw
+`numpy` values, and `timeraw_*` benchmarks measure import time in a fresh interpreter.
+"""
@@ -0,0 +1,24 @@
+"""Benchmarks for dimension vector algebra."""
+
+from qntpy.core.dimension import Dim, DimVec
+
+
+class DimVecArithmetic:
+    def setup(self):
+        self.force = DimVec({Dim.M: 1, Dim.L: 1, Dim.T: -2})
+        self.length = DimVec({Dim.L: 1})
+
+    def time_add(self):
+        self.force + self.length
+
+    def time_sub(self):
+        self.force - self.length
+
+    def time_neg(self):
+        -self.force
+
+    def time_eq(self):
+        self.force == self.length
+
+    def time_construct(self):
+        DimVec({Dim.M: 1, Dim.L: 1, Dim.T: -2})
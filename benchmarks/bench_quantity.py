@@ -0,0 +1,145 @@
+"""Benchmarks for `Quantity` arithmetic and numpy dispatch, with raw-numpy baselines.
+
+The `track_*_overhead` benchmarks report how many times slower an operation on quantities is than the same
+operation on the underlying values, so overhead can be compared across releases independently of the machine.
+"""
+
+import numpy as np
+
+from qntpy.core.quantity import Quantity, ScalarQuantity
+from qntpy.core.units import m, s
+from qntpy.constants.us import ft
+
+from .common import overhead_ratio
+
+
+class ScalarArithmetic:
+    def setup(self):
+        self.a = Quantity(3.0, m)
+        self.b = Quantity(4.0, m)
+        self.t = Quantity(2.0, s)
+
+    def time_construct(self):
+        Quantity(3.0, m)
+
+    def time_construct_converted(self):
+        Quantity(3.0, ft)
+
+    def time_add(self):
+        self.a + self.b
+
+    def time_mul(self):
+        self.a * self.t
+
+    def time_truediv(self):
+        self.a / self.t
+
+    def time_pow(self):
+        self.a ** 2
+
+    def track_add_overhead(self):
+        a, b = self.a.value, self.b.value
+        return overhead_ratio(lambda: self.a + self.b, lambda: a + b, number=1000)
+    track_add_overhead.unit = 'ratio'
+
+    def track_mul_overhead(self):
+        a, t = self.a.value, self.t.value
+        return overhead_ratio(lambda: self.a * self.t, lambda: a * t, number=1000)
+    track_mul_overhead.unit = 'ratio'
+
+
+class CompactScalarArithmetic:
+    def setup(self):
+        self.a = ScalarQuantity(3.0, m)
+        self.b = ScalarQuantity(4.0, m)
+        self.t = ScalarQuantity(2.0, s)
+
+    def time_construct(self):
+        ScalarQuantity(3.0, m)
+
+    def time_construct_converted(self):
+        ScalarQuantity(3.0, ft)
+
+    def time_add(self):
+        self.a + self.b
+
+    def time_mul(self):
+        self.a * self.t
+
+    def time_truediv(self):
+        self.a / self.t
+
+    def peakmem_list(self):
+        [ScalarQuantity(float(i), m) for i in range(100_000)]
+
+    def track_mul_overhead(self):
+        a, t = self.a.value, self.t.value
+        return overhead_ratio(lambda: self.a * self.t, lambda: a * t, number=1000)
+    track_mul_overhead.unit = 'ratio'
+
+
+class ArrayArithmetic:
+    params = [10, 10_000, 1_000_000]
+    param_names = ['size']
+
+    def setup(self, size):
+        self.x = np.random.default_rng(0).random(size)
+        self.y = np.random.default_rng(1).random(size)
+        self.a = Quantity(self.x, m)
+        self.b = Quantity(self.y, m)
+        self.t = Quantity(self.y, s)
+
+    def time_construct_converted(self, size):
+        Quantity(self.x, ft)
+
+    def time_add(self, size):
+        self.a + self.b
+
+    def time_mul(self, size):
+        self.a * self.t
+
+    def time_truediv(self, size):
+        self.a / self.t
+
+    def time_iadd(self, size):
+        self.a += self.b
+
+    def time_baseline_add(self, size):
+        self.x + self.y
+
+    def track_add_overhead(self, size):
+        return overhead_ratio(lambda: self.a + self.b, lambda: self.x + self.y, number=20)
+    track_add_overhead.unit = 'ratio'
+
+    def track_mul_overhead(self, size):
+        return overhead_ratio(lambda: self.a * self.t, lambda: self.x * self.y, number=20)
+    track_mul_overhead.unit = 'ratio'
+
+
+class NumpyDispatch:
+    params = [10, 1_000_000]
+    param_names = ['size']
+
+    def setup(self, size):
+        self.x = np.random.default_rng(0).random(size)
+        self.a = Quantity(self.x, m)
+
+    def time_ufunc_multiply(self, size):
+        np.multiply(self.a, self.a)
+
+    def time_ufunc_reduce(self, size):
+        np.add.reduce(self.a)
+
+    def time_array_function_sum(self, size):
+        np.sum(self.a)
+
+    def time_array_function_ravel(self, size):
+        np.ravel(self.a)
+
+    def track_ufunc_overhead(self, size):
+        return overhead_ratio(lambda: np.multiply(self.a, self.a), lambda: np.multiply(self.x, self.x), number=20)
+    track_ufunc_overhead.unit = 'ratio'
+
+    def track_sum_overhead(self, size):
+        return overhead_ratio(lambda: np.sum(self.a), lambda: np.sum(self.x), number=20)
+    track_sum_overhead.unit = 'ratio'
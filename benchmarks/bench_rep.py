@@ -0,0 +1,47 @@
+"""Benchmarks for unit simplification, formatting and import time."""
+
+import numpy as np
+
+from qntpy.core.units import derived_units
+from qntpy.rep import NumberSystems
+from qntpy.rep.rep import array_dispatch, prefixed_rep
+from qntpy.rep.simplify import simplify
+
+
+class Simplify:
+    params = [unit.symbol for unit in derived_units]
+    param_names = ['unit']
+
+    def setup(self, symbol):
+        self.unit = {unit.symbol: unit for unit in derived_units}[symbol].copy()
+        self.unit._symbol = None
+
+    def time_simplify(self, symbol):
+        simplify(self.unit)
+
+
+class Formatting:
+    params = [100, 100_000]
+    param_names = ['size']
+
+    def setup(self, size):
+        self.values = np.random.default_rng(0).random(size) * 1e4
+
+    def time_array_dispatch(self, size):
+        array_dispatch(self.values, NumberSystems.NIST)
+
+    def time_array_dispatch_full(self, size):
+        array_dispatch(self.values, NumberSystems.NIST, threshold=size)
+
+    def time_prefixed_rep(self, size):
+        prefixed_rep(self.values, 'N', NumberSystems.NIST, threshold=size)
+
+    def time_baseline_array2string(self, size):
+        np.array2string(self.values, threshold=size)
+
+
+def timeraw_import_qntpy():
+    return "import qntpy"
+
+def timeraw_import_constants():
+    return "import qntpy.constants", "import qntpy.core.quantity"
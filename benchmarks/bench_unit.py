@@ -0,0 +1,24 @@
+"""Benchmarks for unit algebra."""
+
+from qntpy.core.units import m, s, kg, N, J, Pa
+
+
+class UnitAlgebra:
+    def time_mul(self):
+        N * m
+
+    def time_truediv(self):
+        J / s
+
+    def time_pow(self):
+        m ** 3
+
+    def time_compound(self):
+        kg * m / s / s
+
+    def time_eq(self):
+        Pa == N / m / m
+
+    def time_symbol(self):
+        # symbols of new units are found by simplification
+        (kg * m / s).symbol
@@ -0,0 +1,11 @@
+"""Helpers shared by the benchmarks."""
+
+import timeit
+
+def best_time(func, number: int=100, repeat: int=5) -> float:
+    """Return the best average time per call of `func`, in seconds, over `repeat` runs of `number` calls."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+def overhead_ratio(func, baseline, number: int=100, repeat: int=5) -> float:
+    """Return how many times slower `func` is than `baseline`, an equivalent computation on raw `numpy` values."""
+    return best_time(func, number, repeat) / best_time(baseline, number, repeat)
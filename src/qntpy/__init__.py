@@ -10,7 +10,9 @@ any number. A physical quantity is made up of two parts:
    although non-SI units and quantities are included in qntpy.
 """
 
-from qntpy.core.quantity import Quantity
+from qntpy.core.quantity import Quantity, ScalarQuantity
 from qntpy.core.unit import Unit
 from qntpy.core.units import *
-from qntpy.constants import *
\ No newline at end of file
+from qntpy.constants import *
+from qntpy.util.profiling import profile, stats
+from qntpy.util.cache import cached
\ No newline at end of file
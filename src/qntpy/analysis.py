@@ -0,0 +1,150 @@
+"""Dimensional analysis.
+
+By the Buckingham π theorem, a physical relation between `n` quantities whose dimension vectors have rank `r` can be
+rewritten as a relation between `n - r` dimensionless products of them. `pi_groups` finds such a set of products, so a
+sweep over the original parameters can be replaced by a sweep over the (fewer) groups:
+```
+>>> from qntpy import analysis
+>>> groups = analysis.pi_groups(rho, v, L, mu, names=['ρ', 'v', 'L', 'μ'])
+>>> groups
+[PiGroup(ρ⁻¹ v⁻¹ L⁻¹ μ)]
+>>> 1/groups[0](rho, v_sweep, L, mu)         # the Reynolds number, as an array for an array of velocities
+```
+The groups are computed exactly, in integers, from the exponent matrix of the quantities' dimensions.
+"""
+
+from __future__ import annotations
+
+from math import gcd
+from typing import Any, Sequence
+
+import numpy as np
+
+from qntpy.core import defs
+from qntpy.core.dimension import DimVec, exponent_matrix
+from qntpy.core.quantity import Quantity
+from qntpy.rep import rep
+from qntpy.util import exceptions as exc
+
+
+def _dimension(obj: Quantity | DimVec | Any) -> DimVec:
+    if isinstance(obj, DimVec):
+        return obj
+    if isinstance(obj, Quantity):
+        return obj.unit.vec
+    if isinstance(obj, defs.Unit):
+        return obj.vec
+    return DimVec({})
+
+def _normalize(vector: list[int]) -> list[int]:
+    """Divide an integer vector by the gcd of its entries, and make its last nonzero entry positive."""
+    divisor = 0
+    for x in vector:
+        divisor = gcd(divisor, x)
+    if divisor == 0:
+        return vector
+    sign = 1 if next(x for x in reversed(vector) if x) > 0 else -1
+    return [sign*x // divisor for x in vector]
+
+def _normalize_row(row: list[int]) -> list[int]:
+    divisor = 0
+    for x in row:
+        divisor = gcd(divisor, x)
+    return [x // divisor for x in row] if divisor > 1 else row
+
+
+def integer_nullspace(matrix: np.ndarray | Sequence[Sequence[int]]) -> np.ndarray:
+    """Return a basis of the integer vectors `x` with `matrix @ x == 0`, as the rows of an `int` array.
+
+    The matrix is brought to reduced row echelon form by fraction-free Gauss-Jordan elimination in Python integers, so
+    the result is exact. Columns are eliminated from left to right, so each basis vector has a nonzero entry in exactly
+    one of the columns without a pivot, which is the last nonzero entry of the vector and is positive. Entries are
+    reduced by their gcd.
+    """
+    rows = [[int(x) for x in row] for row in np.asarray(matrix)]
+    n = np.shape(matrix)[1] if np.ndim(matrix) == 2 else 0
+    pivots: list[int] = []
+    r = 0
+    for c in range(n):
+        pivot = next((i for i in range(r, len(rows)) if rows[i][c] != 0), None)
+        if pivot is None:
+            continue
+        rows[r], rows[pivot] = rows[pivot], rows[r]
+        p = rows[r]
+        for i, row in enumerate(rows):
+            if i != r and row[c] != 0:
+                factor = row[c]
+                row[:] = _normalize_row([p[c]*x - factor*y for x, y in zip(row, p)])
+        pivots.append(c)
+        r += 1
+        if r == len(rows):
+            break
+    basis = []
+    for free in (c for c in range(n) if c not in pivots):
+        # rows[k] reads p_k*x[pivots[k]] + rows[k][free]*x[free] == 0 (other free variables are zero)
+        scale = 1
+        for k in range(len(pivots)):
+            scale = scale*rows[k][pivots[k]] // gcd(scale, rows[k][pivots[k]])
+        vector = [0]*n
+        vector[free] = scale
+        for k, c in enumerate(pivots):
+            vector[c] = -rows[k][free]*scale // rows[k][c]
+        basis.append(_normalize(vector))
+    return np.array(basis, dtype=np.int64).reshape(len(basis), n)
+
+
+class PiGroup:
+    """A dimensionless product of powers of quantities.
+
+    Calling a group with values for its quantities (in the order given to `pi_groups`) evaluates the product. The values
+    may be quantities in any units of the right dimensions, or arrays of them; the product is computed from their SI
+    values with one vectorized operation per quantity, and returned as a plain number or array.
+    """
+    def __init__(self, exponents: Sequence[int], dimensions: Sequence[DimVec], names: Sequence[str]) -> None:
+        self.exponents: tuple[int, ...] = tuple(int(k) for k in exponents)
+        self.dimensions: tuple[DimVec, ...] = tuple(dimensions)
+        self.names: tuple[str, ...] = tuple(names)
+
+    def __call__(self, *values: Quantity | Any) -> Any:
+        if len(values) != len(self.exponents):
+            raise TypeError(f"Expected {len(self.exponents)} values, got {len(values)}")
+        result = 1
+        for value, exponent, dimension, name in zip(values, self.exponents, self.dimensions, self.names):
+            if exponent == 0:
+                continue
+            if _dimension(value) != dimension:
+                raise exc.IncommensurableError(f"{name} must have the dimension {dimension or 'of a number'}, not {_dimension(value)}")
+            if isinstance(value, defs.Unit):
+                value = Quantity(1, value, bypass_checks=True)
+            value = Quantity.get_value(value)
+            if np.asarray(value).dtype.kind in 'iu':
+                # numpy integers can't be raised to negative powers
+                value = np.asarray(value, dtype=float)[()]
+            result = result * value**exponent
+        return result
+
+    def __str__(self) -> str:
+        return ' '.join(f'{name}{rep.to_superscript(k) if k != 1 else ""}' for name, k in zip(self.names, self.exponents) if k)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({str(self)})'
+
+
+def pi_groups(*quantities: Quantity | defs.Unit | DimVec, names: Sequence[str] | None=None) -> list[PiGroup]:
+    """Return a complete set of independent dimensionless groups of `quantities`.
+
+    There are as many groups as the number of quantities minus the rank of their dimensions. Each group contains one
+    quantity that no other group contains, to a positive power, along with powers of the quantities before it, so
+    putting the quantities to vary on their own (e.g. a velocity being swept) last gives each of them its own group.
+
+    Args:
+    - quantities: Quantities, units or dimension vectors. Only their dimensions are used.
+    - names: The names of the quantities, used to display the groups. Defaults to `q1`, `q2`, ...
+    """
+    if names is None:
+        names = [f'q{i + 1}' for i in range(len(quantities))]
+    if len(names) != len(quantities):
+        raise ValueError(f"Got {len(names)} names for {len(quantities)} quantities")
+    dimensions = [_dimension(q) for q in quantities]
+    basis = integer_nullspace(exponent_matrix(dimensions).T)
+    return [PiGroup(exponents, dimensions, names) for exponents in basis]
@@ -0,0 +1,97 @@
+"""Chunked evaluation of `Quantity` values that don't fit in memory.
+
+A `Quantity` whose value is a `numpy.memmap` is treated as out-of-core. Elementwise operations
+on such values are evaluated a block of rows at a time, and their results are written to a scratch
+`memmap` instead of a new in-memory array, so no full-size temporary is ever materialized. Reductions
+are evaluated per block and then combined.
+
+The block size and the location of scratch files can be tuned via `CHUNK_SIZE` and `SCRATCH_DIR`.
+"""
+
+from __future__ import annotations
+
+import tempfile
+from typing import Any, Callable, Iterator
+
+import numpy as np
+
+CHUNK_SIZE: int = 2**20
+"""Approximate number of elements evaluated per chunk."""
+
+SCRATCH_DIR: str | None = None
+"""Directory in which scratch files for out-of-core results are created. `None` uses the system default."""
+
+
+def is_out_of_core(value: Any) -> bool:
+    """Return whether `value` is backed by a memory-mapped file."""
+    return isinstance(value, np.memmap)
+
+
+def scratch_array(shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    """Allocate an uninitialized array backed by an anonymous scratch file.
+
+    Zero-size and 0-dimensional arrays cannot be memory-mapped, so these are allocated in memory instead.
+    """
+    if len(shape) == 0 or 0 in shape:
+        return np.empty(shape, dtype)
+    return np.memmap(tempfile.TemporaryFile(dir=SCRATCH_DIR), dtype=dtype, mode='w+', shape=shape)
+
+
+def iter_chunks(shape: tuple[int, ...]) -> Iterator[slice | tuple]:
+    """Yield index expressions that partition an array of shape `shape` into blocks along its first axis.
+
+    Each block holds approximately `CHUNK_SIZE` elements, and at least one row.
+    """
+    if len(shape) == 0:
+        yield ()
+        return
+    row_size = int(np.prod(shape[1:], dtype=np.int64)) or 1
+    step = max(1, CHUNK_SIZE // row_size)
+    for start in range(0, shape[0], step):
+        yield slice(start, min(start + step, shape[0]))
+
+
+def apply(func: Callable, *args: Any, out: np.ndarray | None=None) -> np.ndarray:
+    """Evaluate the elementwise function `func(*args)` chunk by chunk.
+
+    Array arguments are broadcast against each other; all other arguments are passed to `func` unchanged.
+
+    Args:
+    - func: An elementwise function, e.g. a ufunc or an `operator` function.
+    - args: The arguments to `func`.
+    - out: The array in which to store the result. If `None`, a scratch array is allocated with the
+    dtype of the first evaluated chunk.
+    """
+    is_array = [isinstance(arg, np.ndarray) for arg in args]
+    shape = np.broadcast_shapes(*(arg.shape for arg, array in zip(args, is_array) if array))
+    args = [np.broadcast_to(arg, shape) if array else arg for arg, array in zip(args, is_array)]
+    for index in iter_chunks(shape):
+        result = func(*(arg[index] if array else arg for arg, array in zip(args, is_array)))
+        if out is None:
+            out = scratch_array(shape, np.asarray(result).dtype)
+        out[index] = result
+    if out is None:
+        # zero-length first axis: evaluate on the empty arrays to determine the output dtype
+        out = scratch_array(shape, np.asarray(func(*args)).dtype)
+    return out
+
+
+def reduce(ufunc: np.ufunc, value: np.ndarray, axis: int | None=0, **kwargs) -> Any:
+    """Evaluate `ufunc.reduce(value, axis)` chunk by chunk.
+
+    Only reductions over all axes (`axis=None`) or over the first axis are chunked. Other reductions
+    produce an output no larger than a single chunk's worth of rows, and are delegated to `numpy` directly.
+    """
+    if (axis not in (None, 0) and axis != (0,)) or value.ndim == 0 or kwargs:
+        return ufunc.reduce(value, axis=axis, **kwargs)
+    partials = [ufunc.reduce(value[index], axis=axis) for index in iter_chunks(value.shape) if value[index].size]
+    if not partials:
+        return ufunc.reduce(value, axis=axis)
+    return ufunc.reduce(np.asarray(partials), axis=0)
+
+
+def evaluate(func: Callable, *args: Any) -> Any:
+    """Evaluate `func(*args)`, using `apply` if any of the arguments is out-of-core."""
+    if any(is_out_of_core(arg) for arg in args):
+        return apply(func, *args)
+    return func(*args)
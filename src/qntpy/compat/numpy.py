@@ -52,3 +52,33 @@ PASSTHROUGH_W_UNIT_FUNCTIONS = [
 # These functions are those that require special implementations and are not ufuncs:
 
 HANDLED_FUNCTIONS = {}
+
+
+def cumulative_trapezoid(y, x=None, dx=1.0, axis: int=-1, initial: float | None=None):
+    """Cumulatively integrate `y` along `axis` with the trapezoidal rule, like `scipy.integrate.cumulative_trapezoid`.
+
+    `y`, `x` and `dx` may be `Quantity` objects; the result then has the unit of `y` times the unit of `x` (or `dx`).
+    The integral is computed with a few vectorized operations on the values, whatever the length of `y`.
+
+    Args:
+    - y: The values to integrate.
+    - x: The sample points of `y` along `axis`. If `None`, the samples are spaced `dx` apart.
+    - dx: The spacing between samples, if `x` is `None`.
+    - axis: The axis to integrate along.
+    - initial: If given, the result starts with this value (`0` is the only value that makes it a true integral), and
+    has the length of `y` along `axis`; otherwise it is one element shorter.
+    """
+    from qntpy.core.quantity import Quantity
+    y, x, dx = Quantity._as_quantity(y), Quantity._as_quantity(x), Quantity._as_quantity(dx)
+    y_value = np.asarray(Quantity.get_value(y))
+    y_value = np.moveaxis(y_value, axis, -1)
+    if x is None:
+        step = Quantity.get_value(dx)
+    else:
+        x_value = np.asarray(Quantity.get_value(x))
+        step = np.diff(np.moveaxis(x_value, axis, -1) if x_value.ndim > 1 else x_value)
+    result = np.cumsum((y_value[..., 1:] + y_value[..., :-1]) * (step / 2), axis=-1)
+    if initial is not None:
+        result = np.concatenate([np.full(result.shape[:-1] + (1,), initial, dtype=result.dtype), result], axis=-1)
+    unit = Quantity._unit_or_one(y) * Quantity._unit_or_one(x if x is not None else dx)
+    return np.moveaxis(result, -1, axis) * unit
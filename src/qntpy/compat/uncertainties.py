@@ -0,0 +1,71 @@
+"""Compaction of `uncertainties` values that have passed through long chains of operations.
+
+Every operation on an `AffineScalarFunc` records its result as a linear combination of its operands' linear parts,
+so a value computed by a long chain of `Quantity` operations keeps the whole chain alive, and evaluating its
+`std_dev` walks all of it. Compacting a value flattens its linear part onto the independent `Variable`s it depends on
+(e.g. those of `G` and `mu_0`), after which its memory use only depends on the number of those variables.
+
+Compaction is off by default. If `THRESHOLD` is set, every `AffineScalarFunc` stored as the value of a `Quantity` (or
+in an object array that is) is compacted once more than `THRESHOLD` unflattened operations have accumulated in it,
+so long iterative computations keep a bounded graph per value:
+```
+>>> from qntpy.compat import uncertainties
+>>> uncertainties.THRESHOLD = 8
+```
+Checking a value costs up to `THRESHOLD` steps, while flattening a value whose operands are already flat is cheap,
+so small thresholds are usually the fastest.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+from uncertainties.core import AffineScalarFunc
+
+THRESHOLD: int | None = None
+"""Number of unflattened operations a `Quantity` value may accumulate before it is compacted. `None` disables compaction."""
+
+
+def pending_terms(value: AffineScalarFunc, limit: int | None=None) -> int:
+    """Count the unflattened linear combinations in the dependency graph of `value`.
+
+    The count stops early once it exceeds `limit`, so checking whether a value needs compacting costs at most
+    `limit` steps.
+    """
+    count = 0
+    stack = [value._linear_part]
+    while stack:
+        combination = stack.pop()
+        if combination.expanded():
+            continue
+        count += 1
+        if limit is not None and count > limit:
+            break
+        stack.extend(term for _, term in combination.linear_combo)
+    return count
+
+
+def compact(value: Any) -> Any:
+    """Flatten the linear part of `value` onto its independent variables, in place, and return `value`.
+
+    `value` may be an `AffineScalarFunc` or an object array of them; other values are returned unchanged.
+    """
+    if isinstance(value, AffineScalarFunc):
+        if not value._linear_part.expanded():
+            value._linear_part.expand()
+    elif isinstance(value, np.ndarray) and value.dtype == object:
+        for element in value.flat:
+            compact(element)
+    return value
+
+
+def maybe_compact(value: Any) -> Any:
+    """Compact `value` if more than `THRESHOLD` operations have accumulated in it, and return it."""
+    if isinstance(value, AffineScalarFunc):
+        if pending_terms(value, THRESHOLD) > THRESHOLD:
+            compact(value)
+    elif isinstance(value, np.ndarray) and value.dtype == object:
+        for element in value.flat:
+            maybe_compact(element)
+    return value
@@ -1,5 +1,6 @@
 from qntpy.core import units
 from qntpy.core.unit import Unit
+from qntpy.rep.convention import UnitSystem
 # unit definition: us customary
 
 # length
@@ -54,3 +55,9 @@ slug =   lbf*units.s**2/ft
 psi =  lbf/inch2
 ksi =  1e3 * psi
 Mpsi = 1e6 * ksi
+
+US_CUSTOMARY = UnitSystem(ft, lbm, units.s, units.A, R, units.mol, units.cd)
+
+from qntpy.core import registry as _registry
+_registry.default_registry.register_module(globals())
+__getattr__ = _registry.prefixed_getattr(globals(), bases=('Btu', 'lbf', 'psi'))
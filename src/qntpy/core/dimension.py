@@ -1,67 +1,120 @@
 from __future__ import annotations
 
-from enum import Enum, auto
-from typing import Dict
+from typing import Dict, Iterable, Iterator, Mapping
+
+import numpy as np
 
 from qntpy.core import defs
 from qntpy.rep import rep
+from qntpy.util import profiling
+
+class _DimMeta(type):
+    """Lets the `Dim` class be iterated over and indexed by name, like an `Enum`."""
+    def __iter__(cls) -> Iterator[Dim]:
+        return iter(cls._registry)
+
+    def __len__(cls) -> int:
+        return len(cls._registry)
+
+    def __getitem__(cls, name: str) -> Dim:
+        for dim in cls._registry:
+            if dim.name == name:
+                return dim
+        raise KeyError(name)
+
 
-class Dim(Enum):
-    """Base physical dimensions."""
-    L = auto()
+class Dim(metaclass=_DimMeta):
+    """A base physical dimension.
+    
+    The seven SI base dimensions are predefined as `Dim.L`, `Dim.T`, `Dim.M`, `Dim.I`, `Dim.THETA`, `Dim.N` and `Dim.J`.
+    Additional base dimensions (e.g. information, currency, count or angle) can be added with `Dim.register`. Each dimension
+    has an `index`, its position in the exponent arrays of `DimVec`, which grow as dimensions are registered.
+    """
+    _registry: list[Dim] = []
+    
+    L: Dim
     """Length."""
-    T = auto()
+    T: Dim
     """Time."""
-    M = auto()
+    M: Dim
     """Mass."""
-    I = auto()
+    I: Dim
     """Electric current."""
-    THETA = auto()
+    THETA: Dim
     """Thermodynamic temperature."""
-    N = auto()
+    N: Dim
     """Amount of substance."""
-    J = auto()
+    J: Dim
     """Luminous intensity."""
     
+    def __init__(self, name: str, abbrev: str, unit_symbol: str) -> None:
+        self.name = name
+        self.abbrev = abbrev
+        self.unit_symbol = unit_symbol
+        self.index = len(Dim._registry)
+
+    @classmethod
+    def register(cls, name: str, abbrev: str, unit_symbol: str) -> Dim:
+        """Add a new base dimension, and return it. The new dimension is also available as `Dim.<name>`.
+        
+        Registering a dimension with the same name, abbreviation and unit symbol as an existing one returns the existing one.
+        
+        Args:
+        - name: The name of the dimension, e.g. `'INFORMATION'`.
+        - abbrev: The symbol of the dimension used in dimension vectors, e.g. `'Inf'`.
+        - unit_symbol: The symbol of the base unit of the dimension, e.g. `'b'`.
+        """
+        if name in cls.__dict__:
+            existing = cls.__dict__[name]
+            if isinstance(existing, Dim) and (existing.abbrev, existing.unit_symbol) == (abbrev, unit_symbol):
+                return existing
+            raise ValueError(f"Dimension {name} is already defined!")
+        dim = cls(name, abbrev, unit_symbol)
+        cls._registry.append(dim)
+        setattr(cls, name, dim)
+        return dim
+
     def __repr__(self):
-        match self:
-            case Dim.L:
-                return 'L'
-            case Dim.T:
-                return 'T'
-            case Dim.M:
-                return 'M'
-            case Dim.I:
-                return 'I'
-            case Dim.THETA:
-                return 'Θ'
-            case Dim.N:
-                return 'N'
-            case Dim.J:
-                return 'J'
+        return self.abbrev
   
     def __str__(self):
-        match self:
-            case Dim.L:
-                return 'm'
-            case Dim.T:
-                return 's'
-            case Dim.M:
-                return 'g'
-            case Dim.I:
-                return 'A'
-            case Dim.THETA:
-                return 'K'
-            case Dim.N:
-                return 'mol'
-            case Dim.J:
-                return 'cd'
+        return self.unit_symbol
+
+    # dimensions are singletons
+    def __copy__(self) -> Dim:
+        return self
+
+    def __deepcopy__(self, memo) -> Dim:
+        return self
+
+    def __reduce__(self):
+        return (_dim_by_name, (self.name,))
+
+def _dim_by_name(name: str) -> Dim:
+    return Dim[name]
+
+Dim.register('L', 'L', 'm')
+Dim.register('T', 'T', 's')
+Dim.register('M', 'M', 'g')
+Dim.register('I', 'I', 'A')
+Dim.register('THETA', 'Θ', 'K')
+Dim.register('N', 'N', 'mol')
+Dim.register('J', 'J', 'cd')
 
 defs.Dim = Dim
 
+_KEY_BITS = 8
+_KEY_LIMIT = 2**(_KEY_BITS - 1)
+
 class DimVec(Dict):
-    """A dimension vector."""
+    """A dimension vector.
+    
+    A `dict` of `{Dim: int}` mapping base dimensions to their exponents. The same vector is available as a dense array of
+    exponents indexed by `Dim.index` (see `exponents`), for vectorized dimension algebra.
+    """
     def __init__(self, map):
+        if profiling.ENABLED:
+            profiling.record(profiling.DIMVEC_NEW)
         super().__init__(map)
         to_del = []
         for key in self.keys():
@@ -71,9 +124,92 @@ class DimVec(Dict):
                 raise ValueError(f"Value {self[key]} at key {key} in DimVec is not an int!")
             if self[key] == 0:
                 to_del.append(key)
+            else:
+                # keep exponents `int`s, e.g. after `(m*m)**0.5`
+                super().__setitem__(key, int(self[key]))
         for key in to_del:
             del self[key]
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drop the cached `mag2`, `exponents` and `key`, after the vector is modified."""
         self._mag2 = None
+        self._exponents = None
+        self._key = None
+
+    def __setitem__(self, key: Dim, value: int) -> None:
+        if int(value) == value:
+            value = int(value)
+        super().__setitem__(key, value)
+        self._invalidate()
+
+    def __delitem__(self, key: Dim) -> None:
+        super().__delitem__(key)
+        self._invalidate()
+
+    def __ior__(self, other: Mapping[Dim, int]) -> DimVec:
+        super().__ior__(other)
+        self._invalidate()
+        return self
+
+    def pop(self, *args) -> int:
+        power = super().pop(*args)
+        self._invalidate()
+        return power
+
+    def popitem(self) -> tuple[Dim, int]:
+        item = super().popitem()
+        self._invalidate()
+        return item
+
+    def setdefault(self, key: Dim, default: int) -> int:
+        power = super().setdefault(key, default)
+        self._invalidate()
+        return power
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._invalidate()
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate()
+
+    @property
+    def exponents(self) -> np.ndarray:
+        """The exponents of this vector as an `int` array with one entry per registered `Dim`, indexed by `Dim.index`.
+        
+        The array is cached, and is read-only. Its width grows when new dimensions are registered.
+        """
+        if self._exponents is None or len(self._exponents) != len(Dim):
+            exponents = np.zeros(len(Dim), dtype=np.int64)
+            for dim, power in self.items():
+                exponents[dim.index] = power
+            exponents.flags.writeable = False
+            self._exponents = exponents
+        return self._exponents
+
+    @property
+    def key(self) -> int:
+        """This vector packed into an `int`, suitable as a hash key. Equal vectors have equal keys, and vice versa.
+        
+        Each exponent is zigzag-encoded (0, -1, 1, -2, ... -> 0, 1, 2, 3, ...) into the `_KEY_BITS` bits at position
+        `Dim.index`, so registering new dimensions doesn't change the keys of existing vectors.
+        """
+        if self._key is None:
+            key = 0
+            for dim, power in self.items():
+                if not -_KEY_LIMIT <= power < _KEY_LIMIT:
+                    raise ValueError(f"Exponent {power} of {repr(dim)} is too large to be packed into a key")
+                key |= (2*power if power >= 0 else -2*power - 1) << (_KEY_BITS*dim.index)
+            self._key = key
+        return self._key
+
+    @classmethod
+    def from_exponents(cls, exponents: Iterable[int]) -> DimVec:
+        """Create a new `DimVec` from an array of exponents indexed by `Dim.index`."""
+        dims = list(Dim)
+        return cls({dims[i]: int(power) for i, power in enumerate(exponents) if power != 0})
 
     @property
     def mag2(self):
@@ -115,6 +251,13 @@ class DimVec(Dict):
     
     def __pos__(self) -> DimVec:
         return self
+
+    def invert(self) -> None:
+        """Negate every exponent of this vector in place."""
+        for key in self:
+            super().__setitem__(key, -self[key])
+        self._exponents = None
+        self._key = None
     
     def copy(self) -> DimVec:
         return DimVec(super().copy())
@@ -132,4 +275,11 @@ class DimVec(Dict):
             s += f'{repr(i)}{self[i]} '
         return rep.str_to_superscript(s.strip())
             
+def exponent_matrix(vecs: Iterable[DimVec]) -> np.ndarray:
+    """Stack the exponent arrays of `vecs` into a matrix with one row per vector and one column per registered `Dim`."""
+    vecs = list(vecs)
+    if not vecs:
+        return np.zeros((0, len(Dim)), dtype=np.int64)
+    return np.stack([vec.exponents for vec in vecs])
+
 defs.DimVec = DimVec
@@ -0,0 +1,291 @@
+"""Vectors and matrices whose elements have different units.
+
+A state vector like `[x, v]` has one unit per element (`m` and `m/s`), and its covariance matrix, or the Jacobian of
+a function of it, has one unit per element too. Such units aren't arbitrary: the unit of every element of a matrix that
+arises from physical equations is the product of a unit for its row and a unit for its column. A `QuantityMatrix`
+stores one float array, in coherent SI units, alongside the dimensions of its rows and of its columns, so the units of
+an `n`-by-`m` matrix take `n + m` entries rather than `n*m`:
+```
+>>> from qntpy.core.matrix import QuantityMatrix, solve
+>>> from qntpy import m, s
+>>> state = QuantityMatrix([2., 0.5], [m, m/s])
+>>> F = QuantityMatrix([[1., 0.1], [0., 1.]], [m, m/s], [1/m, s/m])   # x' = x + 0.1 s * v; v' = v
+>>> F @ state
+QuantityMatrix([2.05 0.5 ], rows=[m, m s⁻¹])
+```
+Operations check the row and column dimensions once, with a few vectorized comparisons, and then operate on the whole
+value array, which may hold a stack of matrices (or vectors) with the same units along its leading axes.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from qntpy.core.dimension import Dim, DimVec
+from qntpy.core.quantity import Quantity
+from qntpy.core.unit import Unit
+from qntpy.util import exceptions as exc
+
+UnitLike = Unit | Quantity | DimVec | float
+
+
+def _scale_and_dims(unit: UnitLike) -> tuple[Any, np.ndarray]:
+    """Return the size of `unit` in coherent SI units, and its dimension as an exponent array."""
+    if isinstance(unit, DimVec):
+        return 1, unit.exponents
+    if isinstance(unit, Quantity):
+        if not np.ndim(unit.value) == 0:
+            raise exc.InvalidUnitError(f"{unit} can't be used as the unit of a row or column")
+        return unit.value, unit.unit.vec.exponents
+    if isinstance(unit, Unit):
+        if unit.offset != 0:
+            raise exc.InvalidUnitError(f"{unit.symbol} has an offset, so it can't be used as the unit of a row or column")
+        return unit.factor, unit.vec.exponents
+    return unit, np.zeros(len(Dim), dtype=np.int64)
+
+def _units(units: Sequence[UnitLike]) -> tuple[np.ndarray, np.ndarray]:
+    """Return the scale factors and the exponent matrix (one row per unit) of `units`."""
+    scales, dims = zip(*map(_scale_and_dims, units)) if len(units) else ((), ())
+    return np.asarray(scales, dtype=float), _widen(np.array(dims, dtype=np.int64).reshape(len(units), -1))
+
+def _widen(dims: np.ndarray) -> np.ndarray:
+    """Pad an exponent matrix with zero columns for the dimensions registered since it was made."""
+    if dims.shape[-1] < len(Dim):
+        return np.pad(dims, [(0, 0)]*(dims.ndim - 1) + [(0, len(Dim) - dims.shape[-1])])
+    return dims
+
+def _common_offset(a: np.ndarray, b: np.ndarray, operation: str) -> np.ndarray:
+    """Return the dimension `d` such that `a[p] + b[p] == d` for every `p`. Raises `IncommensurableError` if there is none.
+
+    This is the dimension shared by every term of a sum of products of elements, e.g. in a matrix product.
+    """
+    total = _widen(a) + _widen(b)
+    if len(total) != 0 and not (total == total[0]).all():
+        raise exc.IncommensurableError(f"The terms of the {operation} don't have a common unit")
+    return total[0] if len(total) else np.zeros(len(Dim), dtype=np.int64)
+
+def _unit_of(dims: np.ndarray) -> Unit | float:
+    """Return the coherent SI unit with the dimension `dims`, or `1` for a dimensionless one."""
+    return Unit(DimVec.from_exponents(dims))
+
+def _symbol(dims: np.ndarray) -> str:
+    unit = _unit_of(dims)
+    return unit.symbol if isinstance(unit, Unit) else '1'
+
+
+class QuantityMatrix:
+    """A vector or matrix whose elements have different units: the unit of each element is the product of the unit of
+    its row and the unit of its column (vectors only have rows).
+
+    The row and column units are only defined up to a common factor (e.g. rows `[m, m/s]` with columns `[1/m, s/m]`
+    describe the same matrix as rows `[1, 1/s]` with columns `[1, s]`); operations may return either form.
+    """
+    __slots__ = ('value', 'row_dims', 'col_dims')
+
+    def __init__(self, value: ArrayLike, row_units: Sequence[UnitLike], col_units: Sequence[UnitLike] | None=None) -> None:
+        """Create a new matrix, or a vector if `col_units` is `None`.
+
+        Args:
+        - value: The elements, in the product of their row and column units. The last axis (of a vector) or the last
+        two axes (of a matrix) index the elements; any leading axes hold a stack of vectors or matrices.
+        - row_units: The unit of each row, e.g. a `Unit`, a scalar `Quantity`, a `DimVec` or a number.
+        - col_units: The unit of each column.
+        """
+        value = np.asarray(value)
+        row_scales, self.row_dims = _units(row_units)
+        if col_units is None:
+            self.col_dims = None
+            scale = row_scales
+        else:
+            col_scales, self.col_dims = _units(col_units)
+            scale = np.multiply.outer(row_scales, col_scales)
+        if value.shape[value.ndim - scale.ndim:] != scale.shape:
+            raise ValueError(f"A value of shape {value.shape} doesn't match {scale.shape[0]} row units"
+                             + ('' if col_units is None else f" and {scale.shape[1]} column units"))
+        self.value = value * scale if np.any(scale != 1) else value
+
+    @classmethod
+    def _from_dims(cls, value: np.ndarray, row_dims: np.ndarray, col_dims: np.ndarray | None) -> QuantityMatrix:
+        """Create a matrix from a value in coherent SI units and exponent matrices, without converting anything."""
+        new = cls.__new__(cls)
+        new.value, new.row_dims, new.col_dims = value, row_dims, col_dims
+        return new
+
+    @property
+    def is_vector(self) -> bool:
+        return self.col_dims is None
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.value.shape
+
+    @property
+    def ndim(self) -> int:
+        return self.value.ndim
+
+    @property
+    def row_units(self) -> list[Unit | float]:
+        """The coherent SI unit of each row."""
+        return [_unit_of(dims) for dims in self.row_dims]
+
+    @property
+    def col_units(self) -> list[Unit | float] | None:
+        """The coherent SI unit of each column, or `None` for a vector."""
+        return None if self.is_vector else [_unit_of(dims) for dims in self.col_dims]
+
+    def unit(self, i: int, j: int | None=None) -> Unit | float:
+        """Return the coherent SI unit of element `i` of a vector, or of element `(i, j)` of a matrix."""
+        if self.is_vector:
+            return _unit_of(_widen(self.row_dims)[i])
+        return _unit_of(_widen(self.row_dims)[i] + _widen(self.col_dims)[j])
+
+    def __getitem__(self, index: int | tuple[int, int]) -> Quantity | Any:
+        """Return element `i` of a vector, or element `(i, j)` of a matrix, as a `Quantity` (over any stacked axes)."""
+        index = index if isinstance(index, tuple) else (index,)
+        if len(index) != (1 if self.is_vector else 2):
+            raise IndexError(f"A {'vector' if self.is_vector else 'matrix'} is indexed by {'one index' if self.is_vector else 'two indices'}")
+        return self.value[(Ellipsis,) + index] * self.unit(*index)
+
+    @property
+    def T(self) -> QuantityMatrix:
+        """The transpose of a matrix (of each matrix in a stack). A vector is returned unchanged."""
+        if self.is_vector:
+            return self
+        return QuantityMatrix._from_dims(np.swapaxes(self.value, -1, -2), self.col_dims, self.row_dims)
+
+    def _element_dims(self) -> np.ndarray:
+        """The dimension of every element, with shape `(n, D)` for a vector or `(n, m, D)` for a matrix."""
+        if self.is_vector:
+            return _widen(self.row_dims)
+        return _widen(self.row_dims)[:, None, :] + _widen(self.col_dims)[None, :, :]
+
+    def _same_units(self, other: QuantityMatrix) -> None:
+        if self.is_vector != other.is_vector or not np.array_equal(self._element_dims(), other._element_dims()):
+            raise exc.IncommensurableError("Cannot add or subtract matrices whose elements have different units")
+
+    def __add__(self, other: QuantityMatrix) -> QuantityMatrix:
+        if not isinstance(other, QuantityMatrix):
+            return NotImplemented
+        self._same_units(other)
+        return QuantityMatrix._from_dims(self.value + other.value, self.row_dims, self.col_dims)
+
+    def __sub__(self, other: QuantityMatrix) -> QuantityMatrix:
+        if not isinstance(other, QuantityMatrix):
+            return NotImplemented
+        self._same_units(other)
+        return QuantityMatrix._from_dims(self.value - other.value, self.row_dims, self.col_dims)
+
+    def __neg__(self) -> QuantityMatrix:
+        return QuantityMatrix._from_dims(-self.value, self.row_dims, self.col_dims)
+
+    def __pos__(self) -> QuantityMatrix:
+        return self
+
+    def __mul__(self, other: Unit | Quantity | float) -> QuantityMatrix:
+        """Scale every element by a scalar `Quantity`, `Unit` or number."""
+        if isinstance(other, QuantityMatrix) or (isinstance(other, Quantity) and np.ndim(other.value) != 0):
+            return NotImplemented
+        scale, dims = _scale_and_dims(other)
+        return QuantityMatrix._from_dims(self.value * scale, _widen(self.row_dims) + dims, self.col_dims)
+
+    def __rmul__(self, other: Unit | Quantity | float) -> QuantityMatrix:
+        return self * other
+
+    def __truediv__(self, other: Unit | Quantity | float) -> QuantityMatrix:
+        if isinstance(other, QuantityMatrix) or (isinstance(other, Quantity) and np.ndim(other.value) != 0):
+            return NotImplemented
+        scale, dims = _scale_and_dims(other)
+        return QuantityMatrix._from_dims(self.value / scale, _widen(self.row_dims) - dims, self.col_dims)
+
+    def __matmul__(self, other: QuantityMatrix | np.ndarray) -> QuantityMatrix | Quantity | Any:
+        """Multiply matrices and vectors, like `np.matmul`.
+
+        Every term of each element of the product must have the same unit, i.e. the dimensions of this matrix's columns
+        plus those of `other`'s rows must all be equal. A plain array is treated as dimensionless.
+        """
+        if isinstance(other, np.ndarray):
+            other = _dimensionless(other, other.ndim == 1)
+        if not isinstance(other, QuantityMatrix):
+            return NotImplemented
+        inner = self.row_dims if self.is_vector else self.col_dims
+        offset = _common_offset(inner, other.row_dims, 'matrix product')
+        # vectors are given explicit row or column axes, so that stacks of vectors aren't mistaken for matrices
+        if self.is_vector and other.is_vector:
+            return (self.value[..., None, :] @ other.value[..., :, None])[..., 0, 0] * _unit_of(offset)
+        if self.is_vector:
+            value = (self.value[..., None, :] @ other.value)[..., 0, :]
+            return QuantityMatrix._from_dims(value, _widen(other.col_dims) + offset, None)
+        if other.is_vector:
+            value = (self.value @ other.value[..., :, None])[..., :, 0]
+            return QuantityMatrix._from_dims(value, _widen(self.row_dims) + offset, None)
+        return QuantityMatrix._from_dims(self.value @ other.value, _widen(self.row_dims) + offset, other.col_dims)
+
+    def __rmatmul__(self, other: np.ndarray) -> QuantityMatrix | Quantity | Any:
+        if isinstance(other, np.ndarray):
+            return _dimensionless(other, other.ndim == 1) @ self
+        return NotImplemented
+
+    def __array__(self, dtype: np.dtype | None=None, copy: bool | None=None) -> np.ndarray:
+        """The elements in coherent SI units."""
+        if copy is False and dtype is not None and np.dtype(dtype) != self.value.dtype:
+            raise ValueError("Unable to avoid a copy while converting the dtype of a QuantityMatrix")
+        return np.array(self.value, dtype=dtype, copy=copy)
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func in _HANDLED_FUNCTIONS:
+            return _HANDLED_FUNCTIONS[func](*args, **kwargs)
+        return NotImplemented
+
+    __array_ufunc__ = None
+
+    def __str__(self) -> str:
+        rows = ', '.join(map(_symbol, self.row_dims))
+        if self.is_vector:
+            return f'{self.value} rows=[{rows}]'
+        return f'{self.value} rows=[{rows}] cols=[{", ".join(map(_symbol, self.col_dims))}]'
+
+    def __repr__(self) -> str:
+        rows = ', '.join(map(_symbol, self.row_dims))
+        cols = '' if self.is_vector else f', cols=[{", ".join(map(_symbol, self.col_dims))}]'
+        return f'{self.__class__.__name__}({self.value}, rows=[{rows}]{cols})'
+
+
+def _dimensionless(value: np.ndarray, vector: bool) -> QuantityMatrix:
+    zeros = lambda n: np.zeros((n, len(Dim)), dtype=np.int64)
+    if vector:
+        return QuantityMatrix._from_dims(value, zeros(value.shape[-1]), None)
+    return QuantityMatrix._from_dims(value, zeros(value.shape[-2]), zeros(value.shape[-1]))
+
+
+def inv(a: QuantityMatrix) -> QuantityMatrix:
+    """Invert a square matrix (or each matrix in a stack). The inverse has the inverse units of the transpose."""
+    if a.is_vector:
+        raise exc.InvalidOperationError("Cannot invert a vector")
+    return QuantityMatrix._from_dims(np.linalg.inv(a.value), -_widen(a.col_dims), -_widen(a.row_dims))
+
+
+def solve(a: QuantityMatrix, b: QuantityMatrix) -> QuantityMatrix:
+    """Solve `a @ x == b` for `x`, like `np.linalg.solve`.
+
+    Each row of `b` must have the unit of the corresponding row of `a` times a common unit. `b` may be a vector (or a
+    stack of vectors) or a matrix; a stack of matrices `a` may be solved against a stack of vectors.
+    """
+    if a.is_vector:
+        raise exc.InvalidOperationError("The coefficients of a linear system must be a matrix")
+    # x's row dimensions `r` satisfy a.row_dims[i] + a.col_dims[j] + r[j] == b.row_dims[i] for every i and j
+    offset = _common_offset(_widen(b.row_dims), -_widen(a.row_dims), 'linear system')
+    if b.is_vector:
+        value = np.linalg.solve(a.value, b.value[..., None])[..., 0]
+    else:
+        value = np.linalg.solve(a.value, b.value)
+    return QuantityMatrix._from_dims(value, offset - _widen(a.col_dims), b.col_dims)
+
+
+_HANDLED_FUNCTIONS = {
+    np.linalg.inv: inv,
+    np.linalg.solve: solve,
+    np.transpose: lambda a: a.T,
+}
@@ -5,20 +5,79 @@
 
 from __future__ import annotations
 from copy import deepcopy, copy
+import operator
+import sys
 from typing import Any, TYPE_CHECKING, Sequence
 from numbers import Number
 
 import numpy as np
-from numpy.typing import ArrayLike
+from numpy.typing import ArrayLike, DTypeLike
 from uncertainties.core import AffineScalarFunc
 
 from qntpy.core.defs import Unit
 from qntpy.core import defs
 from qntpy.util import exceptions as exc
+from qntpy.compat import chunked, uncertainties
+from qntpy.util import profiling
+from qntpy.rep import rep
 from qntpy.compat.numpy import HANDLED_FUNCTIONS, PASSTHROUGH_FUNCTIONS, PASSTHROUGH_W_UNIT_FUNCTIONS
 
 if TYPE_CHECKING:
     from qntpy.core.unit import Unit
+    from qntpy.rep.convention import UnitSystem
+
+_COMPARISON_OPERATORS = {
+    np.equal: operator.eq,
+    np.not_equal: operator.ne,
+    np.greater: operator.gt,
+    np.greater_equal: operator.ge,
+    np.less: operator.lt,
+    np.less_equal: operator.le,
+}
+_REFLECTED_COMPARISONS = {
+    np.equal: np.equal,
+    np.not_equal: np.not_equal,
+    np.greater: np.less,
+    np.greater_equal: np.less_equal,
+    np.less: np.greater,
+    np.less_equal: np.greater_equal,
+}
+
+_INPLACE_UFUNCS = {
+    operator.add: np.add,
+    operator.sub: np.subtract,
+    operator.mul: np.multiply,
+    operator.truediv: np.true_divide,
+    operator.floordiv: np.floor_divide,
+}
+
+DTYPE_POLICY: str = 'preserve'
+"""How unit conversions treat the dtype of array values.
+
+- `'preserve'`: floating-point and complex values keep their dtype, and conversion factors are applied in that
+  precision. Integer values stay integers if the conversion is exact in integers (integer factor and offset), widened
+  to `int64` if the converted range could overflow their dtype; otherwise they are promoted to `float64`.
+- `'promote'`: `numpy`'s promotion rules apply, so e.g. a `float64` factor promotes `float32` values to `float64`.
+"""
+
+def _conversion_coefficients(value: Any, factor: Any, offset: Any) -> tuple[Any, Any]:
+    """Return `factor` and `offset` as scalars of the dtype that a conversion of `value` should be computed in (see `DTYPE_POLICY`)."""
+    dtype = getattr(value, 'dtype', None)
+    if (DTYPE_POLICY != 'preserve' or dtype is None or isinstance(factor, AffineScalarFunc)
+            or isinstance(offset, AffineScalarFunc)):
+        return factor, offset
+    if dtype.kind in 'fc':
+        return dtype.type(factor), dtype.type(offset)
+    if dtype.kind in 'iu':
+        if float(factor).is_integer() and float(offset).is_integer():
+            info = np.iinfo(dtype)
+            bounds = (int(factor)*info.min + int(offset), int(factor)*info.max + int(offset))
+            if info.min <= min(bounds) and max(bounds) <= info.max:
+                return dtype.type(factor), dtype.type(offset)
+            if np.iinfo(np.int64).min <= min(bounds) and max(bounds) <= np.iinfo(np.int64).max:
+                return np.int64(factor), np.int64(offset)
+        return np.float64(factor), np.float64(offset)
+    return factor, offset
 
 
 
@@ -29,6 +88,7 @@ class Quantity(object):
     is a particular example of the quantity concerned which is used as a reference, and the number
     is the ratio of the value of the quantity to the unit." -*The International System of Units*
     """
+    __slots__ = ('_value', '_orig_unit', 'unit', 'digits', '__weakref__')
     
     @classmethod
     def get_value(cls, obj, return_none=False) -> Any:
@@ -88,7 +148,7 @@ class Quantity(object):
         
         
     
-    def __new__(cls, value: ArrayLike, unit: 'Unit' | Quantity, digits: int=0, bypass_checks=False) -> Quantity | Any:
+    def __new__(cls, value: ArrayLike, unit: 'Unit' | Quantity, digits: int=0, bypass_checks=False, **kwargs) -> Quantity | Any:
         if bypass_checks:
             return super().__new__(cls)
         # no bypass_checks
@@ -99,11 +159,11 @@ class Quantity(object):
         # a Unit or n-dimensional value
         
         if isinstance(unit, Quantity):
-            value *= unit.value
+            value = value * unit.value
             unit = unit.unit
         # a Unit or n-dimensional unit and a Unit or n-dimensional value
         
-        if np.array_equal(value, 1):
+        if np.ndim(value) == 0 and np.array_equal(value, 1):
             if hasattr(unit, 'offset') and unit.offset != 0:
                 return super().__new__(cls)
             else:
@@ -118,43 +178,141 @@ class Quantity(object):
         else:   
             return value * unit       
     
-    def __init__(self, value: ArrayLike | Quantity | AffineScalarFunc | Number | np.number, unit: 'Unit' | Quantity, digits: int=0, **kwargs) -> Quantity:
+    def __init__(self, value: ArrayLike | Quantity | AffineScalarFunc | Number | np.number, unit: 'Unit' | Quantity, digits: int=0, lazy: bool=False, dtype: DTypeLike | None=None, **kwargs) -> Quantity:
         """Create a new `Quantity` object, and return it.
         
         A quantity is a `Unit` with an associated value. This value can be a numpy array,
         
+        By default, the value is converted to coherent SI units on construction. If `lazy` is `True` and `unit`
+        is not coherent (e.g. `mm` or `degF`), the value is instead stored as given, and the conversion is deferred
+        until `value` is first accessed. Until then, multiplication, division and addition of like units operate on
+        the stored values and fold the conversion factors together, and the quantity is printed in its original unit.
+        
+        Array values keep their dtype through the conversion as described by `DTYPE_POLICY`; e.g. `float32` values are
+        converted in single precision. If `dtype` is given, the value is first cast to it.
         """
+        if profiling.ENABLED:
+            profiling.record(profiling.QUANTITY_NEW)
+        if dtype is not None:
+            value = np.asarray(value, dtype=dtype)
         self.value = 1
         self.unit: 'Unit'=None
-        if type(unit) == Quantity:
-            value *= unit.value
+        if isinstance(unit, Quantity):
+            # e.g. `psi`, a quantity of `Pa`
+            value = value * unit.value
             unit = unit.unit
-        else:
-            try:
-                self.unit = unit.copy()
-                self.value = value*self.unit.factor+self.unit.offset
-                self.unit.factor = 1
-                self.unit.offset = 0
-            except AttributeError:
-                self.unit = None
+        try:
+            self.unit = unit.copy()
+            if lazy and (unit.factor != 1 or unit.offset != 0):
+                self._value = value
+                self._orig_unit = unit.copy()
+            else:
+                self.value = Quantity._to_coherent(value, self.unit.factor, self.unit.offset)
+            if self.unit.factor != 1 or self.unit.offset != 0:
+                # the original symbol and prefix no longer describe the coherent unit
+                self.unit._symbol = None
+                self.unit.prefix = 0
+            self.unit.factor = 1
+            self.unit.offset = 0
+        except AttributeError:
+            self.unit = None
         self.digits = digits
-        if type(value) == Quantity:
+        if isinstance(value, Quantity):
             self.value = value.value
             self.unit = value.unit * unit
 
+    @property
+    def value(self) -> Any:
+        """The numerical value of this quantity, in coherent SI units."""
+        if self._orig_unit is not None:
+            self._value = Quantity._to_coherent(self._value, self._orig_unit.factor, self._orig_unit.offset)
+            self._orig_unit = None
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        if uncertainties.THRESHOLD is not None:
+            value = uncertainties.maybe_compact(value)
+        self._value = value
+        self._orig_unit = None
+
+    def compact(self) -> Quantity:
+        """Flatten the uncertainty of this quantity's value onto the independent variables it depends on, and return this quantity.
+        
+        See `qntpy.compat.uncertainties`.
+        """
+        uncertainties.compact(self._value)
+        return self
+
+    def is_deferred(self) -> bool:
+        """Return whether this quantity's value is still stored in a non-coherent unit (see `Quantity.__init__`)."""
+        return self._orig_unit is not None
+
+    def _deferred(self) -> tuple[Any, Unit]:
+        """Return the stored value and the unit it is expressed in, without applying any pending conversion."""
+        if self._orig_unit is None:
+            return self._value, self.unit
+        return self._value, self._orig_unit
+
+    def _is_linear(self) -> bool:
+        """Return whether this quantity's stored value can be scaled without converting it first."""
+        return self._orig_unit is None or self._orig_unit.offset == 0
+
+    def value_in(self, unit: Unit) -> Any:
+        """Return the value of this quantity expressed in `unit`.
+        
+        If this quantity's value is deferred and stored in `unit` already, it is returned without any conversion.
+        """
+        if profiling.ENABLED:
+            profiling.record(profiling.COMMENSURABILITY_CHECK)
+        if self.unit.vec != unit.vec:
+            raise exc.IncommensurableError(f"Incompatible units: {str(self.unit)} and {str(unit)}!")
+        if self._orig_unit is not None and self._orig_unit == unit:
+            return self._value
+        if profiling.ENABLED:
+            profiling.record(profiling.CONVERSION)
+        value = self.value
+        factor, offset = _conversion_coefficients(value, unit.factor, unit.offset)
+        if isinstance(factor, np.integer):
+            # dividing integers always produces floats
+            factor, offset = np.float64(factor), np.float64(offset)
+        if offset == 0:
+            return chunked.evaluate(operator.truediv, value, factor)
+        return chunked.evaluate(lambda v: (v-offset)/factor, value)
+
+    @staticmethod
+    def _to_coherent(value: Any, factor: float | AffineScalarFunc, offset: float | AffineScalarFunc) -> Any:
+        """Return `value*factor + offset`, the value expressed in coherent SI units.
+        
+        Values already in coherent units are returned as-is rather than copied, and out-of-core values are
+        converted chunk by chunk (see `qntpy.compat.chunked`).
+        """
+        if factor == 1 and offset == 0:
+            return value
+        if profiling.ENABLED:
+            profiling.record(profiling.CONVERSION)
+        factor, offset = _conversion_coefficients(value, factor, offset)
+        if chunked.is_out_of_core(value):
+            return chunked.apply(lambda v: v*factor+offset, value)
+        return value*factor+offset
+
     def __quantity__(self):
         return self
 
     def __add__(self, other):
         if type(other) == Unit:
             return self + Quantity(1, other)
-        elif type(other) == Quantity:
-            if not other.unit == self.unit and other.value != 0 and self.value != 0:
+        elif isinstance(other, Quantity):
+            if self.is_deferred() and other.is_deferred() and self._orig_unit == other._orig_unit and self._is_linear():
+                return Quantity(chunked.evaluate(operator.add, self._value, other._value), self._orig_unit, self.digits, lazy=True)
+            if profiling.ENABLED:
+                profiling.record(profiling.COMMENSURABILITY_CHECK)
+            if not other.unit == self.unit and np.any(other.value != 0) and np.any(self.value != 0):
                 raise exc.IncommensurableError(f"Incompatible units: {str(self.unit)} and {str(other.unit)}!")
-            return Quantity(self.value+other.value, self.unit)
+            return Quantity(chunked.evaluate(operator.add, self.value, other.value), self.unit)
         else:
             if other == 0:
-                return self
+                return self._detached()
             else:
                 raise exc.IncommensurableError("Incompatible units: "+str(self)+" and "+str(other))
     def __radd__(self, other):
@@ -166,28 +324,144 @@ class Quantity(object):
         return other + -self
 
     def __mul__(self, other):
-        if other == 0:
+        if getattr(other, '__array_ufunc__', False) is None:
+            # like `ndarray`, defer to types that opt out of numpy's operators (e.g. `QuantityMatrix`)
+            return NotImplemented
+        if not isinstance(other, Quantity) and np.ndim(other) == 0 and other == 0:
             return 0
         if type(other) == Unit:
             return Quantity(self.value, self.unit * other, self.digits)
-        elif type(other) == Quantity:
-            return Quantity(self.value*other.value, self.unit*other.unit)
+        elif isinstance(other, Quantity):
+            if (self.is_deferred() or other.is_deferred()) and self._is_linear() and other._is_linear():
+                (a, a_unit), (b, b_unit) = self._deferred(), other._deferred()
+                return Quantity(chunked.evaluate(operator.mul, a, b), a_unit*b_unit, lazy=True)
+            return Quantity(chunked.evaluate(operator.mul, self.value, other.value), self.unit*other.unit)
         else:
-            return Quantity(other*self.value, self.unit)
+            if self.is_deferred() and self._is_linear():
+                return Quantity(chunked.evaluate(operator.mul, other, self._value), self._orig_unit, self.digits, lazy=True)
+            return Quantity(chunked.evaluate(operator.mul, other, self.value), self.unit)
     def __rmul__(self, other):
         return self * other
     
     def __truediv__(self, other):
-        if type(other) == Quantity:
-            return Quantity(self.value/other.value, self.unit/other.unit)
+        if isinstance(other, Quantity):
+            if (self.is_deferred() or other.is_deferred()) and self._is_linear() and other._is_linear():
+                (a, a_unit), (b, b_unit) = self._deferred(), other._deferred()
+                return Quantity(chunked.evaluate(operator.truediv, a, b), a_unit/b_unit, lazy=True)
+            return Quantity(chunked.evaluate(operator.truediv, self.value, other.value), self.unit/other.unit)
+        elif isinstance(other, defs.Unit):
+            return self * other.invert()
         else:
-            try:
-                return self * other.invert()
-            except AttributeError:
-                return Quantity(self.value / other, self.unit)
+            if self.is_deferred() and self._is_linear():
+                return Quantity(chunked.evaluate(operator.truediv, self._value, other), self._orig_unit, self.digits, lazy=True)
+            return Quantity(chunked.evaluate(operator.truediv, self.value, other), self.unit)
     def __rtruediv__(self, other):
         return other / self.value / self.unit
+
+    def __floordiv__(self, other):
+        """Floor-divide the value of this quantity, in coherent SI units, by a number or a quantity."""
+        if isinstance(other, defs.Unit):
+            other = Quantity(1, other, bypass_checks=True)
+        if isinstance(other, Quantity):
+            return chunked.evaluate(operator.floordiv, self.value, other.value) * (self.unit/other.unit)
+        return Quantity(chunked.evaluate(operator.floordiv, self.value, other), self.unit)
+
+    def _detached(self) -> Quantity:
+        """Return a quantity equal to this one that doesn't share its value buffer, so in-place operators on either don't affect the other."""
+        value, unit = self._deferred()
+        if isinstance(value, np.ndarray):
+            value = value.copy()
+        return Quantity(value, unit, self.digits, lazy=self.is_deferred(), bypass_checks=True)
     
+    def _inplace(self, op, operand) -> None:
+        """Apply `op(stored_value, operand)` to this quantity's stored value, writing into its buffer if possible.
+        
+        The buffer is reused if it is a writeable `ndarray` that can hold the result without changing its shape or
+        dtype kind; otherwise (e.g. Python scalars, or `int` arrays divided in place) a new value is computed.
+        """
+        buffer = self._value
+        if (isinstance(buffer, np.ndarray) and buffer.flags.writeable
+                and np.broadcast_shapes(buffer.shape, np.shape(operand)) == buffer.shape
+                and np.can_cast(self._inplace_result_dtype(op, buffer, operand), buffer.dtype, 'same_kind')):
+            _INPLACE_UFUNCS[op](buffer, operand, out=buffer)
+        else:
+            self._value = chunked.evaluate(op, buffer, operand)
+        # the stored value is assigned directly, bypassing the `value` setter, so compact it here
+        if uncertainties.THRESHOLD is not None:
+            uncertainties.maybe_compact(self._value)
+
+    @staticmethod
+    def _inplace_result_dtype(op, buffer: np.ndarray, operand: Any) -> np.dtype:
+        """Return the dtype of `op(buffer, operand)`, e.g. `float64` for `int` arrays divided by `int`s, by applying it to empty inputs."""
+        probe = operand if np.ndim(operand) == 0 else np.asarray(operand).ravel()[:0]
+        return _INPLACE_UFUNCS[op](buffer.ravel()[:0], probe).dtype
+
+    def _iadd_or_isub(self, other, op) -> Quantity:
+        if isinstance(other, defs.Unit):
+            other = Quantity(1, other, bypass_checks=True)
+        if not isinstance(other, Quantity):
+            if other == 0:
+                return self
+            raise exc.IncommensurableError("Incompatible units: "+str(self)+" and "+str(other))
+        if profiling.ENABLED:
+            profiling.record(profiling.COMMENSURABILITY_CHECK)
+        if self.unit.vec != other.unit.vec:
+            raise exc.IncommensurableError(f"Incompatible units: {str(self.unit)} and {str(other.unit)}!")
+        if self.is_deferred() and self._is_linear():
+            # scale the operand into the stored unit instead of converting this quantity
+            self._inplace(op, other.value_in(self._orig_unit))
+        else:
+            self.value
+            self._inplace(op, other.value)
+        return self
+
+    def __iadd__(self, other):
+        """Add `other` to this quantity in place, reusing its value buffer where possible.
+        
+        Note that, like `numpy`'s in-place operators, this modifies any array that shares this quantity's buffer.
+        """
+        return self._iadd_or_isub(other, operator.add)
+
+    def __isub__(self, other):
+        return self._iadd_or_isub(other, operator.sub)
+
+    def _imul_or_idiv(self, other, op) -> Quantity | Any:
+        if isinstance(other, defs.Unit):
+            other = Quantity(1, other, bypass_checks=True)
+        if not isinstance(other, Quantity):
+            # scaling by a number leaves the unit unchanged, and a deferred conversion can stay deferred
+            if not self._is_linear():
+                self.value
+            self._inplace(op, other)
+            return self
+        self.value
+        new_unit = op(self.unit, other.unit)
+        if not isinstance(new_unit, defs.Unit):
+            # the result is dimensionless, so it can't remain a Quantity
+            return op(self.value, other.value*new_unit)
+        self._inplace(op, other.value*new_unit.factor if op is operator.mul else other.value/new_unit.factor)
+        new_unit.factor = 1
+        self.unit = new_unit
+        return self
+
+    def __imul__(self, other):
+        """Multiply this quantity by `other` in place, reusing its value buffer where possible.
+        
+        Multiplying by a number scales the value only; multiplying by a `Unit` or `Quantity` also replaces the unit.
+        """
+        return self._imul_or_idiv(other, operator.mul)
+
+    def __itruediv__(self, other):
+        return self._imul_or_idiv(other, operator.truediv)
+
+    def __ifloordiv__(self, other):
+        if isinstance(other, (defs.Unit, Quantity)):
+            return self // other
+        # flooring doesn't commute with unit conversion, so the value is converted first
+        self.value
+        self._inplace(operator.floordiv, other)
+        return self
+
     def __matmul__(self, other):
         if isinstance(other, Quantity):
             return self.value @ other.value * (self.unit * other.unit)
@@ -203,46 +477,117 @@ class Quantity(object):
         return Quantity(round(self.value, i), self.unit)
     
     def __str__(self):
-        if isinstance(self.value, np.ndarray):
-            val = self.value      
-        else:
-            if isinstance(self.value, AffineScalarFunc):
-                if self.value.std_dev == 0:
-                    val = self.value.nominal_value
-                else:
-                    val = self.value
-            else:
-                val = self.value
-            # val /= 10**self.unit.prefix
-        return str(val)+" "+self.unit.symbol
+        # a deferred value is shown in the unit it is stored in, which already sets its scale, so it isn't prefixed
+        deferred = self.is_deferred() and self._orig_unit._symbol is not None
+        value, unit = self._deferred() if deferred else (self.value, self.unit)
+        options = rep.get_display_options()
+        kind = np.asarray(value).dtype.kind
+        if (options['prefix'] is not None and kind in 'iufc') or kind == 'c':
+            from qntpy.rep.conventions import NumberSystems
+            num_rep = options['num_rep'] or NumberSystems.NIST
+            # `digits`, if set, is the number of decimal places shown
+            precision = {'precision': self.digits} if self.digits else {}
+            if options['prefix'] is None or deferred:
+                # complex values are written as `(a + bi) unit`, per the SI Brochure's rule for sums of values
+                number = rep.value_to_SI_rep(value, num_rep, **precision)
+                if kind == 'c' and np.ndim(value) == 0 and not number.startswith('('):
+                    number = f'({number})'
+                return f'{number} {unit.symbol}'
+            return rep.prefixed_rep(value, unit.symbol, num_rep, options['prefix'] == 'shared', unit.is_kg(), **precision)
+        if isinstance(value, AffineScalarFunc) and value.std_dev == 0:
+            value = value.nominal_value
+        return str(value)+" "+unit.symbol
     def __repr__(self):
         return F'{self.__class__.__name__}({str(self)})'
     def __float__(self):
-        return self.value
+        return float(self.value)
     def __int__(self):
         return int(float(self))
+    def _comparable_values(self, other) -> tuple[Any, Any]:
+        """Return the values of this quantity and `other` on a common scale, so they can be compared directly.
+        
+        `other` may be a `Quantity` or `Unit` commensurable with this quantity, or zero, which is commensurable with everything.
+        Deferred quantities stored in the same unit are compared without converting either of them.
+        """
+        if isinstance(other, defs.Unit):
+            other = Quantity(1, other, bypass_checks=True)
+        if isinstance(other, Quantity):
+            if profiling.ENABLED:
+                profiling.record(profiling.COMMENSURABILITY_CHECK)
+            if self.unit.vec != other.unit.vec:
+                raise exc.IncommensurableError(f"Incompatible units: {str(self.unit)} and {str(other.unit)}!")
+            if self.is_deferred() and other.is_deferred() and self._orig_unit == other._orig_unit:
+                return self._value, other._value
+            return self.value, other.value
+        if isinstance(other, (Number, np.number, np.ndarray)) and np.all(other == 0):
+            return self.value, other
+        raise exc.IncommensurableError("Incompatible units: "+str(self)+" and "+str(other))
+
     def __eq__(self, other):
-        if type(other) == Unit:
-            return self == Quantity(1, other)
-        elif type(other) == Quantity:
-            return other.value == self.value and other.unit == self.unit
-        else:
+        try:
+            a, b = self._comparable_values(other)
+        except exc.IncommensurableError:
             return False
+        return a == b
+    def __ne__(self, other):
+        try:
+            a, b = self._comparable_values(other)
+        except exc.IncommensurableError:
+            return True
+        return a != b
+    def __hash__(self):
+        """Equal scalar quantities have equal hashes, whatever unit they were given in: the hash combines the key of the
+        dimension with the value in coherent SI units. A zero quantity equals the number `0`, so it hashes like it.
+        Array-valued quantities aren't hashable.
+
+        In-place operators change the hash, so a quantity shouldn't be modified while it is used as a key.
+        """
+        value = self.value
+        if np.ndim(value) != 0:
+            raise TypeError("unhashable type: array-valued 'Quantity'")
+        if value == 0:
+            return hash(0)
+        return hash((self.unit.vec.key, value))
     def __gt__(self, other):
-        return (self - other).value > 0
+        a, b = self._comparable_values(other)
+        return a > b
     def __lt__(self, other):
-        return (self - other).value < 0
+        a, b = self._comparable_values(other)
+        return a < b
     def __ge__(self, other):
-        return (self - other).value >= 0
+        a, b = self._comparable_values(other)
+        return a >= b
     def __le__(self, other):
-        return (self - other).value <= 0
+        a, b = self._comparable_values(other)
+        return a <= b
     
     def __neg__(self):
         return -1*self
     def __pos__(self):
-        return self
+        return self._detached()
+    def __abs__(self):
+        return Quantity(np.abs(self.value), self.unit, self.digits)
+
+    @property
+    def real(self) -> Quantity:
+        """The real part of this quantity, in its unit."""
+        return Quantity(np.real(self.value), self.unit, self.digits)
+
+    @property
+    def imag(self) -> Quantity:
+        """The imaginary part of this quantity, in its unit."""
+        return Quantity(np.imag(self.value), self.unit, self.digits)
+
+    def conjugate(self) -> Quantity:
+        """Return the complex conjugate of this quantity."""
+        return Quantity(np.conjugate(self.value), self.unit, self.digits)
+    conj = conjugate
+
+    def angle(self, deg: bool=False) -> np.ndarray | np.floating:
+        """Return the phase of this (complex) quantity, in radians or in degrees, as a plain number or array."""
+        return np.angle(self.value, deg)
     def __pow__(self, other):
-        return Quantity(self.value**other, self.unit**other)    
+        return Quantity(chunked.evaluate(operator.pow, self.value, other), self.unit**other)
     
     def is_scalar(self) -> bool:
         return np.size(self.value) == 1
@@ -251,10 +596,95 @@ class Quantity(object):
         """Returns a deep"""
         return Quantity(deepcopy(self.value), self.unit.copy(), self.digits)
     
+    def astype(self, dtype: DTypeLike, copy: bool=True) -> Quantity:
+        """Return this quantity with its value cast to `dtype`. A deferred value is cast without converting it first."""
+        value, unit = self._deferred()
+        return Quantity(np.asarray(value).astype(dtype, copy=copy), unit, self.digits, lazy=self.is_deferred(), bypass_checks=True)
+
     def with_value(self, value) -> Quantity:
         """Return a copy of this `Quantity` with its value replaced."""
         new_quantity = self.copy()
     
+    def in_system(self, system: UnitSystem) -> Quantity | Any:
+        """Return this quantity re-expressed in the units of `system`, e.g. `qntpy.constants.us.US_CUSTOMARY`.
+        
+        The result stores its value in the system's unit for this quantity's dimension (see `Quantity.__init__`'s `lazy`),
+        so it is displayed, and returned by `value_in`, in that unit without further conversion.
+        """
+        return self._in_unit(system.unit_for(self.unit.vec), system.factor(self.unit.vec))
+
+    def _in_unit(self, unit: Unit | Any, factor: float) -> Quantity | Any:
+        if not isinstance(unit, defs.Unit):
+            # dimensionless
+            return self
+        if profiling.ENABLED:
+            profiling.record(profiling.CONVERSION)
+        return Quantity(chunked.evaluate(operator.truediv, self.value, factor), unit, self.digits, lazy=True)
+
+    def __array__(self, dtype: np.dtype | None=None, copy: bool | None=None) -> np.ndarray:
+        """Return the value of this quantity, in coherent SI units, as an `ndarray` that shares its buffer.
+        
+        The unit is dropped; see `export_metadata`.
+        """
+        value = self.value
+        if copy:
+            return np.array(value, dtype=dtype, copy=True)
+        array = np.asarray(value, dtype=dtype)
+        if copy is False and isinstance(value, np.ndarray) and not np.shares_memory(array, value):
+            raise ValueError(f"Cannot export a value of dtype {value.dtype} as {array.dtype} without copying")
+        return array
+
+    if sys.version_info >= (3, 12):
+        def __buffer__(self, flags: int) -> memoryview:
+            """Expose the value's buffer via the buffer protocol, so e.g. `memoryview(q)` and `np.frombuffer(q)` work.
+            
+            Python classes can only implement the buffer protocol from Python 3.12 (PEP 688). On earlier versions, use
+            the buffer of `np.asarray(q)`, which shares this quantity's buffer.
+            """
+            return memoryview(np.asarray(self.value))
+
+    def __dlpack__(self, **kwargs) -> Any:
+        """Export the value as a DLPack capsule, without copying. Accepts the keyword arguments of `ndarray.__dlpack__`."""
+        return np.asarray(self.value).__dlpack__(**kwargs)
+
+    def __dlpack_device__(self) -> tuple[int, int]:
+        return np.asarray(self.value).__dlpack_device__()
+
+    def export_metadata(self) -> dict[str, str]:
+        """Return the metadata needed to reconstruct this quantity from an exported buffer.
+        
+        The buffer holds the value in coherent SI units; `'unit'` is the symbol of that unit, which `from_buffer`
+        accepts, and `'dimension'` is its dimension, e.g. `'L T⁻¹'`.
+        """
+        return {'unit': self.unit.symbol, 'dimension': str(self.unit.vec)}
+
+    @classmethod
+    def from_buffer(cls, obj: Any, unit: Unit | str, dtype: DTypeLike | None=None) -> Quantity:
+        """Wrap a buffer, e.g. an `ndarray`, typed `memoryview`, `bytearray` or DLPack-capable array, without copying it.
+        
+        If `unit` is not coherent, the conversion to coherent SI units is deferred (see `Quantity.__init__`'s `lazy`),
+        so the buffer is only copied if the coherent value is needed.
+        
+        Args:
+        - obj: An object supporting the buffer protocol, the array interface, or DLPack.
+        - unit: The unit of the values in `obj`, or its symbol in `qntpy.core.registry.default_registry`.
+        - dtype: The type of the values in `obj`, which is read with `np.frombuffer` if this is given. Untyped bytes
+        (`bytes`, `bytearray` or a `memoryview` of bytes) are read as `float64` by default, like `np.frombuffer` does.
+        """
+        if isinstance(unit, str):
+            from qntpy.core.registry import default_registry
+            unit = default_registry.lookup(unit)
+        elif isinstance(unit, Quantity):
+            # a scalar quantity used as a unit, e.g. `lbf = 4.448222 * N`; __init__ would scale the buffer in place
+            unit = unit.unit.derived(unit.unit, None, unit.value)
+        if dtype is not None or isinstance(obj, (bytes, bytearray)) or (isinstance(obj, memoryview) and obj.format in ('B', 'b', 'c')):
+            value = np.frombuffer(obj, dtype=np.float64 if dtype is None else dtype)
+        elif hasattr(obj, '__dlpack__') and not isinstance(obj, np.ndarray):
+            value = np.from_dlpack(obj)
+        else:
+            value = np.asarray(obj)
+        return cls(value, unit, lazy=True, bypass_checks=True)
+
     def invert(self) -> Quantity:
         return Quantity(1 / self.value, self.unit.invert(), self.digits, bypass_checks=True)
     
@@ -286,18 +716,215 @@ class Quantity(object):
             return func(*input_values, **kwargs) * self.unit
         elif func not in HANDLED_FUNCTIONS:
             return NotImplemented
-        if not all(issubclass(t, self.__class__) for t in types):
+        if not all(issubclass(t, (Quantity, np.ndarray)) for t in types):
             return NotImplemented
         return HANDLED_FUNCTIONS[func](*args, **kwargs)
 
     def __array_ufunc__(self, ufunc: function, method, *inputs, **kwargs):
+        if method == '__call__' and ufunc in _COMPARISON_OPERATORS and len(inputs) == 2 and not kwargs:
+            # e.g. `ndarray < Quantity`, which numpy dispatches here
+            a, b = inputs
+            if isinstance(a, Quantity):
+                return _COMPARISON_OPERATORS[ufunc](a, b)
+            return _COMPARISON_OPERATORS[_REFLECTED_COMPARISONS[ufunc]](b, a)
         if method == '__call__':
             new_inputs = (Quantity.get_value(i) for i in inputs)
-            units = (Quantity.get_unit_or_else(i) for i in inputs)
-            outputs = ufunc(*new_inputs, **kwargs)
-            out_unit = ufunc(*units, **kwargs)
-            return outputs * Quantity.get_unit_or_else(out_unit)
+            units = (Quantity._unit_operand(ufunc, i) for i in inputs)
+            if kwargs:
+                outputs = ufunc(*new_inputs, **kwargs)
+            else:
+                outputs = chunked.evaluate(ufunc, *new_inputs)
+            out_unit = Quantity.get_unit_or_else(ufunc(*units, **kwargs))
+            if isinstance(outputs, np.ndarray) and isinstance(out_unit, defs.Unit):
+                # `ndarray * Unit` would multiply element by element, into an object array
+                return Quantity(outputs, out_unit)
+            return outputs * out_unit
+        elif method == 'reduce' and ufunc in (np.add, np.maximum, np.minimum, np.fmax, np.fmin):
+            # these reductions leave the unit unchanged
+            value = Quantity.get_value(inputs[0])
+            if chunked.is_out_of_core(value):
+                return chunked.reduce(ufunc, value, **kwargs) * self.unit
+            return ufunc.reduce(value, **kwargs) * self.unit
+        return NotImplemented
     
+    @implements(np.sort)
+    def _sort(a: Quantity, *args, **kwargs) -> Quantity:
+        return Quantity(np.sort(a.value, *args, **kwargs), a.unit, a.digits)
+
+    @implements(np.argsort)
+    def _argsort(a: Quantity, *args, **kwargs) -> np.ndarray:
+        return np.argsort(a.value, *args, **kwargs)
+
+    @implements(np.searchsorted)
+    def _searchsorted(a: Quantity, v: Quantity | Unit, *args, **kwargs) -> np.ndarray:
+        a_value, v_value = a._comparable_values(v)
+        return np.searchsorted(a_value, v_value, *args, **kwargs)
+
+    @implements(np.digitize)
+    def _digitize(x: Quantity, bins: Quantity, *args, **kwargs) -> np.ndarray:
+        x_value, bins_value = x._comparable_values(bins)
+        return np.digitize(x_value, bins_value, *args, **kwargs)
+
+    @implements(np.isclose)
+    def _isclose(a: Quantity, b: Quantity | Unit, rtol: float=1e-05, atol: Quantity | float=1e-08, equal_nan: bool=False) -> np.ndarray | np.bool_:
+        """`atol` may be a `Quantity` commensurable with `a`, or a number, which is taken to be in coherent SI units."""
+        a_value, b_value = a._comparable_values(b)
+        if isinstance(atol, Quantity):
+            _, atol = a._comparable_values(atol)
+        return np.isclose(a_value, b_value, rtol, atol, equal_nan)
+
+    @implements(np.allclose)
+    def _allclose(a: Quantity, b: Quantity | Unit, rtol: float=1e-05, atol: Quantity | float=1e-08, equal_nan: bool=False) -> bool:
+        return bool(np.all(Quantity._isclose(a, b, rtol, atol, equal_nan)))
+
+    @implements(np.histogram)
+    def _histogram(a: Quantity, bins: int | Quantity=10, range: tuple[Quantity, Quantity] | None=None, density: bool | None=None, weights: Quantity | ArrayLike | None=None) -> tuple[Quantity | np.ndarray, Quantity]:
+        """Bin edges are returned with the unit of `a`. Counts are unitless, or have the unit of `weights`; densities have the inverse unit of `a`."""
+        if isinstance(bins, Quantity):
+            _, bins = a._comparable_values(bins)
+        if range is not None:
+            range = tuple(a._comparable_values(limit)[1] for limit in range)
+        hist, edges = np.histogram(a.value, bins, range, density, Quantity.get_value(weights))
+        hist_unit = Quantity.get_unit_or_else(weights, return_none=True)
+        if density:
+            hist_unit = a.unit.invert()
+        return (hist if hist_unit is None else Quantity(hist, hist_unit)), Quantity(edges, a.unit, a.digits)
+
+    @staticmethod
+    def _unit_operand(ufunc: np.ufunc, obj: Any) -> Unit | Any:
+        """Return what stands in for `obj` when `ufunc` is applied to the units of its inputs.
+        
+        Plain arrays are dimensionless, so they stand in as `1`, except as exponents, which must then be uniform.
+        """
+        if isinstance(obj, Quantity) or np.ndim(obj) == 0:
+            return Quantity.get_unit_or_else(obj)
+        if ufunc not in (np.power, np.float_power):
+            return 1
+        exponents = np.unique(np.asarray(obj))
+        if len(exponents) != 1:
+            raise exc.InvalidOperationError("Raising a quantity to an array of different powers would give each element a different unit")
+        return exponents[0]
+
+    @staticmethod
+    def _as_quantity(obj: Any) -> Quantity | Any:
+        """Return a `Unit` as a `Quantity` of one of it, and anything else unchanged."""
+        return Quantity(1, obj, bypass_checks=True) if isinstance(obj, defs.Unit) else obj
+
+    @staticmethod
+    def _common_values(a: Quantity | ArrayLike, b: Quantity | ArrayLike) -> tuple[Any, Any]:
+        """Return the values of `a` and `b`, which must be commensurable, in a common unit (see `_comparable_values`)."""
+        a = Quantity._as_quantity(a)
+        if isinstance(a, Quantity):
+            return a._comparable_values(b)
+        if isinstance(b, Quantity):
+            return b._comparable_values(a)[::-1]
+        return a, b
+
+    @staticmethod
+    def _unit_or_one(obj: Any) -> Unit | int:
+        """Return the unit of `obj`, or `1` if it isn't a `Quantity`, so that units of plain values drop out of products."""
+        obj = Quantity._as_quantity(obj)
+        return obj.unit if isinstance(obj, Quantity) else 1
+
+    @implements(np.interp)
+    def _interp(x: Quantity | ArrayLike, xp: Quantity | ArrayLike, fp: Quantity | ArrayLike, left: Quantity | float | None=None, right: Quantity | float | None=None, period: Quantity | float | None=None) -> Quantity | np.ndarray:
+        """`x`, `xp` and `period` must be commensurable, as must `fp`, `left` and `right`. The result has the unit of `fp`."""
+        fp = Quantity._as_quantity(fp)
+        x_value, xp_value = Quantity._common_values(x, xp)
+        if period is not None:
+            _, period = Quantity._common_values(x, period)
+        left, right = (None if bound is None else Quantity._common_values(fp, bound)[1] for bound in (left, right))
+        return np.interp(x_value, xp_value, Quantity.get_value(fp), left, right, period) * Quantity._unit_or_one(fp)
+
+    @implements(np.diff)
+    def _diff(a: Quantity, n: int=1, axis: int=-1, prepend: Quantity | ArrayLike=np._NoValue, append: Quantity | ArrayLike=np._NoValue) -> Quantity:
+        """Differences keep the unit of `a`; `prepend` and `append` must be commensurable with it."""
+        if prepend is not np._NoValue:
+            _, prepend = a._comparable_values(prepend)
+        if append is not np._NoValue:
+            _, append = a._comparable_values(append)
+        return np.diff(a.value, n, axis, prepend, append) * a.unit
+
+    @implements(np.gradient)
+    def _gradient(f: Quantity | ArrayLike, *varargs: Quantity | ArrayLike, **kwargs) -> Quantity | tuple[Quantity, ...]:
+        """Each derivative has the unit of `f` divided by the unit of the spacing or coordinates along its axis."""
+        f, varargs = Quantity._as_quantity(f), [Quantity._as_quantity(spacing) for spacing in varargs]
+        result = np.gradient(Quantity.get_value(f), *(Quantity.get_value(spacing) for spacing in varargs), **kwargs)
+        units = [Quantity._unit_or_one(f) / Quantity._unit_or_one(spacing) for spacing in varargs] or [Quantity._unit_or_one(f)]
+        if isinstance(result, np.ndarray):
+            return result * units[0]
+        return tuple(derivative * units[i if len(units) > 1 else 0] for i, derivative in enumerate(result))
+
+    @implements(np.trapezoid)
+    def _trapezoid(y: Quantity | ArrayLike, x: Quantity | ArrayLike | None=None, dx: Quantity | float=1.0, axis: int=-1) -> Quantity | Any:
+        """The integral has the unit of `y` times the unit of `x` (or of `dx`)."""
+        y, x, dx = Quantity._as_quantity(y), Quantity._as_quantity(x), Quantity._as_quantity(dx)
+        step = x if x is not None else dx
+        return np.trapezoid(Quantity.get_value(y), Quantity.get_value(x), Quantity.get_value(dx), axis) * (Quantity._unit_or_one(y) * Quantity._unit_or_one(step))
+
+    @implements(np.convolve)
+    def _convolve(a: Quantity | ArrayLike, v: Quantity | ArrayLike, mode: str='full') -> Quantity | np.ndarray:
+        a, v = Quantity._as_quantity(a), Quantity._as_quantity(v)
+        return np.convolve(Quantity.get_value(a), Quantity.get_value(v), mode) * (Quantity._unit_or_one(a) * Quantity._unit_or_one(v))
+
+    @implements(np.correlate)
+    def _correlate(a: Quantity | ArrayLike, v: Quantity | ArrayLike, mode: str='valid') -> Quantity | np.ndarray:
+        a, v = Quantity._as_quantity(a), Quantity._as_quantity(v)
+        return np.correlate(Quantity.get_value(a), Quantity.get_value(v), mode) * (Quantity._unit_or_one(a) * Quantity._unit_or_one(v))
+
+    @implements(np.polyfit)
+    def _polyfit(x: Quantity | ArrayLike, y: Quantity | ArrayLike, deg: int, rcond: float | None=None, full: bool=False, w: Quantity | ArrayLike | None=None, cov: bool=False) -> list[Quantity] | tuple:
+        """Fit a polynomial, and return its coefficients, highest power first, as a list with one `Quantity` per power.
+
+        The coefficient of `x**k` has the unit of `y` divided by the unit of `x` to the `k`. With `full`, the sum of
+        squared residuals has the unit of `y` squared. `cov` isn't supported, since its elements each have a different
+        unit.
+        """
+        if cov:
+            raise exc.InvalidOperationError("polyfit can't return the covariance of coefficients with different units")
+        x, y = Quantity._as_quantity(x), Quantity._as_quantity(y)
+        result = np.polyfit(Quantity.get_value(x), Quantity.get_value(y), deg, rcond, full, Quantity.get_value(w))
+        coefficients = result[0] if full else result
+        x_unit, y_unit = Quantity._unit_or_one(x), Quantity._unit_or_one(y)
+        power = len(coefficients) - 1
+        coefficients = [c * (y_unit / x_unit**(power - i) if power - i else y_unit) for i, c in enumerate(coefficients)]
+        if full:
+            residuals, rank, singular_values, rcond = result[1:]
+            return coefficients, residuals * y_unit**2, rank, singular_values, rcond
+        return coefficients
+
+    @implements(np.polyval)
+    def _polyval(p: Sequence[Quantity | float] | Quantity | ArrayLike, x: Quantity | ArrayLike) -> Quantity | Any:
+        """`p` holds the coefficients, highest power first, e.g. as returned by `np.polyfit`. Every term must have the
+        unit of the constant term, which is the unit of the result.
+
+        `numpy` only dispatches here if `x` (or `p` itself) is a `Quantity`; for a plain `x`, pass `p` as a `Quantity`.
+        """
+        coefficients = [Quantity._as_quantity(c) for c in p] if isinstance(p, Sequence) else [p]*len(Quantity.get_value(p))
+        x = Quantity._as_quantity(x)
+        x_unit = Quantity._unit_or_one(x)
+        unit = Quantity._unit_or_one(coefficients[-1])
+        power = len(coefficients) - 1
+        for i, coefficient in enumerate(coefficients):
+            term_unit = Quantity._unit_or_one(coefficient) * x_unit**(power - i) if power - i else Quantity._unit_or_one(coefficient)
+            if getattr(term_unit, 'vec', None) != getattr(unit, 'vec', None):
+                raise exc.IncommensurableError("The terms of the polynomial don't have a common unit")
+        values = np.array([Quantity.get_value(c) for c in coefficients]) if isinstance(p, Sequence) else Quantity.get_value(p)
+        return np.polyval(values, Quantity.get_value(x)) * unit
+
+    @implements(np.real)
+    def _real(val: Quantity) -> Quantity:
+        return val.real
+
+    @implements(np.imag)
+    def _imag(val: Quantity) -> Quantity:
+        return val.imag
+
+    @implements(np.angle)
+    def _angle(z: Quantity, deg: bool=False) -> np.ndarray | np.floating:
+        """The phase is dimensionless, so it is returned as a plain number or array."""
+        return z.angle(deg)
+
     # @implements(np.stack)
     # @implements(np.vstack)
     # @implements(np.hstack)
@@ -313,4 +940,141 @@ class Quantity(object):
     # @implements(np.vsplit)
     # @implements(np.array_split)
     # @implements(np.append)
-    
\ No newline at end of file
+    
+
+_canonical_units: dict[tuple[int, str | None], Unit] = {}
+_unit_products: dict[tuple[int, int, Any], tuple[Unit, Unit, Unit | Any]] = {}
+
+def _canonical_unit(unit: Unit) -> Unit:
+    """Return the shared coherent SI unit for `unit`: the same object for every coherent unit of its dimension and symbol.
+
+    Named coherent units (e.g. `N` or `Ω`) are shared themselves; any other unit maps to an unnamed coherent unit of its
+    dimension, like the unit of a `Quantity` made from it.
+    """
+    named = unit.factor == 1 and unit.offset == 0 and unit._symbol is not None
+    key = (unit.vec.key, unit._symbol if named else None)
+    canonical = _canonical_units.get(key)
+    if canonical is None:
+        canonical = _canonical_units[key] = unit if named else defs.Unit(unit.vec)
+    return canonical
+
+def _unit_op(op: Any, a: Unit, b: Any) -> Unit | Any:
+    """Return the canonical result of `op(a, b)` for canonical units `a` and `b` (or an exponent `b`), computing it once."""
+    key = (id(a), id(b), op) if isinstance(b, defs.Unit) else (id(a), b, op)
+    cached = _unit_products.get(key)
+    if cached is None:
+        result = op(a, b)
+        # the cache holds on to its operands, so their ids can't be reused by other units
+        cached = _unit_products[key] = (a, b, _canonical_unit(result) if isinstance(result, defs.Unit) else result)
+    return cached[2]
+
+
+class ScalarQuantity(Quantity):
+    """A compact scalar `Quantity`, for programs that handle many individual quantities, e.g. in lists or dicts.
+
+    The value is a plain Python number (or an `AffineScalarFunc`) in coherent SI units, and the unit is a coherent unit
+    shared by every `ScalarQuantity` of that unit, rather than a copy per quantity. Arithmetic between scalar quantities
+    and numbers is done in pure Python, with the units of products and quotients computed once per pair of units.
+    Anything else, e.g. arithmetic with arrays, falls back to `Quantity`.
+
+    The shared unit must not be modified in place.
+    """
+    __slots__ = ()
+
+    def __new__(cls, value: Number | AffineScalarFunc, unit: Unit | Quantity, digits: int=0, **kwargs) -> ScalarQuantity:
+        return object.__new__(cls)
+
+    def __init__(self, value: Number | AffineScalarFunc, unit: Unit | Quantity, digits: int=0) -> None:
+        """Create a new scalar quantity of `value` in `unit`, which may be any `Unit` or scalar `Quantity`."""
+        if profiling.ENABLED:
+            profiling.record(profiling.QUANTITY_NEW)
+        if isinstance(value, np.generic):
+            value = value.item()
+        if np.ndim(value) != 0:
+            raise ValueError(f"The value of a ScalarQuantity must be a scalar, not {value!r}")
+        if isinstance(unit, Quantity):
+            value = value * unit.value
+            unit = unit.unit
+        if unit.factor != 1 or unit.offset != 0:
+            value = value * unit.factor + unit.offset
+        self.value = value
+        self.unit = _canonical_unit(unit)
+        self.digits = digits
+
+    @classmethod
+    def _make(cls, value: Any, unit: Unit | Any, digits: int=0) -> ScalarQuantity | Any:
+        """Create a scalar quantity from a value in coherent SI units and a canonical unit, or return a dimensionless value."""
+        if not isinstance(unit, defs.Unit):
+            return value * unit
+        if profiling.ENABLED:
+            profiling.record(profiling.QUANTITY_NEW)
+        new = object.__new__(cls)
+        if uncertainties.THRESHOLD is not None:
+            value = uncertainties.maybe_compact(value)
+        new._value, new._orig_unit, new.unit, new.digits = value, None, unit, digits
+        return new
+
+    @staticmethod
+    def _is_number(other: Any) -> bool:
+        return isinstance(other, (int, float, complex, AffineScalarFunc)) and not isinstance(other, bool)
+
+    def __add__(self, other):
+        if isinstance(other, ScalarQuantity):
+            if other.unit is not self.unit and other.unit.vec.key != self.unit.vec.key and other._value != 0 and self._value != 0:
+                raise exc.IncommensurableError(f"Incompatible units: {str(self.unit)} and {str(other.unit)}!")
+            return ScalarQuantity._make(self._value + other._value, self.unit, self.digits)
+        return super().__add__(other)
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, ScalarQuantity):
+            return self + ScalarQuantity._make(-other._value, other.unit, other.digits)
+        return super().__sub__(other)
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        if isinstance(other, ScalarQuantity):
+            return ScalarQuantity._make(self._value * other._value, _unit_op(operator.mul, self.unit, other.unit))
+        if ScalarQuantity._is_number(other):
+            if other == 0:
+                return 0
+            return ScalarQuantity._make(self._value * other, self.unit, self.digits)
+        return super().__mul__(other)
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __truediv__(self, other):
+        if isinstance(other, ScalarQuantity):
+            return ScalarQuantity._make(self._value / other._value, _unit_op(operator.truediv, self.unit, other.unit))
+        if ScalarQuantity._is_number(other):
+            return ScalarQuantity._make(self._value / other, self.unit, self.digits)
+        return super().__truediv__(other)
+
+    def __rtruediv__(self, other):
+        if ScalarQuantity._is_number(other):
+            return ScalarQuantity._make(other / self._value, _unit_op(operator.pow, self.unit, -1))
+        return super().__rtruediv__(other)
+
+    def __pow__(self, other):
+        if isinstance(other, int) and other != 0:
+            return ScalarQuantity._make(self._value ** other, _unit_op(operator.pow, self.unit, other))
+        return super().__pow__(other)
+
+    def __neg__(self):
+        return ScalarQuantity._make(-self._value, self.unit, self.digits)
+
+    def __abs__(self):
+        return ScalarQuantity._make(abs(self._value), self.unit, self.digits)
+
+    def _detached(self) -> ScalarQuantity:
+        # the value is immutable, so it can be shared
+        return self
+
+    # Python numbers are immutable, so in-place operators rebind the name instead
+    __iadd__ = __add__
+    __isub__ = __sub__
+    __imul__ = __mul__
+    __itruediv__ = __truediv__
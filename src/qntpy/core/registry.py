@@ -0,0 +1,141 @@
+"""A registry of units, indexed by dimension and by symbol.
+
+Each unit is filed under the packed integer key of its dimension vector (`DimVec.key`), so finding every known unit
+of a dimension, or checking whether two units are commensurable, is a single `dict` lookup rather than a scan that
+compares `DimVec`s. The registry also maps symbols and names back to units.
+
+The unit modules (`qntpy.core.units`, `qntpy.constants.us` and `qntpy.info.information`) add their units to
+`default_registry` when they are imported. Prefixed forms of their units (e.g. `units.kN` or `information.Gbit`) are
+created on first access by the modules' `__getattr__` (see `prefixed_getattr`) and registered then.
+"""
+
+from __future__ import annotations
+
+from numbers import Real
+from typing import Any, Callable, Iterable
+
+from qntpy.core.dimension import DimVec
+from qntpy.core.quantity import Quantity
+from qntpy.core.unit import Unit
+from qntpy.rep import rep
+
+
+def _vec(obj: DimVec | Unit | Quantity) -> DimVec:
+    if isinstance(obj, DimVec):
+        return obj
+    if isinstance(obj, Quantity):
+        return obj.unit.vec
+    return obj.vec
+
+
+class UnitRegistry:
+    """Units indexed by the key of their dimension vector, and by symbol."""
+    def __init__(self, units: Iterable[Unit]=()) -> None:
+        self._by_key: dict[int, list[Unit]] = {}
+        self._by_symbol: dict[str, Unit] = {}
+        for unit in units:
+            self.register(unit)
+
+    def register(self, unit: Unit, *names: str) -> None:
+        """Add `unit` to the registry, under its symbol (if it has an explicit one) and any further `names`.
+        
+        Symbols and names that are already registered keep referring to the unit first registered under them.
+        """
+        units = self._by_key.setdefault(unit.vec.key, [])
+        if not any(registered is unit for registered in units):
+            units.append(unit)
+        if unit._symbol is not None:
+            self._by_symbol.setdefault(unit.symbol, unit)
+        for name in names:
+            self._by_symbol.setdefault(name, unit)
+
+    def register_module(self, namespace: dict[str, Any]) -> None:
+        """Register every public `Unit` in `namespace` (e.g. a module's `globals()`) under its variable name.
+        
+        Quantities with a real scalar value, such as `lbf = 4.448222 * N`, are registered as units too.
+        """
+        for name, obj in list(namespace.items()):
+            if name.startswith('_'):
+                continue
+            if isinstance(obj, Quantity) and isinstance(obj.value, Real):
+                obj = Unit.derived(obj.unit, name, obj.value)
+            if isinstance(obj, Unit):
+                self.register(obj, name)
+
+    def units_for(self, dim: DimVec | Unit | Quantity) -> tuple[Unit, ...]:
+        """Return every registered unit with the dimension of `dim`, in the order they were registered."""
+        return tuple(self._by_key.get(_vec(dim).key, ()))
+
+    def lookup(self, symbol: str) -> Unit:
+        """Return the unit registered under `symbol`. Raises `KeyError` if there is none."""
+        return self._by_symbol[symbol]
+
+    def commensurable(self, a: DimVec | Unit | Quantity, b: DimVec | Unit | Quantity) -> bool:
+        """Return whether `a` and `b` have the same dimension."""
+        return _vec(a).key == _vec(b).key
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._by_symbol
+
+    def __len__(self) -> int:
+        return sum(len(units) for units in self._by_key.values())
+
+    def symbols(self) -> tuple[str, ...]:
+        """Return every registered symbol and name."""
+        return tuple(self._by_symbol)
+
+
+default_registry = UnitRegistry()
+"""The registry that the unit modules add their units to."""
+
+
+# (abbreviation, exponent) of every SI prefix, longest abbreviations first so that e.g. `dam` is `da` + `m`.
+# `u` is accepted as an ASCII spelling of `μ`.
+_prefixes = sorted([entry for entry in rep._prefices.values() if isinstance(entry, tuple) and entry[0]] + [('u', -6)],
+                   key=lambda entry: -len(entry[0]))
+
+def _as_unit(obj: Any, name: str) -> Unit | None:
+    if isinstance(obj, Quantity) and isinstance(obj.value, Real):
+        return Unit.derived(obj.unit, name, obj.value)
+    return obj if isinstance(obj, Unit) else None
+
+def resolve_prefixed(name: str, namespace: dict[str, Any], bases: Iterable[str] | None=None, exclude: Iterable[str]=()) -> Unit | None:
+    """Return the unit named by `name`, an SI prefix followed by the name of a unit in `namespace`, or `None` if there is none.
+    
+    The mass prefixes attach to `g`, which is resolved from the namespace's `kg`; `g` on its own is the gram.
+    
+    Args:
+    - name: e.g. `'kN'`, `'MPa'`, `'mg'` or `'uA'`.
+    - namespace: e.g. a module's `globals()`.
+    - bases: The names in `namespace` that may be prefixed. Defaults to every public unit.
+    - exclude: Names that may not be prefixed, even if they are in `bases`.
+    """
+    for abbrev, exponent in _prefixes + [('', 0)]:
+        if not name.startswith(abbrev):
+            continue
+        base_name = name[len(abbrev):]
+        if base_name == 'g' and 'kg' in namespace and (bases is None or 'kg' in bases):
+            base_name, exponent = 'kg', exponent - 3
+        elif not abbrev or base_name.startswith('_') or base_name in exclude or (bases is not None and base_name not in bases):
+            continue
+        base = _as_unit(namespace.get(base_name), base_name)
+        if base is not None and base.prefix == 0 and base.offset == 0:
+            return base.with_prefix(exponent)
+    return None
+
+def prefixed_getattr(namespace: dict[str, Any], bases: Iterable[str] | None=None, exclude: Iterable[str]=(),
+                     registry: UnitRegistry=default_registry) -> Callable[[str], Unit]:
+    """Return a module-level `__getattr__` that creates prefixed units (see `resolve_prefixed`) on first access.
+    
+    Each unit is created once: it is stored in `namespace`, so later accesses find it directly, and registered in `registry`.
+    """
+    bases = None if bases is None else frozenset(bases)
+    exclude = frozenset(exclude)
+    def __getattr__(name: str) -> Unit:
+        unit = resolve_prefixed(name, namespace, bases, exclude)
+        if unit is None:
+            raise AttributeError(f"module {namespace['__name__']!r} has no attribute {name!r}")
+        namespace[name] = unit
+        registry.register(unit, name)
+        return unit
+    return __getattr__
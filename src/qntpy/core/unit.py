@@ -10,6 +10,7 @@ from qntpy.core.dimension import DimVec, Dim
 from qntpy.core.quantity import Quantity
 from qntpy.util.exceptions import InvalidUnitError, IncommensurableError
 from qntpy.rep import rep
+from qntpy.util import profiling
 
 
 class Unit:
@@ -69,14 +70,15 @@ class Unit:
         - `mol`: Amount of substance [N], equal to one mol.
         - `cd`: Luminous intensity [J], equal to one candela.
         
-        Additionally, the `qntpy.information` module defines:
+        Additionally, the `qntpy.info.information` module defines:
         - `b`: Information, equal to one bit.
         
         Additionally, the `qntpy.currency` module defines:
         - `$`: Currency, equal to one United States dollar (by default the module updates currency
         conversions once per day via an API).
         
-        However, the module supports user-defined base units that can be added to the vector.
+        These are real dimensions, added to the vector with `Dim.register`. The module supports other user-defined
+        base dimensions in the same way; their base units should be passed to `qntpy.rep.simplify.add_base_unit`.
         
         ---
         The new unit has the symbol `symbol`, and is equal to the linear combination of base units defined
@@ -92,6 +94,8 @@ class Unit:
         - factor: One of the new unit is equal to `factor` + `offset` * `base_unit`.
         - offset: 0 * the new unit = `offset` * `base_unit`.
         """
+        if profiling.ENABLED:
+            profiling.record(profiling.UNIT_NEW)
         self.vec: DimVec = vec.copy()
         self._symbol: str = symbol
         self.factor = factor
@@ -100,18 +104,21 @@ class Unit:
 
     @property
     def symbol(self):
-        if self.is_kg():
+        is_kg = self.is_kg() and self._symbol in (None, 'g')
+        if is_kg:
             self._symbol = 'g'
+        if profiling.ENABLED:
+            profiling.record(profiling.cache_miss('symbol') if self._symbol is None else profiling.cache_hit('symbol'))
         if self._symbol is None:
             from qntpy.rep.simplify import simplify
             self._symbol = simplify(self)
-        if rep.exponent_to_abbrev(self.prefix, self.is_kg()) == '':
+        if rep.exponent_to_abbrev(self.prefix, is_kg) == '':
             return self._symbol
         else:
-            if len(self._symbol) <= 1:
-                return f'{rep.exponent_to_abbrev(self.prefix, self.is_kg())}{self._symbol}'
+            if len(self._symbol) <= 1 or rep.is_prefixable(self._symbol):
+                return f'{rep.exponent_to_abbrev(self.prefix, is_kg)}{self._symbol}'
             else:
-                return f'{rep.exponent_to_abbrev(self.prefix, self.is_kg())}({self._symbol})'
+                return f'{rep.exponent_to_abbrev(self.prefix, is_kg)}({self._symbol})'
     
     @symbol.setter
     def _set_symbol(self):
@@ -166,11 +173,15 @@ class Unit:
 
     def __mul__(self, other: Any) -> Unit | Quantity:
         from qntpy.core.quantity import Quantity
+        if getattr(other, '__array_ufunc__', False) is None:
+            return NotImplemented
         if type(other) != Unit:
             try:
                 return Quantity(other, self)
             except ValueError:
                 raise ArithmeticError(f"Cannot multiply instance of Unit with instance of class {type(other)}!")
+        if profiling.ENABLED:
+            profiling.record(profiling.UNIT_OP)
         selfs = self.vec.copy()
         others = other.vec.copy()
         for k in others:
@@ -185,6 +196,8 @@ class Unit:
     def __pow__(self, other: int) -> Unit:
         if other == 1:
             return self
+        if profiling.ENABLED:
+            profiling.record(profiling.UNIT_OP)
         unit = self.copy()
         for i in unit.vec:
             new_power = unit.vec[i]*other
@@ -202,13 +215,18 @@ class Unit:
         return self
     def __abs__(self) -> Unit:
         return self
+    def conjugate(self) -> Unit:
+        """Units are real, so this returns the unit itself. This lets `np.conjugate` find the unit of its result."""
+        return self
     
     def __truediv__(self, other: Any) -> Any:
         from qntpy.core.quantity import Quantity
-        if type(other) == Quantity:
+        if isinstance(other, Quantity):
             return self.__quantity__()/other
         elif type(other) != Unit:
             return Quantity(1/other, self)
+        if profiling.ENABLED:
+            profiling.record(profiling.UNIT_OP)
         new_vec = self.vec - other.vec
         return Unit(vec=new_vec, symbol=None, factor=self.factor/other.factor, prefix=self.prefix - other.prefix)
     def __rtruediv__(self, other: Any) -> Unit | Quantity:
@@ -259,6 +277,8 @@ class Unit:
         
         This method should always return the multiplicative inverse of the object it is called on.
         """
+        if profiling.ENABLED:
+            profiling.record(profiling.UNIT_OP)
         new_dimvec = -self.vec
         new_factor = 1 / self.factor
         new_prefix = -self.prefix
@@ -3,6 +3,7 @@ from numpy import pi
 from qntpy.core.unit import Unit
 from qntpy.core.dimension import Dim, DimVec
 from qntpy.rep import rep
+from qntpy.rep.convention import UnitSystem
 
 # dimension vectors: base
 LENGTH = DimVec({Dim.L: 1})
@@ -23,6 +24,8 @@ mol: Unit = Unit(AMOUNT_OF_SUBSTANCE, "mol")
 cd: Unit = Unit(LUMINOUS_INTENSITY, "cd")
 base_units = (m, s, kg, A, K, mol, cd)
 
+SI = UnitSystem(m, kg, s, A, K, mol, cd)
+
 
 # unit definitions: derived
 Hz: Unit = Unit.derived(s.invert(), "Hz")
@@ -64,4 +67,7 @@ L = Unit.derived(m*m*m, 'L', 1e-3)
 t = Unit.derived(kg, 't', 1e3)
 Da = Unit.derived(kg, 'Da', 1.6605390666050e-27)
 
-degC = Unit.derived(K, '°C', 1, 273.15)
\ No newline at end of file
+degC = Unit.derived(K, '°C', 1, 273.15)
+from qntpy.core import registry as _registry
+_registry.default_registry.register_module(globals())
+__getattr__ = _registry.prefixed_getattr(globals(), exclude=('kg', 'minute', 'h', 'd', 'au', 'ha'))
@@ -1,5 +1,6 @@
 from qntpy.core.quantity import *
 from qntpy.core.dimension import Dim, DimVec
+from qntpy.rep.simplify import add_base_unit
 import requests
 import json
 from datetime import date
@@ -80,8 +81,9 @@ def add_currency(name):
         print("unsupported currency symbol \""+name+"\"!")
 
 _conversions = getRates()
-USD = Unit({"$": 1}, "USD")
-# add_base_unit(USD)
+CURRENCY = DimVec({Dim.register('CURRENCY', '¤', '$'): 1})
+USD = Unit(CURRENCY, "USD")
+add_base_unit(USD)
 
 for curr_name in _conversions['rates']:
     exec(f"{curr_name} = add_currency('{curr_name}')")
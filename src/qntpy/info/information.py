@@ -1,24 +1,32 @@
 from qntpy.core.unit import Unit
 from qntpy.core.dimension import Dim, DimVec
+from qntpy.rep.simplify import add_base_unit
 
-bit = Unit(DimVec({}))# Unit({"b": 1}, "b")
-nybble = 4 * bit # Unit.derived(bit, "nybble", 4)
-byte = 8 * bit # Unit.derived(bit, "B", 8)
+INFORMATION = DimVec({Dim.register('INFORMATION', 'Inf', 'b'): 1})
 
-# add_base_unit(bit)
+bit = Unit(INFORMATION, "b")
+nybble = Unit.derived(bit, "nybble", 4)
+byte = Unit.derived(bit, "B", 8)
 
-kB = 1e3 *  byte # units.kilo(byte)
-MB = 1e6 *  byte # units.giga(byte)
-TB = 1e9 *  byte # units.tera(byte)
-PB = 1e12 * byte # Unit.derived(TB, "PB", 1000)
-EB = 1e15 * byte # Unit.derived(TB, "EB", 1000)
+add_base_unit(bit)
 
-KiB = 2**10 * byte # Unit.derived(byte,"KiB", 1024)
-MiB = 2**10 * KiB  # Unit.derived(KiB, "KiB", 1024)
-GiB = 2**10 * MiB  # Unit.derived(MiB, "GiB", 1024)
-TiB = 2**10 * GiB  # Unit.derived(GiB, "TiB", 1024)
-PiB = 2**10 * TiB  # Unit.derived(TiB, "PiB", 1024)
-EiB = 2**10 * PiB  # Unit.derived(PiB, "EiB", 1024)
+kB = Unit.derived(byte, "kB", 1e3)
+MB = Unit.derived(byte, "MB", 1e6)
+GB = Unit.derived(byte, "GB", 1e9)
+TB = Unit.derived(byte, "TB", 1e12)
+PB = Unit.derived(byte, "PB", 1e15)
+EB = Unit.derived(byte, "EB", 1e18)
+
+KiB = Unit.derived(byte, "KiB", 2**10)
+MiB = Unit.derived(KiB, "MiB", 2**10)
+GiB = Unit.derived(MiB, "GiB", 2**10)
+TiB = Unit.derived(GiB, "TiB", 2**10)
+PiB = Unit.derived(TiB, "PiB", 2**10)
+EiB = Unit.derived(PiB, "EiB", 2**10)
+
+from qntpy.core import registry as _registry
+_registry.default_registry.register_module(globals())
+__getattr__ = _registry.prefixed_getattr(globals(), bases=('bit', 'byte'))
 
 def help():
     print("data units; base unit = bit (b)")
@@ -0,0 +1,149 @@
+"""Parsing and formatting of data sizes and data rates, e.g. `"1.5 GiB"` or `"820 kB/s"`.
+
+Both directions operate on whole arrays of strings with `numpy` string operations; only the distinct unit symbols
+found in the input are looked up one by one.
+```
+>>> from qntpy.info import sizes
+>>> sizes.parse(["1.5 GiB", "820 kB", "12 Mbit"])
+Quantity([1.28849019e+10 6.56000000e+06 1.20000000e+07] b)
+>>> sizes.humanize(sizes.parse(["1536 MiB", "820000 B"]))
+array(['1.5 GiB', '820 kB'], dtype='<U7')
+```
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from qntpy.core.quantity import Quantity
+from qntpy.core.units import s
+from qntpy.info import information
+from qntpy.info.information import INFORMATION, bit
+from qntpy.util import exceptions as exc
+
+_DECIMAL_PREFIXES = ['', 'k', 'M', 'G', 'T', 'P', 'E']
+_BINARY_PREFIXES = ['', 'Ki', 'Mi', 'Gi', 'Ti', 'Pi', 'Ei']
+
+def _symbol_table() -> dict[str, float]:
+    """Map every accepted data size symbol to its size in bits.
+    
+    The sizes are taken from the byte units of `qntpy.info.information` (`B`, `kB`, `KiB`, ...), and the bit units
+    (`kb`, `Kibit`, ...) are derived from them, so the two modules can't disagree.
+    """
+    byte_size = information.byte.factor / bit.factor
+    table = {}
+    for prefix in dict.fromkeys(_DECIMAL_PREFIXES + _BINARY_PREFIXES):
+        unit = getattr(information, prefix + 'B') if prefix else information.byte
+        size = unit.factor / bit.factor
+        for name in ('B', 'byte', 'bytes'):
+            table[prefix + name] = size
+        for name in ('b', 'bit', 'bits'):
+            table[prefix + name] = size / byte_size
+        # common spellings: "KB" for kilobyte, "K" and "Ki" alone for bytes
+        if prefix in _DECIMAL_PREFIXES[1:]:
+            table[prefix.upper() + 'B'] = table[prefix.upper()] = size
+        elif prefix:
+            table[prefix] = size
+    return table
+
+_SYMBOLS = _symbol_table()
+# the size of each prefix, relative to the unprefixed unit
+_DECIMAL_SCALES = np.array([_SYMBOLS[prefix + 'B'] for prefix in _DECIMAL_PREFIXES]) / _SYMBOLS['B']
+_BINARY_SCALES = np.array([_SYMBOLS[prefix + 'B'] for prefix in _BINARY_PREFIXES]) / _SYMBOLS['B']
+_SYMBOL_CHARS = ''.join(sorted(set(''.join(_SYMBOLS)))) + '/ps '
+
+def _lookup(symbol: str) -> tuple[float, bool]:
+    """Return the size in bits of the unit `symbol`, and whether it is a rate (e.g. `"MB/s"` or `"Mbps"`)."""
+    if symbol in _SYMBOLS:
+        return _SYMBOLS[symbol], False
+    for suffix in ('/s', 'ps'):
+        if symbol.endswith(suffix) and symbol[:-len(suffix)].rstrip() in _SYMBOLS:
+            return _SYMBOLS[symbol[:-len(suffix)].rstrip()], True
+    raise exc.InvalidUnitError(f"Unknown data size unit {symbol!r}")
+
+def _is_float(string: str) -> bool:
+    try:
+        float(string)
+        return True
+    except ValueError:
+        return False
+
+def parse(strings: ArrayLike) -> Quantity:
+    """Parse an array of data sizes like `"1.5 GiB"`, or of data rates like `"820 kB/s"`, into a `Quantity` in bits.
+
+    Decimal (`kB`, `MB`, ...) and binary (`KiB`, `MiB`, ...) prefixes are accepted, with `B`/`byte` or `b`/`bit`.
+
+    Args:
+    - strings: An array (or any array-like) of strings. All of them must be sizes, or all of them must be rates.
+    """
+    strings = np.strings.strip(np.asarray(strings, dtype=str))
+    numbers = np.strings.rstrip(strings, _SYMBOL_CHARS)
+    symbols = np.strings.strip(np.strings.slice(strings, np.strings.str_len(numbers), None))
+    try:
+        values = numbers.astype(float)
+    except ValueError:
+        bad = next(string for string, number in zip(strings.flat, numbers.flat) if not _is_float(number))
+        raise ValueError(f"Cannot parse {str(bad)!r} as a data size") from None
+    unique, inverse = np.unique(symbols, return_inverse=True)
+    sizes, rates = zip(*(_lookup(str(symbol)) for symbol in unique.flat)) if unique.size else ((), ())
+    if len(set(rates)) > 1:
+        raise exc.IncommensurableError("Cannot parse a mix of data sizes and data rates")
+    unit = bit/s if any(rates) else bit
+    return Quantity(values * np.asarray(sizes, dtype=float)[inverse.reshape(values.shape)], unit, bypass_checks=True)
+
+def _round_significant(value: np.ndarray, digits: int) -> np.ndarray:
+    """Round every element of `value` to `digits` significant digits."""
+    magnitude = np.abs(np.where(value != 0, value, 1))
+    decimals = digits - 1 - np.floor(np.log10(magnitude))
+    return np.round(value * 10.0**decimals) / 10.0**decimals
+
+def humanize(quantity: Quantity, prefixes: str='auto', bits: bool=False, digits: int=3) -> np.ndarray:
+    """Format a `Quantity` of data sizes or data rates as an array of strings like `"1.5 GiB"` or `"820 kB/s"`.
+
+    Each element is scaled by its own prefix.
+
+    Args:
+    - quantity: A `Quantity` of information, or of information per time.
+    - prefixes: `'decimal'` (`kB`, `MB`, ...), `'binary'` (`KiB`, `MiB`, ...), or `'auto'`, which uses binary prefixes
+    for multiples of 1024 (e.g. 1.5 GiB) and decimal prefixes otherwise.
+    - bits: Whether to express sizes in bits (`b`) rather than bytes (`B`).
+    - digits: The number of significant digits to show. Trailing zeros are dropped.
+    """
+    if quantity.unit.vec == INFORMATION:
+        suffix = ''
+    elif quantity.unit.vec == (bit/s).vec:
+        suffix = '/s'
+    else:
+        raise exc.IncommensurableError(f"{quantity.unit} is not a data size or a data rate")
+    value = np.asarray(quantity.value, dtype=float) / (1 if bits else _SYMBOLS['B'])
+    magnitude = np.abs(value)
+    nonzero = magnitude > 0
+    # choose decimal prefixes after rounding, so that e.g. 999.9 kB is shown as 1 MB rather than 1000 kB
+    rounded = np.abs(_round_significant(np.where(nonzero, magnitude, 1), digits))
+    decimal = np.clip(np.floor(np.log10(rounded) / 3), 0, len(_DECIMAL_PREFIXES) - 1).astype(int)
+    binary = np.clip(np.floor(np.log2(np.where(nonzero, magnitude, 1)) / 10), 0, len(_BINARY_PREFIXES) - 1).astype(int)
+    if prefixes == 'binary':
+        use_binary = np.ones(value.shape, dtype=bool)
+    elif prefixes == 'decimal':
+        use_binary = np.zeros(value.shape, dtype=bool)
+    elif prefixes == 'auto':
+        use_binary = (binary > 0) & (np.mod(value, 1024) == 0)
+    else:
+        raise ValueError(f"prefixes must be 'auto', 'decimal' or 'binary', not {prefixes!r}")
+    scaled = _round_significant(np.where(use_binary, value / _BINARY_SCALES[binary], value / _DECIMAL_SCALES[decimal]), digits)
+
+    # format the digits as integers, which numpy converts to strings without a Python-level loop,
+    # then insert the decimal point and drop trailing zeros
+    decimals = max(digits - 1, 0)
+    numbers = np.round(np.abs(scaled) * 10**decimals).astype(np.int64).astype(str)
+    numbers = np.strings.zfill(numbers, decimals + 1)
+    split = np.strings.str_len(numbers) - decimals
+    int_part = np.strings.slice(numbers, 0, split)
+    frac_part = np.strings.rstrip(np.strings.slice(numbers, split, None), '0')
+    frac_part = np.where(frac_part == '', '', np.strings.add('.', frac_part))
+    numbers = np.strings.add(np.where(scaled < 0, '-', ''), np.strings.add(int_part, frac_part))
+
+    symbols = np.where(use_binary, np.asarray(_BINARY_PREFIXES)[binary], np.asarray(_DECIMAL_PREFIXES)[decimal])
+    symbols = np.strings.add(symbols, ('b' if bits else 'B') + suffix)
+    return np.strings.add(np.strings.add(numbers, ' '), symbols)
@@ -0,0 +1,321 @@
+"""Unit-tagged `pandas` columns.
+
+`QuantityDtype` is a `pandas` extension dtype parameterized by a unit, and `QuantityArray` is the matching
+extension array. A column is stored as a single `float64` array in coherent SI units, so arithmetic, comparisons and
+reductions on it check units once per column and then operate on the whole array, via `Quantity`.
+```
+>>> import pandas as pd
+>>> from qntpy import m, s
+>>> from qntpy.pandas import QuantityArray
+>>> df = pd.DataFrame({'d': QuantityArray([1., 2., 3.], m), 't': QuantityArray([2., 2., 4.], s)})
+>>> (df['d'] / df['t']).dtype
+quantity[m s⁻¹]
+```
+Columns can also be created with `dtype='quantity[m]'` for the symbol of any coherent unit in
+`qntpy.core.registry.default_registry`.
+
+This module requires `pandas`, which is not otherwise a dependency of `qntpy`.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.typing import ArrayLike
+from pandas.api.extensions import ExtensionArray, ExtensionDtype, register_extension_dtype, take
+from pandas.api.types import is_list_like
+from pandas.core.arraylike import OpsMixin
+
+from qntpy.core import defs
+from qntpy.core.quantity import Quantity
+from qntpy.core.unit import Unit
+from qntpy.core.registry import default_registry
+from qntpy.util import exceptions as exc
+
+
+def _is_coherent(unit: Unit) -> bool:
+    return unit.factor == 1 and unit.offset == 0
+
+
+@register_extension_dtype
+class QuantityDtype(ExtensionDtype):
+    """The dtype of a column of quantities that share a unit. Values are stored in the coherent SI unit.
+
+    Only coherent units are accepted, for the same reason as in `construct_from_string`. Columns in other units can be
+    created with `QuantityArray`, which converts their values.
+    """
+    type = Quantity
+    kind = 'f'
+    na_value = np.nan
+    _metadata = ('unit',)
+    _match = re.compile(r'^quantity\[(?P<symbol>.+)\]$')
+
+    def __init__(self, unit: Unit | str) -> None:
+        if isinstance(unit, str):
+            unit = default_registry.lookup(unit)
+        if not _is_coherent(unit):
+            raise exc.InvalidUnitError(f"{unit.symbol} is not a coherent SI unit; use {Quantity(np.zeros(0), unit).unit.symbol}")
+        self.unit = unit
+
+    @property
+    def name(self) -> str:
+        return f'quantity[{self.unit.symbol}]'
+
+    @property
+    def _is_numeric(self) -> bool:
+        return True
+
+    def __hash__(self) -> int:
+        return hash((self.__class__, self.unit.vec.key))
+
+    @classmethod
+    def construct_from_string(cls, string: str) -> QuantityDtype:
+        """Construct the dtype named by a string like `'quantity[m]'`.
+        
+        Only coherent units are accepted, since values are stored in coherent units: numbers in a column created
+        with `dtype='quantity[ft]'` would silently be taken as metres.
+        """
+        if not isinstance(string, str):
+            raise TypeError(f"'construct_from_string' expects a string, got {type(string)}")
+        match = cls._match.match(string)
+        unit = default_registry.lookup(match['symbol']) if match is not None and match['symbol'] in default_registry else None
+        if unit is None or not _is_coherent(unit):
+            raise TypeError(f"Cannot construct a '{cls.__name__}' from '{string}'")
+        return cls(unit)
+
+    @classmethod
+    def construct_array_type(cls) -> type[QuantityArray]:
+        return QuantityArray
+
+
+class QuantityArray(OpsMixin, ExtensionArray):
+    """A `pandas` extension array of quantities that share a unit, backed by a `float64` array in coherent SI units.
+
+    Args:
+    - values: The values, in `unit`. May also be a `Quantity`, in which case `unit` is taken from it.
+    - unit: The unit of `values`.
+    - copy: Whether to copy `values` rather than use them as the backing array, if possible.
+    """
+    __array_priority__ = 1000
+
+    def __init__(self, values: ArrayLike | Quantity, unit: Unit | None=None, copy: bool=False) -> None:
+        if isinstance(values, Quantity):
+            if unit is not None:
+                values = values.value_in(unit)
+            else:
+                values, unit = values.value, values.unit
+        if unit is None:
+            raise exc.InvalidUnitError("A QuantityArray needs a unit")
+        values = np.array(values, dtype=np.float64, copy=copy or None)
+        if values.ndim != 1:
+            raise ValueError("A QuantityArray must be 1-dimensional")
+        quantity = Quantity(values, unit)
+        self._data = quantity.value
+        self._dtype = QuantityDtype(quantity.unit)
+
+    @classmethod
+    def _from_sequence(cls, scalars: Sequence[Any], *, dtype: QuantityDtype | str | None=None, copy: bool=False) -> QuantityArray:
+        """Create an array from `Quantity` scalars, or from plain numbers (in the unit of `dtype`)."""
+        if isinstance(dtype, str):
+            dtype = QuantityDtype.construct_from_string(dtype)
+        if isinstance(scalars, QuantityArray):
+            values, unit = scalars._data, scalars.dtype.unit
+        elif isinstance(scalars, Quantity):
+            values, unit = scalars.value, scalars.unit
+        else:
+            scalars = list(scalars)
+            units = {id(scalar.unit): scalar.unit for scalar in scalars if isinstance(scalar, Quantity)}
+            units.update({id(scalar): scalar for scalar in scalars if isinstance(scalar, defs.Unit)})
+            if not units:
+                if dtype is None:
+                    raise exc.InvalidUnitError("Cannot infer the unit of a QuantityArray from plain numbers")
+                return cls(np.asarray(scalars, dtype=np.float64), dtype.unit, copy)
+            unit = next(iter(units.values()))
+            values = np.empty(len(scalars), dtype=np.float64)
+            for i, scalar in enumerate(scalars):
+                if isinstance(scalar, defs.Unit):
+                    scalar = Quantity(1, scalar, bypass_checks=True)
+                values[i] = scalar.value_in(unit) if isinstance(scalar, Quantity) else (np.nan if pd.isna(scalar) else scalar)
+        if dtype is not None and dtype.unit != unit:
+            values = Quantity(values, unit).value_in(dtype.unit)
+            unit = dtype.unit
+        return cls(values, unit, copy)
+
+    @classmethod
+    def _from_factorized(cls, values: np.ndarray, original: QuantityArray) -> QuantityArray:
+        return cls(values, original.dtype.unit)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence[QuantityArray]) -> QuantityArray:
+        unit = to_concat[0].dtype.unit
+        for array in to_concat:
+            if array.dtype.unit.vec != unit.vec:
+                raise exc.IncommensurableError(f"Cannot concatenate columns in {array.dtype.unit} and {unit}")
+        return cls(np.concatenate([array._data for array in to_concat]), unit)
+
+    @property
+    def dtype(self) -> QuantityDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, item) -> Quantity | QuantityArray:
+        result = self._data[item]
+        if np.ndim(result) == 0:
+            return Quantity(result, self.dtype.unit, bypass_checks=True) if not np.isnan(result) else self.dtype.na_value
+        return QuantityArray(result, self.dtype.unit)
+
+    def __setitem__(self, key, value) -> None:
+        if isinstance(value, QuantityArray):
+            value = value.to_quantity()
+        if isinstance(value, defs.Unit):
+            value = Quantity(1, value, bypass_checks=True)
+        if isinstance(value, Quantity):
+            value = value.value_in(self.dtype.unit)
+        elif is_list_like(value) and not isinstance(value, np.ndarray):
+            value = self._from_sequence(value, dtype=self.dtype)._data
+        self._data[key] = value
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if dtype is None or np.dtype(dtype) == object:
+            return np.array(list(self), dtype=object)
+        return np.array(self._data, dtype=dtype, copy=copy)
+
+    def to_quantity(self) -> Quantity:
+        """Return the whole column as one array-valued `Quantity`, without copying."""
+        return Quantity(self._data, self.dtype.unit)
+
+    def value_in(self, unit: Unit) -> np.ndarray:
+        """Return the values of this column expressed in `unit`."""
+        return self.to_quantity().value_in(unit)
+
+    def isna(self) -> np.ndarray:
+        return np.isnan(self._data)
+
+    def take(self, indices: Sequence[int], allow_fill: bool=False, fill_value: Any=None) -> QuantityArray:
+        if allow_fill:
+            if fill_value is None or pd.isna(fill_value):
+                fill_value = np.nan
+            elif isinstance(fill_value, Quantity):
+                fill_value = fill_value.value_in(self.dtype.unit)
+        return QuantityArray(take(self._data, indices, allow_fill=allow_fill, fill_value=fill_value), self.dtype.unit)
+
+    def copy(self) -> QuantityArray:
+        return QuantityArray(self._data.copy(), self.dtype.unit)
+
+    def _values_for_argsort(self) -> np.ndarray:
+        return self._data
+
+    def _values_for_factorize(self) -> tuple[np.ndarray, float]:
+        return self._data, np.nan
+
+    def astype(self, dtype, copy: bool=True):
+        if isinstance(dtype, QuantityDtype):
+            return QuantityArray(self.value_in(dtype.unit), dtype.unit, copy)
+        return super().astype(dtype, copy)
+
+    def _formatter(self, boxed: bool=False):
+        return lambda value: 'NaN' if not isinstance(value, Quantity) else str(value)
+
+    @staticmethod
+    def _wrap(result: Any) -> Any:
+        """Turn a `Quantity` result of an operation on the column back into a `QuantityArray`."""
+        if isinstance(result, defs.Unit):
+            return result
+        if isinstance(result, Quantity):
+            if np.ndim(result.value) == 0:
+                return result
+            return QuantityArray(result.value, result.unit)
+        return result
+
+    @staticmethod
+    def _unwrap(value: Any) -> Any:
+        """Turn operands into `Quantity` objects, so that `Quantity` does the unit checking."""
+        if isinstance(value, (pd.Series, pd.Index)):
+            value = value.array
+        if isinstance(value, QuantityArray):
+            return value.to_quantity()
+        return value
+
+    def _arith_method(self, other, op):
+        return self._wrap(op(self.to_quantity(), self._unwrap(other)))
+
+    def __neg__(self) -> QuantityArray:
+        return QuantityArray(-self._data, self.dtype.unit)
+
+    def __pos__(self) -> QuantityArray:
+        return self.copy()
+
+    def __abs__(self) -> QuantityArray:
+        return QuantityArray(np.abs(self._data), self.dtype.unit)
+
+    def _cmp_method(self, other, op):
+        result = op(self.to_quantity(), self._unwrap(other))
+        return np.broadcast_to(result, self._data.shape) if np.ndim(result) == 0 else np.asarray(result)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if any(isinstance(value, (pd.Series, pd.Index, pd.DataFrame)) for value in inputs):
+            return NotImplemented
+        inputs = [self._unwrap(value) for value in inputs]
+        return self._wrap(getattr(ufunc, method)(*inputs, **kwargs))
+
+    def __array_function__(self, func, types, args, kwargs):
+        """Dispatch `numpy` functions to `Quantity.__array_function__` (see `qntpy.compat.numpy`)."""
+        args = [[self._unwrap(arg) for arg in a] if isinstance(a, (list, tuple)) else self._unwrap(a) for a in args]
+        return self._wrap(func(*args, **kwargs))
+
+    _REDUCTIONS = {
+        'sum': np.sum,
+        'mean': np.mean,
+        'median': np.median,
+        'min': np.min,
+        'max': np.max,
+        'std': lambda values, ddof=1: np.std(values, ddof=ddof),
+        'sem': lambda values, ddof=1: np.std(values, ddof=ddof) / np.sqrt(len(values)),
+        'var': lambda values, ddof=1: np.var(values, ddof=ddof),
+    }
+    # groupby operations whose results have the unit of the column
+    _SAME_UNIT_GROUPBY_OPS = ('sum', 'mean', 'median', 'min', 'max', 'std', 'sem', 'first', 'last',
+                              'cumsum', 'cummin', 'cummax')
+
+    def _reduce(self, name: str, *, skipna: bool=True, keepdims: bool=False, **kwargs):
+        values = self._data[~self.isna()] if skipna else self._data
+        if name in ('any', 'all'):
+            return getattr(np, name)(values != 0)
+        if name not in self._REDUCTIONS:
+            raise TypeError(f"'{self.dtype}' does not support reduction '{name}'")
+        options = {'ddof': kwargs['ddof']} if name in ('std', 'sem', 'var') and 'ddof' in kwargs else {}
+        result = self._REDUCTIONS[name](values, **options) if len(values) else np.nan
+        unit = self.dtype.unit**2 if name == 'var' else self.dtype.unit
+        if keepdims:
+            return QuantityArray(np.array([result]), unit)
+        return Quantity(result, unit, bypass_checks=True)
+
+    def _quantile(self, qs: np.ndarray, interpolation: str) -> QuantityArray:
+        from pandas.core.array_algos.quantile import quantile_with_mask
+        result = quantile_with_mask(self._data, np.asarray(self.isna()), np.nan, qs, interpolation)
+        return QuantityArray(result, self.dtype.unit)
+
+    def _groupby_op(self, *, how: str, has_dropped_na: bool, min_count: int, ngroups: int, ids: np.ndarray, **kwargs):
+        result = pd.arrays.NumpyExtensionArray(self._data)._groupby_op(
+            how=how, has_dropped_na=has_dropped_na, min_count=min_count, ngroups=ngroups, ids=ids, **kwargs)
+        result = np.asarray(result)
+        if how in self._SAME_UNIT_GROUPBY_OPS:
+            return QuantityArray(result.astype(np.float64), self.dtype.unit)
+        if how == 'var':
+            return QuantityArray(result, self.dtype.unit**2)
+        if how in ('prod', 'cumprod'):
+            raise TypeError(f"'{self.dtype}' does not support groupby operation '{how}'")
+        return result
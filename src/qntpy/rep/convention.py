@@ -1,10 +1,31 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any, Iterable, TYPE_CHECKING
 
+import numpy as np
+
+from qntpy.core import defs
 from qntpy.core.defs import Unit
+from qntpy.util.exceptions import InvalidUnitError
+
+if TYPE_CHECKING:
+    from qntpy.core.dimension import Dim, DimVec
+    from qntpy.core.quantity import Quantity
+
+_SYSTEM_DIMS = ('L', 'M', 'T', 'I', 'THETA', 'N', 'J')
+"""Names of the `Dim`s of the base units of a `UnitSystem`, in field order."""
 
 @dataclass
 class UnitSystem(object):
+    """A system of units, defined by a base unit for each of the seven SI base dimensions.
+    
+    Quantities are re-expressed in a system with `Quantity.in_system`, or in bulk with `convert`. The conversion factor for
+    a dimension is the product of the base units' factors raised to the dimension's exponents, computed as a dot product of
+    the exponents with the base units' log-factors, and cached per dimension.
+    
+    Base units must be coherent with their dimension and have no offset; e.g. use `R`, not `degF`. Dimensions added with
+    `Dim.register` are expressed in the units listed in `extra_units`, or in their SI base unit if none is given.
+    """
     length: Unit
     mass: Unit
     time: Unit
@@ -12,6 +33,79 @@ class UnitSystem(object):
     thermodynamic_temperature: Unit
     amount_of_substance: Unit
     luminous_intensity: Unit
+    extra_units: tuple[Unit, ...] = ()
+    _log_factors: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+    _factors: dict[int, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _units: dict[int, Unit] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for dim, unit in self.base_units().items():
+            if unit.vec != defs.DimVec({dim: 1}) or unit.offset != 0:
+                raise InvalidUnitError(f"Unit {str(unit)} cannot be the base unit of {repr(dim)} in a unit system")
+
+    def base_units(self) -> dict[Dim, Unit]:
+        """Return the base unit of each dimension in this system."""
+        units = [self.length, self.mass, self.time, self.electric_current, self.thermodynamic_temperature,
+                 self.amount_of_substance, self.luminous_intensity]
+        base_units = {getattr(defs.Dim, name): unit for name, unit in zip(_SYSTEM_DIMS, units)}
+        for unit in self.extra_units:
+            (dim,) = unit.vec
+            base_units[dim] = unit
+        return base_units
+
+    @property
+    def log_factors(self) -> np.ndarray:
+        """The natural logarithm of the factor of each base unit, indexed by `Dim.index`."""
+        if self._log_factors is None or len(self._log_factors) != len(defs.Dim):
+            log_factors = np.zeros(len(defs.Dim))
+            for dim, unit in self.base_units().items():
+                log_factors[dim.index] = np.log(float(unit.factor))
+            log_factors.flags.writeable = False
+            self._log_factors = log_factors
+        return self._log_factors
+
+    def factor(self, vec: DimVec) -> float:
+        """Return the factor of this system's unit for the dimension `vec`, relative to coherent SI units."""
+        try:
+            return self._factors[vec.key]
+        except KeyError:
+            factor = float(np.exp(vec.exponents @ self.log_factors))
+            self._factors[vec.key] = factor
+            return factor
+
+    def factors(self, vecs: Iterable[DimVec]) -> np.ndarray:
+        """Return the factors for many dimensions at once, as a single matrix product (see `factor`)."""
+        from qntpy.core.dimension import exponent_matrix
+        return np.exp(exponent_matrix(vecs) @ self.log_factors)
+
+    def unit_for(self, vec: DimVec) -> Unit:
+        """Return this system's unit for the dimension `vec`, e.g. `ft s⁻¹` for velocity in US customary units."""
+        try:
+            return self._units[vec.key]
+        except KeyError:
+            pass
+        from qntpy.rep.rep import to_superscript
+        base_units = self.base_units()
+        symbols = [(power, base_units[dim].symbol if dim in base_units else str(dim)) for dim, power in vec.items()]
+        symbol = ' '.join(
+            symbol if power == 1 else f'{symbol}{to_superscript(power)}'
+            for power, symbol in sorted(symbols, key=lambda p: p[0], reverse=True)
+        )
+        unit = defs.Unit(vec, symbol, self.factor(vec))
+        self._units[vec.key] = unit
+        return unit
+
+    def convert(self, quantities: Iterable[Quantity]) -> list[Quantity | Any]:
+        """Re-express every quantity in `quantities` in this system (see `Quantity.in_system`).
+        
+        The conversion factors of all the quantities are computed together, in one matrix product. A bare `Unit` (such as
+        `Quantity(1., m)` collapses to) is converted as one of it; plain numbers are dimensionless and returned unchanged.
+        """
+        from qntpy.core.quantity import Quantity
+        quantities = [Quantity._as_quantity(q) for q in quantities]
+        dimensional = [q for q in quantities if isinstance(q, Quantity)]
+        factors = iter(self.factors(q.unit.vec for q in dimensional))
+        return [q._in_unit(self.unit_for(q.unit.vec), next(factors)) if isinstance(q, Quantity) else q for q in quantities]
 
 @dataclass
 class NumRep(object):
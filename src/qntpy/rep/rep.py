@@ -88,12 +88,22 @@ def prefix_to_exponent(prefix: str, is_kg: bool) -> int:
 def prefix_to_abbrev(prefix: str, is_kg: bool) -> str:
     kg_mod = 3 if is_kg else 0
     return _prefices[prefix][0]
+# Lookup tables indexed by `exponent + _MAX_EXPONENT`. Exponents without a prefix map to `None`.
+_MAX_EXPONENT = 30
+_prefix_names = tuple(name if isinstance(entry, tuple) else None for name, entry in _prefices.items())
+_prefix_abbrevs = tuple(entry[0] if isinstance(entry, tuple) else None for entry in _prefices.values())
+_abbrev_array = np.array([abbrev or '' for abbrev in _prefix_abbrevs])
+
+def _prefix_index(expnt: int, is_kg: bool) -> int:
+    index = expnt + _MAX_EXPONENT + (3 if is_kg else 0)
+    if not 0 <= index < len(_prefix_names) or _prefix_names[index] is None:
+        raise ValueError(f"There is no SI prefix for 10^{expnt}{' g' if is_kg else ''}")
+    return index
+
 def exponent_to_prefix(expnt: int, is_kg: bool) -> str:
-    kg_mod = 3 if is_kg else 0
-    return list(_prefices.keys())[expnt+30+kg_mod][1]
+    return _prefix_names[_prefix_index(expnt, is_kg)]
 def exponent_to_abbrev(expnt: int, is_kg: bool) -> str:
-    kg_mod = 3 if is_kg else 0
-    return _prefices[list(_prefices.keys())[expnt+30+kg_mod]][0]
+    return _prefix_abbrevs[_prefix_index(expnt, is_kg)]
 
 def concat_symbols(symbol_1: str, symbol_2: str, op: Op) -> str:
     match op:
@@ -106,12 +116,384 @@ def concat_symbols(symbol_1: str, symbol_2: str, op: Op) -> str:
         case Op.DIV:
             return f'{symbol_1}/{symbol_2}'
 
-def print_ndarray(value: ndarray, **kwargs) -> str:
-    raise NotImplementedError()
+def _group_digits(digits: ndarray, sep: str, from_left: bool=False, ungrouped: ndarray | int=4) -> ndarray:
+    """Divide each string of digits in `digits` into groups of three separated by `sep`.
+    
+    Per the SI Brochure, section 5.4.4, strings of four digits or fewer are not divided. Integer parts are
+    grouped from the right, and fractional parts (`from_left`) from the left.
+    
+    Args:
+    - ungrouped: The length up to which strings are left undivided. May be an array broadcastable against `digits`,
+    e.g. to group a four-digit part of a complex number whose other part is grouped.
+    """
+    if sep == '' or digits.size == 0:
+        return digits
+    length = np.strings.str_len(digits)
+    n_groups = -(-int(length.max()) // 3)
+    if n_groups <= 1:
+        return digits
+    if length.min() == length.max():
+        grouped = _group_fixed_width(digits, int(length.max()), sep, from_left)
+    elif from_left:
+        grouped = np.strings.slice(digits, 0, 3)
+        for k in range(1, n_groups):
+            group = np.strings.slice(digits, 3*k, 3*k + 3)
+            grouped = np.where(group != '', np.strings.add(np.strings.add(grouped, sep), group), grouped)
+    else:
+        grouped = np.strings.slice(digits, np.maximum(length - 3, 0), length)
+        for k in range(1, n_groups):
+            stop = np.maximum(length - 3*k, 0)
+            group = np.strings.slice(digits, np.maximum(length - 3*(k+1), 0), stop)
+            grouped = np.where(group != '', np.strings.add(np.strings.add(group, sep), grouped), grouped)
+    return np.where(length > ungrouped, grouped, digits)
+
+def _group_fixed_width(digits: ndarray, width: int, sep: str, from_left: bool) -> ndarray:
+    """`_group_digits` for strings that all have `width` characters, e.g. fractional parts with a common number of decimals.
     
+    The strings are viewed as an array of code points, so the separators are inserted with one `np.concatenate`.
+    """
+    codes = np.ascontiguousarray(digits.astype(f'<U{width}')).view(np.uint32).reshape(digits.shape + (width,))
+    bounds = range(3, width, 3) if from_left else range(width - 3*((width - 1) // 3), width, 3)
+    sep_codes = np.broadcast_to(np.frombuffer(sep.encode('utf-32-le'), dtype=np.uint32), digits.shape + (len(sep),))
+    pieces = []
+    for piece in np.split(codes, list(bounds), axis=-1):
+        pieces += [piece, sep_codes]
+    grouped = np.concatenate(pieces[:-1], axis=-1)
+    return grouped.view(f'<U{grouped.shape[-1]}').reshape(digits.shape)
+
+def _superscript_exponents(exps: ndarray, num_rep: NumRep) -> ndarray:
+    """Return the `⨯ 10ⁿ` suffix for each exponent in `exps`.
+    
+    So that an array is displayed in a single notation, exponents of zero get a `⨯ 10⁰` suffix too, unless every
+    exponent is zero.
+    """
+    unique, inverse = np.unique(exps, return_inverse=True)
+    if not unique.any():
+        return np.full(exps.shape, '')
+    suffixes = np.array([f' {num_rep.mul_sign} 10{to_superscript(int(e))}' for e in unique])
+    return suffixes[inverse].reshape(exps.shape)
+
+def _digit_strings(values: ndarray, width: int | None=None) -> ndarray:
+    """Convert an array of non-negative integers to strings of decimal digits.
+    
+    If `width` is given, the strings are zero-padded to `width` digits. `numpy`'s integer to string cast is slow, so the
+    digits are computed arithmetically as code points, which are then viewed as a string array.
+    """
+    padded = width is not None
+    if width is None:
+        width = len(str(int(values.max(initial=0))))
+    if width == 0:
+        return np.full(values.shape, '')
+    dtype = np.uint32 if width <= 9 else np.uint64
+    powers = 10**np.arange(width - 1, -1, -1, dtype=dtype)
+    codes = ((values.astype(dtype)[..., None] // powers) % 10 + ord('0')).astype(np.uint32)
+    strings = codes.view(f'<U{width}').reshape(values.shape)
+    if padded:
+        return strings
+    strings = np.strings.lstrip(strings, '0')
+    return np.where(strings == '', '0', strings)
+
+# the largest value `_fixed_digits` converts through integers
+_MAX_SCALED = float(2**62)
+_FLOAT64_DIGITS = np.finfo(np.float64).precision
+
+def _round_to_dtype(magnitude: ndarray, dtype: np.dtype) -> ndarray:
+    """Round non-negative magnitudes of a float `dtype` narrower than `float64` to the significant digits it resolves.
+    
+    Formatting is done in `float64`, which would otherwise show the representation error of, e.g., `float32(1.1)`.
+    """
+    digits = np.finfo(dtype).precision
+    magnitude = magnitude.astype(np.float64)
+    if digits >= _FLOAT64_DIGITS:
+        return magnitude
+    exps = np.floor(np.log10(np.where(magnitude != 0, magnitude, 1)))
+    return np.round(magnitude / 10.0**exps, digits - 1) * 10.0**exps
+
+def _fixed_digits(magnitude: ndarray, precision: int) -> tuple[ndarray, ndarray]:
+    """Return the integer and fractional digits of each non-negative element of `magnitude`, rounded to `precision` decimals.
+    
+    The elements are scaled to integers and converted with `_digit_strings`. `np.strings.mod` calls Python's `%` once
+    per element, so it is only used for magnitudes too large to scale.
+    """
+    scaled = np.rint(magnitude * 10.0**precision)
+    if scaled.size and scaled.max() >= _MAX_SCALED:
+        int_part, _, frac_part = np.strings.partition(np.strings.mod(f'%.{precision}f', magnitude), '.')
+        return int_part, frac_part
+    int_part, frac_part = np.divmod(scaled.astype(np.int64), 10**precision)
+    return _digit_strings(int_part), _digit_strings(frac_part, precision)
+
+def _choose_exponents(magnitude: ndarray, precision: int, notation: str) -> tuple[str, ndarray]:
+    """Resolve `notation` for an array of finite, non-negative magnitudes, and choose the exponent of each element.
+    
+    `'auto'` resolves to `'fixed'` or `'scientific'` the way `numpy` chooses. In fixed notation, every exponent is zero.
+    """
+    nonzero = magnitude != 0
+    if notation == 'auto':
+        if nonzero.any():
+            max_val, min_val = magnitude[nonzero].max(), magnitude[nonzero].min()
+            notation = 'scientific' if max_val >= 1e8 or min_val < 1e-4 or max_val/min_val > 1e3 else 'fixed'
+        else:
+            notation = 'fixed'
+    if notation == 'fixed':
+        return notation, np.zeros(magnitude.shape, dtype=np.int64)
+    exps = np.floor(np.log10(np.where(nonzero, magnitude, 1))).astype(np.int64)
+    step = 3 if notation == 'engineering' else 1
+    exps = step*np.floor_divide(exps, step)
+    mantissa = magnitude / 10.0**exps
+    # rounding may carry the mantissa over to the next exponent, e.g. 9.9999999999 -> 10.00000000
+    return notation, np.where(np.round(mantissa, precision) >= 10**step, exps + step, exps)
+
+def _format_fixed(mantissa: ndarray, negative: ndarray, num_rep: NumRep, precision: int, ungrouped: ndarray | int=4) -> ndarray:
+    """Format non-negative mantissas in fixed notation, with a common number of decimals, prefixed with `-` where `negative`."""
+    int_part, frac_part = _fixed_digits(mantissa, precision)
+    decimals = int(np.strings.str_len(np.strings.rstrip(frac_part, '0')).max(initial=0))
+    frac_part = np.strings.slice(frac_part, 0, decimals)
+    if decimals > 0:
+        if num_rep.decimal_prefix != '0':
+            int_part = np.where(int_part == '0', num_rep.decimal_prefix, int_part)
+        frac_part = np.strings.add(num_rep.decimal_marker, _group_digits(frac_part, num_rep.milli_seperator, from_left=True))
+    formatted = np.strings.add(_group_digits(int_part, num_rep.thousands_seperator, ungrouped=ungrouped), frac_part)
+    if negative.any():
+        formatted = np.strings.add(np.where(negative, '-', ''), formatted)
+    return formatted
+
+def _non_finite_names(value: ndarray) -> ndarray:
+    return np.where(np.isnan(value), 'nan', np.where(value > 0, 'inf', '-inf'))
+
+def format_real(value: ndarray, num_rep: NumRep, precision: int | None=None, notation: str='auto') -> ndarray:
+    """Format every element of a real-valued array according to the SI Brochure, sections 5.4.3 and 5.4.4.
+    
+    All elements share a notation and number of decimal places, and trailing zeros common to all elements are
+    dropped. The formatting is done with `numpy` string operations over the whole array.
+    
+    Args:
+    - value: The array to format.
+    - num_rep: The `NumRep` convention that determines the decimal marker and digit group separators.
+    - precision: The maximum number of decimal places. Defaults to `numpy`'s print precision.
+    - notation: One of `'fixed'`, `'scientific'`, `'engineering'` (exponents that are multiples of 3), or
+    `'auto'`, which chooses between fixed and scientific notation the way `numpy` does.
+    
+    Returns an array of `str` with the shape of `value`.
+    """
+    value = np.asarray(value)
+    if precision is None:
+        precision = np.get_printoptions()['precision']
+    if value.size == 0:
+        return np.full(value.shape, '')
+    if np.issubdtype(value.dtype, np.integer):
+        digits = _digit_strings(np.abs(value))
+        signs = np.where(value < 0, '-', '')
+        return np.strings.add(signs, _group_digits(digits, num_rep.thousands_seperator))
+    if not np.issubdtype(value.dtype, np.floating):
+        raise TypeError(f"Cannot format array of dtype {value.dtype}")
+    
+    finite = np.isfinite(value)
+    magnitude = _round_to_dtype(np.abs(np.where(finite, value, 0)), value.dtype)
+    notation, exps = _choose_exponents(magnitude, precision, notation)
+    formatted = _format_fixed(magnitude / 10.0**exps, np.signbit(value) & (magnitude != 0), num_rep, precision)
+    if notation != 'fixed':
+        formatted = np.strings.add(formatted, _superscript_exponents(exps, num_rep))
+    if not finite.all():
+        formatted = np.where(finite, formatted, _non_finite_names(value))
+    return formatted
+
+def format_complex(value: ndarray, num_rep: NumRep, precision: int | None=None, notation: str='auto') -> ndarray:
+    """Format every element of a complex-valued array as `a + bi`, or as `(a + bi) ⨯ 10ⁿ` in scientific notation.
+    
+    Both parts of an element share an exponent, chosen by the larger part, and are grouped alike: if either part needs
+    its digits grouped, a four-digit part is grouped as well. Otherwise, the array is formatted as in `format_real`,
+    which describes the arguments.
+    """
+    value = np.asarray(value)
+    if precision is None:
+        precision = np.get_printoptions()['precision']
+    if value.size == 0:
+        return np.full(value.shape, '')
+    parts = np.stack((value.real, value.imag))
+    finite = np.isfinite(parts)
+    magnitudes = _round_to_dtype(np.abs(np.where(finite, parts, 0)), parts.dtype)
+    notation, exps = _choose_exponents(magnitudes.max(axis=0), precision, notation)
+    mantissas = magnitudes / 10.0**exps
+    # group both parts if either part has more than four integer digits
+    ungrouped = np.where(np.round(mantissas, precision).max(axis=0) >= 1e4, 3, 4)
+    real, imag = _format_fixed(mantissas, np.stack((np.signbit(value.real) & (magnitudes[0] != 0), np.zeros(value.shape, dtype=bool))),
+                               num_rep, precision, ungrouped)
+    if not finite.all():
+        real = np.where(finite[0], real, _non_finite_names(value.real))
+        imag = np.where(finite[1], imag, _non_finite_names(np.abs(value.imag)))
+    signs = np.where(np.signbit(value.imag) & (value.imag != 0), ' - ', ' + ')
+    formatted = np.strings.add(np.strings.add(np.strings.add(real, signs), imag), num_rep.imag_marker)
+    if notation != 'fixed':
+        suffixes = np.where(finite.all(axis=0), _superscript_exponents(exps, num_rep), '')
+        formatted = np.where(suffixes != '', np.strings.add(np.strings.add('(', formatted), np.strings.add(')', suffixes)), formatted)
+    return formatted
+
+def format_elements(value: ndarray, num_rep: NumRep, **kwargs) -> ndarray:
+    """Format every element of an array, dispatching on its dtype. Returns an array of `str` with the shape of `value`."""
+    value = np.asarray(value)
+    if np.issubdtype(value.dtype, np.complexfloating):
+        return np.asarray(format_complex(value, num_rep, **kwargs))
+    if np.issubdtype(value.dtype, np.number):
+        return np.asarray(format_real(value, num_rep, **kwargs))
+    # object arrays, e.g. of `AffineScalarFunc`, can only be formatted element by element
+    formatter = np.frompyfunc(lambda x: value_to_SI_rep(x, num_rep, **kwargs), 1, 1)
+    return np.asarray(formatter(value), dtype=str)
+
+def summarize(value: ndarray, threshold: int | None=None, edgeitems: int | None=None) -> tuple[ndarray, tuple[bool, ...]]:
+    """Reduce a large array to the elements that are displayed when it is summarized, as `numpy` does.
+    
+    If `value` has more than `threshold` elements, only the first and last `edgeitems` entries along each
+    axis are kept. Returns the reduced array and a tuple indicating which axes were shortened. Both settings
+    default to `numpy`'s print options.
+    """
+    options = np.get_printoptions()
+    threshold = options['threshold'] if threshold is None else threshold
+    edgeitems = options['edgeitems'] if edgeitems is None else edgeitems
+    summarized = [False]*value.ndim
+    if value.size <= threshold:
+        return value, tuple(summarized)
+    for axis, length in enumerate(value.shape):
+        if length > 2*edgeitems:
+            indices = np.r_[0:edgeitems, length-edgeitems:length]
+            value = np.take(value, indices, axis=axis)
+            summarized[axis] = True
+    return value, tuple(summarized)
+
+def print_ndarray(value: ndarray, summarized: tuple[bool, ...] | None=None, edgeitems: int | None=None, separator: str=', ', **kwargs) -> str:
+    """Lay out an array of formatted strings with nested brackets, as `numpy` prints arrays.
+    
+    Args:
+    - value: An array of `str`, e.g. the output of `format_elements`.
+    - summarized: For each axis, whether `value` was shortened by `summarize`. An ellipsis is inserted after the
+    first `edgeitems` entries along those axes.
+    - edgeitems: The number of entries kept at each end of summarized axes.
+    - separator: The string placed between entries along the last axis.
+    """
+    value = np.asarray(value)
+    if value.ndim == 0:
+        return str(value[()])
+    if summarized is None:
+        summarized = (False,)*value.ndim
+    if edgeitems is None:
+        edgeitems = np.get_printoptions()['edgeitems']
+    if value.size:
+        value = np.strings.rjust(value, int(np.strings.str_len(value).max()))
+    return _layout(value, summarized, edgeitems, separator, 1)
+
+def _layout(value: ndarray, summarized: tuple[bool, ...], edgeitems: int, separator: str, indent: int) -> str:
+    if value.ndim == 1:
+        items = value.tolist()
+        if summarized[0]:
+            items = items[:edgeitems] + ['...'] + items[edgeitems:]
+        return '[' + separator.join(items) + ']'
+    rows = [_layout(row, summarized[1:], edgeitems, separator, indent + 1) for row in value]
+    if summarized[0]:
+        rows = rows[:edgeitems] + ['...'] + rows[edgeitems:]
+    return '[' + (separator.rstrip() + '\n'*(value.ndim - 1) + ' '*indent).join(rows) + ']'
+
 def array_dispatch(value: ndarray, num_rep: NumRep, **kwargs) -> str:
-    """Format a numpy array according to the recommendations of the SI Brochure 9th Edition, sections 5.4.3 through 5.4.5."""
-    pass
+    """Format a numpy array according to the recommendations of the SI Brochure 9th Edition, sections 5.4.3 through 5.4.5.
+    
+    Large arrays are summarized first (see `summarize`), so only the displayed elements are formatted. Accepts the
+    keyword arguments of `format_real`, `summarize` and `print_ndarray`. Entries are separated by `', '`, or by `'; '`
+    if the decimal marker is a comma.
+    """
+    threshold = kwargs.pop('threshold', None)
+    edgeitems = kwargs.pop('edgeitems', None)
+    separator = kwargs.pop('separator', '; ' if num_rep.decimal_marker == ',' else ', ')
+    shown, summarized = summarize(value, threshold, edgeitems)
+    return print_ndarray(format_elements(shown, num_rep, **kwargs), summarized, edgeitems, separator)
+
+_display_options = {
+    'prefix': None,
+    'num_rep': None,
+}
+
+def set_display_options(**options) -> None:
+    """Set how `Quantity` objects are displayed.
+    
+    Options:
+    - prefix: `None` to display values in the quantity's unit (the default), `'auto'` to choose an SI prefix for each value,
+    or `'shared'` to choose one prefix per array (see `prefixed_rep`).
+    - num_rep: The `NumRep` convention used when prefixes are chosen. Defaults to `NumberSystems.NIST`.
+    """
+    for option, setting in options.items():
+        if option not in _display_options:
+            raise ValueError(f"Unknown display option {option}")
+        if option == 'prefix' and setting not in (None, 'auto', 'shared'):
+            raise ValueError(f"Invalid prefix mode {setting}; expected None, 'auto' or 'shared'")
+        _display_options[option] = setting
+
+def get_display_options() -> dict:
+    """Return a copy of the current display options (see `set_display_options`)."""
+    return dict(_display_options)
+
+def is_prefixable(symbol: str) -> bool:
+    """Return whether a prefix can be attached to `symbol` without changing its meaning; i.e., whether it is a single, unprefixed unit symbol.
+    
+    Prefixes attach to a unit symbol before any exponent is applied (`km²` is `(km)²`), so symbols of compound or powered
+    units are never prefixed.
+    """
+    return bool(symbol) and not any(c in symbol for c in ' /()⁻' + ''.join(_superscripts.values()))
+
+def choose_prefix_exponents(value: ndarray, shared: bool=False, precision: int | None=None) -> ndarray:
+    """Choose the SI prefix exponent that best displays each element of `value`.
+    
+    The chosen exponents are multiples of 3 (engineering prefixes) that bring magnitudes, rounded to `precision` decimal
+    places (by default, `numpy`'s print precision), into the range [1, 1000), clipped to the range of SI prefixes. Zero and
+    non-finite values get an exponent of 0. If `shared` is `True`, a single exponent, chosen for the element of largest
+    magnitude, is returned for the whole array.
+    """
+    if precision is None:
+        precision = np.get_printoptions()['precision']
+    magnitude = np.abs(np.asarray(value))
+    if np.issubdtype(magnitude.dtype, np.floating):
+        magnitude = _round_to_dtype(magnitude, magnitude.dtype)
+    magnitude = magnitude.astype(float)
+    usable = np.isfinite(magnitude) & (magnitude != 0)
+    if shared:
+        magnitude = np.max(magnitude, where=usable, initial=0)
+        usable = magnitude != 0
+    magnitude = np.where(usable, magnitude, 1)
+    exps = 3*np.floor_divide(np.floor(np.log10(magnitude)), 3)
+    # rounding may carry the mantissa over to the next prefix, e.g. 999.9999999999 -> 1000.00000000
+    exps = np.where(np.round(magnitude / 10.0**exps, precision) >= 1000, exps + 3, exps)
+    return np.clip(exps, -_MAX_EXPONENT, _MAX_EXPONENT).astype(np.int64)
+
+def prefixed_rep(value: ndarray | num, symbol: str, num_rep: NumRep, shared: bool=False, is_kg: bool=False, **kwargs) -> str:
+    """Format `value` (in units of `symbol`) with automatically chosen SI prefixes, e.g. `12.3 kN` or `4.7 μF`.
+    
+    Each element gets its own prefix, unless `shared` is `True`, in which case the whole array is displayed with one prefix.
+    Prefixes are looked up in precomputed tables, so choosing and attaching them is vectorized over the array. Accepts the
+    keyword arguments of `array_dispatch`.
+    
+    Args:
+    - value: A real or complex number or array. Prefixes of complex values are chosen by their magnitude.
+    - symbol: The symbol of the unit `value` is expressed in. If it can't be prefixed (see `is_prefixable`), no prefix is used.
+    - num_rep: The `NumRep` convention to use.
+    - shared: Whether to use one prefix for every element.
+    - is_kg: Whether `value` is in kilograms, in which case prefixes are attached to the gram.
+    """
+    if is_kg:
+        value, symbol = np.multiply(value, 1e3), 'g'
+    if not is_prefixable(symbol):
+        return f'{value_to_SI_rep(value, num_rep, **kwargs)} {symbol}'
+    kwargs.setdefault('notation', 'fixed')
+    value = np.asarray(value)
+    threshold = kwargs.pop('threshold', None)
+    edgeitems = kwargs.pop('edgeitems', None)
+    separator = kwargs.pop('separator', '; ' if num_rep.decimal_marker == ',' else ', ')
+    shown, summarized = summarize(value, threshold, edgeitems)
+    exps = choose_prefix_exponents(shown, shared, kwargs.get('precision'))
+    # keep the precision of `float32` values, which `format_elements` rounds to
+    mantissas = format_elements(np.divide(shown, 10.0**exps, dtype=shown.dtype if np.issubdtype(shown.dtype, np.inexact) else None), num_rep, **kwargs)
+    if np.iscomplexobj(shown) and not (shared and shown.ndim):
+        # a prefixed unit applies to both parts of a complex value: `(1 + 2i) kΩ`
+        mantissas = np.where(np.strings.startswith(mantissas, '('), mantissas, np.strings.add(np.strings.add('(', mantissas), ')'))
+    if shared:
+        return f'{print_ndarray(mantissas, summarized, edgeitems, separator)} {_abbrev_array[exps + _MAX_EXPONENT]}{symbol}'
+    units = np.strings.add(' ', np.strings.add(_abbrev_array[exps + _MAX_EXPONENT], symbol))
+    return print_ndarray(np.strings.add(mantissas, units), summarized, edgeitems, separator)
 
 def get_exp(value: num) -> tuple[int, float]:
     raw_exp = np.log10(value)
@@ -162,7 +544,7 @@ def ufloat_SI_repr(uval: u_num) -> str:
 def value_to_SI_rep(value: object, num_rep: NumRep, **kwargs) -> str:
     """Format a value to a numerical string according to the recommendations of the SI Brochure 9th Edition, sections 5.4.3 through 5.4.5.
     
-    By default, this function includes handling for python's `Number`, numpy's `number`, and `uncertainties`' ``AffineScalarFunc` (superclass of `Variable`).
+    By default, this function includes handling for python's `Number`, numpy's `number` and `ndarray`, and `uncertainties`' `AffineScalarFunc` (superclass of `Variable`).
     Your custom number class can implement functionality for this function by implementing the following static method:
     ```
     class MyClass:
@@ -171,19 +553,13 @@ def value_to_SI_rep(value: object, num_rep: NumRep, **kwargs) -> str:
     ```
     You can choose what, if any, `kwargs` to handle. 
     """
-    # Check input to make sure we can format it, and try to fall back to a custom implementation if we can't.
-    imag_val: float = 0
-    imag_unc: float = 0
-    real_val: float = 0
-    real_unc: float = 0
-    
-    
     if isinstance(value, ndarray):
         return array_dispatch(value, num_rep, **kwargs)
-    
+    if isinstance(value, u_num):
+        return ufloat_SI_repr(value)
     if isinstance(value, (num, np_num)):
-        if hasattr(value, 'imag'):
-            pass
+        return str(format_elements(value, num_rep, **kwargs)[()])
+    # Fall back to a custom implementation if we can't format it ourselves.
     try:
         return value.__class__.__SI_rep__(value, num_rep, **kwargs)
     except AttributeError:
@@ -3,12 +3,31 @@ from qntpy.core.unit import Unit
 from qntpy.core.units import base_units, derived_units, m, s, J, kg
 from qntpy.core.quantity import Quantity
 from qntpy.util.exceptions import IncommensurableError
+from qntpy.util import profiling
+from qntpy.core.registry import UnitRegistry
 
 _explicit_units = {
     
 }
 
+_added_base_units: tuple[Unit, ...] = ()
 _units_to_use = base_units + derived_units # in order of priority
+_registry = UnitRegistry(_units_to_use)
+_priority = {id(unit): i for i, unit in enumerate(_units_to_use)}
+
+def add_base_unit(unit: Unit) -> None:
+    """Make `unit` available to the simplifier as a base unit.
+    
+    This is required for the base unit of every dimension added with `Dim.register`; units with such a dimension
+    can't be simplified otherwise.
+    """
+    global _added_base_units, _units_to_use
+    if unit not in _added_base_units:
+        _added_base_units += (unit,)
+        _units_to_use = base_units + _added_base_units + derived_units
+        _registry.register(unit)
+        _priority.clear()
+        _priority.update((id(u), i) for i, u in enumerate(_units_to_use))
 
 def get_dist_squared(unit1: Unit, unit2: Unit) -> float:
     return (unit2.vec - unit1.vec).mag2
@@ -25,6 +44,21 @@ def dot_product(unit: Unit, other: Unit) -> int:
 def orthogonal(unit_1, unit_2: Unit | Quantity) -> bool:
     return not dot_product(unit_1, unit_2) # we're working with ints, so shouldn't be a problem
 
+def _exact_match(unit: Unit) -> str | None:
+    """If one of `_units_to_use`, or its reciprocal, has the dimension of `unit`, return its symbol.
+    
+    This looks the dimension up by key: the unit of highest priority wins, and reciprocals are marked with a leading
+    "⁻". A derived unit with the dimension itself is preferred to the reciprocal of another derived unit, so e.g. an
+    admittance is shown in `S` rather than `Ω⁻¹`, while base units keep their priority (`s⁻¹` rather than `Hz`).
+    """
+    matches = [(_priority[id(u)], '', u) for u in _registry.units_for(unit.vec)]
+    matches += [(_priority[id(u)] + (len(_units_to_use) if u in derived_units else 0), '⁻', u)
+                for u in _registry.units_for(-unit.vec)]
+    if not matches:
+        return None
+    _, sign, match = min(matches, key=lambda m: m[0])
+    return sign + match.symbol
+
 def __simplify(unit: Unit, expl_units: dict[Unit, str]):
     """if you're curious, this function sequentially factors out the "closest" unit to the unit being tested;
     "closest" being defined via euclidean (ish) distance in 7D base-SI-unit space.
@@ -38,6 +72,9 @@ def __simplify(unit: Unit, expl_units: dict[Unit, str]):
     for unit_to_check in expl_units:
         if unit == unit_to_check:
             return expl_units[unit_to_check]
+    exact_match = _exact_match(unit)
+    if exact_match is not None:
+        return exact_match
     _units: tuple[Unit] = tuple(filter(lambda x: dot_product(unit, x), _units_to_use))
     
     closest_unit_dist = get_dist_squared(unit, _units[-1]) + 1 # it is guaranteed that at least one unit will have a smalller dist than this
@@ -79,6 +116,8 @@ def __simplify(unit: Unit, expl_units: dict[Unit, str]):
     return (s+closest_unit_symbol+" ") * closest_unit_exponent + __simplify(unit / (closest_unit**closest_unit_exponent), expl_units)
 
 def simplify(value: Quantity | Unit, exp_units: list=_explicit_units) -> str:
+    if profiling.ENABLED:
+        profiling.record(profiling.SIMPLIFY)
     if isinstance(value, Quantity):
         return f"{str(value.value)} {simplify(value.unit, exp_units)}"
     elif isinstance(value, Unit):
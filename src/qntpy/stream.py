@@ -0,0 +1,224 @@
+"""Asynchronous pipeline stages that normalize streams of readings in mixed units.
+
+Each stage is an async generator that consumes an async iterable, so stages compose by nesting and a slow consumer
+naturally holds back its producers. Readings flow through the pipeline as `(value, unit)` pairs until `convert`
+turns each batch of them into an array-valued `Quantity`, with one vectorized conversion per unit in the batch:
+```
+>>> readings = stream.parse(feed)                     # "71.2 degF" -> (71.2, degF)
+>>> readings = stream.check(readings, units.K)         # reject readings that aren't temperatures
+>>> batches = stream.batch(readings, 1024, timeout=0.5)
+>>> async for window in stream.convert(batches):      # Quantity([...] K)
+...     ...
+```
+`buffer` decouples a fast producer from the rest of the pipeline through a bounded queue.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from numbers import Real
+from typing import AsyncIterable, AsyncIterator, Iterable, Tuple
+
+import numpy as np
+
+from qntpy.core.dimension import DimVec
+from qntpy.core.quantity import Quantity
+from qntpy.core.registry import UnitRegistry, default_registry
+from qntpy.core.unit import Unit
+from qntpy.util import exceptions as exc
+
+Reading = Tuple[float, Unit]
+"""A single reading: a value, and the unit it is expressed in."""
+
+
+async def source(readings: Iterable) -> AsyncIterator:
+    """Yield the items of an ordinary iterable, e.g. to feed a pipeline from memory."""
+    for reading in readings:
+        yield reading
+        await asyncio.sleep(0)
+
+
+def parse_reading(reading: str | tuple[Real, Unit | str], registry: UnitRegistry=default_registry) -> Reading:
+    """Turn a reading like `"71.2 degF"` or `(71.2, "degF")` into a `(value, unit)` pair.
+
+    Unit symbols are looked up in `registry`. Raises `InvalidUnitError` for unknown symbols.
+    """
+    if isinstance(reading, str):
+        value, _, symbol = reading.strip().partition(' ')
+        reading = (float(value), symbol.strip())
+    value, unit = reading
+    if isinstance(unit, str):
+        if unit not in registry:
+            raise exc.InvalidUnitError(f"Unknown unit {unit!r}")
+        unit = registry.lookup(unit)
+    return value, unit
+
+
+async def parse(readings: AsyncIterable[str | tuple[Real, Unit | str]], registry: UnitRegistry=default_registry) -> AsyncIterator[Reading]:
+    """Parse each reading with `parse_reading`."""
+    async for reading in readings:
+        yield parse_reading(reading, registry)
+
+
+async def check(readings: AsyncIterable[Reading], dimension: Unit | DimVec | Quantity, errors: str='raise') -> AsyncIterator[Reading]:
+    """Pass on readings with the dimension of `dimension`.
+
+    Args:
+    - readings: `(value, unit)` pairs.
+    - dimension: A unit, quantity or dimension vector with the expected dimension.
+    - errors: `'raise'` to raise `IncommensurableError` on the first reading with another dimension, or `'drop'` to
+    skip such readings.
+    """
+    if isinstance(dimension, Quantity):
+        dimension = dimension.unit
+    vec = dimension.vec if isinstance(dimension, Unit) else dimension
+    async for value, unit in readings:
+        if unit.vec == vec:
+            yield value, unit
+        elif errors == 'raise':
+            raise exc.IncommensurableError(f"Reading {value} {unit.symbol} doesn't have the dimension {vec}")
+
+
+_DONE = object()
+
+def _pump(items: AsyncIterable, maxsize: int) -> tuple[asyncio.Queue, asyncio.Future]:
+    """Start a task that moves `items` into a queue of at most `maxsize` entries, followed by an end marker."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+    async def pump() -> None:
+        try:
+            async for item in items:
+                await queue.put((item, None))
+        except Exception as error:
+            await queue.put((_DONE, error))
+        else:
+            await queue.put((_DONE, None))
+
+    return queue, asyncio.ensure_future(pump())
+
+async def _next(queue: asyncio.Queue):
+    """Return the next item from a queue filled by `_pump`. Raises `StopAsyncIteration` at the end of the items."""
+    item, error = await queue.get()
+    if item is _DONE:
+        if error is not None:
+            raise error
+        raise StopAsyncIteration
+    return item
+
+
+async def buffer(items: AsyncIterable, maxsize: int) -> AsyncIterator:
+    """Consume `items` in a background task, holding at most `maxsize` items that haven't been passed on yet.
+
+    The producer runs ahead of the consumer until the buffer is full, and is then paused until the consumer catches up.
+    Exceptions raised by the producer are re-raised to the consumer.
+    """
+    queue, task = _pump(items, maxsize)
+    try:
+        while True:
+            try:
+                item = await _next(queue)
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        task.cancel()
+
+
+async def batch(items: AsyncIterable, size: int, timeout: float | None=None) -> AsyncIterator[list]:
+    """Group items into lists of `size`, and a final shorter list if items remain.
+
+    If `timeout` is given, a partial batch is also passed on once no new item has arrived for `timeout` seconds, so
+    slow feeds don't hold readings back indefinitely. Items are then read ahead by up to `size` items.
+    """
+    current: list = []
+    if timeout is None:
+        async for item in items:
+            current.append(item)
+            if len(current) >= size:
+                yield current
+                current = []
+    else:
+        # waiting on a queue can be timed out safely, whereas cancelling a pending `__anext__` would close `items`
+        queue, task = _pump(items, size)
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(_next(queue), timeout if current else None)
+                except asyncio.TimeoutError:
+                    yield current
+                    current = []
+                    continue
+                except StopAsyncIteration:
+                    break
+                current.append(item)
+                if len(current) >= size:
+                    yield current
+                    current = []
+        finally:
+            task.cancel()
+    if current:
+        yield current
+
+
+class Converter:
+    """Converts values between pairs of units, caching the scale and offset of each pair.
+
+    Units aren't hashable, so pairs are cached by identity; the cache keeps the units it has seen alive.
+    """
+    def __init__(self) -> None:
+        self._cache: dict[tuple[int, int], tuple[Unit, Unit, float, float]] = {}
+        self._coherent: dict[int, Unit] = {}
+
+    def coherent(self, unit: Unit) -> Unit:
+        """Return the coherent SI unit with the dimension of `unit`, the same object for every unit of that dimension."""
+        coherent = self._coherent.get(unit.vec.key)
+        if coherent is None:
+            coherent = self._coherent[unit.vec.key] = Quantity(np.zeros(0), unit).unit
+        return coherent
+
+    def coefficients(self, unit: Unit, target: Unit) -> tuple[float, float]:
+        """Return `(scale, offset)` such that a value `v` in `unit` is `v*scale + offset` in `target`."""
+        key = (id(unit), id(target))
+        cached = self._cache.get(key)
+        if cached is None:
+            if unit.vec != target.vec:
+                raise exc.IncommensurableError(f"Cannot convert {unit.symbol} to {target.symbol}")
+            scale = unit.factor / target.factor
+            offset = (unit.offset - target.offset) / target.factor
+            cached = self._cache[key] = (unit, target, scale, offset)
+        return cached[2], cached[3]
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+default_converter = Converter()
+
+
+def convert_readings(readings: list[Reading], unit: Unit | None=None, converter: Converter=default_converter) -> Quantity:
+    """Convert a batch of readings to one array-valued `Quantity`.
+
+    The values are converted with one vectorized operation per distinct unit in the batch.
+
+    Args:
+    - readings: `(value, unit)` pairs with a common dimension.
+    - unit: The unit to express the values in. Defaults to the coherent SI unit. The result stores its value in this
+    unit (see `Quantity.__init__`'s `lazy`), so it isn't converted again.
+    - converter: The cache of conversion coefficients to use.
+    """
+    values = np.fromiter((value for value, _ in readings), dtype=np.float64, count=len(readings))
+    units = [reading_unit for _, reading_unit in readings]
+    if unit is None:
+        unit = converter.coherent(units[0])
+    ids = np.fromiter(map(id, units), dtype=np.int64, count=len(units))
+    unique_ids, first, inverse = np.unique(ids, return_index=True, return_inverse=True)
+    coefficients = np.array([converter.coefficients(units[i], unit) for i in first]).reshape(-1, 2)
+    values = values * coefficients[inverse, 0] + coefficients[inverse, 1]
+    return Quantity(values, unit, lazy=True, bypass_checks=True)
+
+
+async def convert(batches: AsyncIterable[list[Reading]], unit: Unit | None=None, converter: Converter=default_converter) -> AsyncIterator[Quantity]:
+    """Convert each batch of readings to an array-valued `Quantity` with `convert_readings`."""
+    async for readings in batches:
+        if readings:
+            yield convert_readings(readings, unit, converter)
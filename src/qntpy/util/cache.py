@@ -0,0 +1,150 @@
+"""Memoization of functions of quantities.
+
+`functools.lru_cache` keys on its arguments as given, so a function called with `Quantity(14.5, psi)` and with the same
+pressure in `Pa` would be evaluated twice, and array-valued quantities can't be used as keys at all. `cached` keys each
+`Quantity` argument on its value in coherent SI units and the key of its dimension instead, so physically equal inputs
+share a cache entry whatever unit they were given in:
+```
+>>> import qntpy
+>>> @qntpy.cached(maxsize=1024, ttl=3600)
+... def density(T, p):
+...     ...
+>>> density(Quantity(300, K), Quantity(14.5, psi))
+>>> density.cache_info()
+CacheInfo(hits=0, misses=1, maxsize=1024, currsize=1, evictions=0, expirations=0)
+```
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple
+
+import numpy as np
+
+from qntpy.core import defs
+from qntpy.core.quantity import Quantity
+from qntpy.util import profiling
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `cached` function."""
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    evictions: int
+    """Entries dropped because the cache was full."""
+    expirations: int
+    """Entries dropped because they were older than the cache's `ttl`."""
+
+
+def _value_key(value: Any, significant_digits: int | None) -> Any:
+    if isinstance(value, np.ndarray):
+        if significant_digits is not None and value.dtype.kind in 'fc':
+            value = _round_significant(value, significant_digits)
+        return (value.dtype.str, value.shape, value.tobytes())
+    if significant_digits is not None and isinstance(value, (float, np.floating)):
+        return float(_round_significant(np.float64(value), significant_digits))
+    return value
+
+def _round_significant(value: Any, digits: int) -> Any:
+    magnitude = np.abs(value)
+    exponent = np.floor(np.log10(np.where(magnitude > 0, magnitude, 1)))
+    scale = 10.0**(digits - 1 - exponent)
+    return np.round(value * scale) / scale
+
+def canonical_key(obj: Any, significant_digits: int | None=None) -> Any:
+    """Return a hashable key for `obj` that is equal for physically equal quantities.
+
+    A `Quantity` is keyed on the key of its dimension and its value in coherent SI units, and a `Unit` like one of it
+    (which is what `Quantity(1, unit)` returns). An `ndarray` is keyed on its dtype, shape and contents. Other objects
+    are their own keys.
+
+    Args:
+    - obj: The object to key.
+    - significant_digits: If given, floating-point values are rounded to this many significant digits, so that values
+    that only differ by rounding errors in their unit conversions share a key.
+    """
+    if isinstance(obj, defs.Unit):
+        obj = Quantity(1, obj, bypass_checks=True)
+    if isinstance(obj, Quantity):
+        return (Quantity, obj.unit.vec.key, _value_key(obj.value, significant_digits))
+    if isinstance(obj, np.ndarray):
+        return (np.ndarray, _value_key(obj, significant_digits))
+    return obj
+
+
+def cached(maxsize: int | None=128, ttl: float | None=None, significant_digits: int | None=None) -> Callable[[Callable], Callable]:
+    """Memoize a function whose arguments may be quantities in any units.
+
+    Arguments are keyed with `canonical_key`, so e.g. `f(Quantity(1, ft))` and `f(Quantity(0.3048, m))` share an entry.
+    Like `functools.lru_cache`, the same result object is returned for every call with equal arguments, so results
+    shouldn't be modified in place. The cache is safe to use from several threads.
+
+    The decorated function has `cache_info()`, which returns a `CacheInfo`, and `cache_clear()`. Hits and misses are
+    also recorded as profiling events (see `qntpy.util.profiling`), under the function's qualified name.
+
+    Args:
+    - maxsize: The maximum number of entries. Once it is reached, the least recently used entry is evicted. `None` for
+    no limit.
+    - ttl: The number of seconds an entry stays valid after it is computed. `None` for no limit.
+    - significant_digits: See `canonical_key`.
+    """
+    def decorator(func: Callable) -> Callable:
+        entries: OrderedDict[Any, tuple[Any, float]] = OrderedDict()
+        lock = threading.RLock()
+        counts = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+        name = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = tuple(canonical_key(arg, significant_digits) for arg in args)
+            if kwargs:
+                key += (_KWARGS,) + tuple((k, canonical_key(v, significant_digits)) for k, v in sorted(kwargs.items()))
+            now = time.monotonic() if ttl is not None else 0.
+            with lock:
+                entry = entries.get(key)
+                if entry is not None:
+                    if ttl is None or now - entry[1] < ttl:
+                        entries.move_to_end(key)
+                        counts['hits'] += 1
+                        if profiling.ENABLED:
+                            profiling.record(profiling.cache_hit(name))
+                        return entry[0]
+                    del entries[key]
+                    counts['expirations'] += 1
+                counts['misses'] += 1
+            if profiling.ENABLED:
+                profiling.record(profiling.cache_miss(name))
+            result = func(*args, **kwargs)
+            with lock:
+                entries[key] = (result, now)
+                entries.move_to_end(key)
+                if maxsize is not None and len(entries) > maxsize:
+                    entries.popitem(last=False)
+                    counts['evictions'] += 1
+            return result
+
+        def cache_info() -> CacheInfo:
+            with lock:
+                return CacheInfo(counts['hits'], counts['misses'], maxsize, len(entries), counts['evictions'], counts['expirations'])
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+                counts.update(dict.fromkeys(counts, 0))
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    if callable(maxsize):
+        # used as `@cached`, without arguments
+        func, maxsize = maxsize, 128
+        return decorator(func)
+    return decorator
+
+_KWARGS = object()
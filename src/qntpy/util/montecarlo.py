@@ -0,0 +1,216 @@
+"""Monte Carlo propagation of uncertainty.
+
+`uncertainties` propagates uncertainty linearly, which is inaccurate for strongly nonlinear functions, and slow when
+applied element by element to arrays. A `Samples` value instead holds `N_SAMPLES` draws from the distribution of an
+uncertain value in one contiguous array, and every operation on it is applied to all draws at once. Its nominal value
+and standard deviation are estimated from the draws, and it is displayed in the SI concise notation used for `ufloat`s.
+
+`Samples` can be used as the value of a `Quantity`:
+```
+>>> from qntpy.util import montecarlo
+>>> from qntpy.constants import G, m_e
+>>> montecarlo.seed(0)
+>>> with montecarlo.propagation():
+...     F = montecarlo.sample(G) * montecarlo.sample(m_e)**2 / (1e-10*m)**2
+```
+Within a `propagation` block, samples drawn for the same `uncertainties.Variable` are shared, so values derived from
+common constants stay correlated. Outside of one, every `ufloat` is sampled independently.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from numbers import Number
+from typing import Any, Iterator
+
+import numpy as np
+from numpy.lib.array_utils import normalize_axis_tuple
+from numpy.lib.mixins import NDArrayOperatorsMixin
+from uncertainties import ufloat
+from uncertainties.core import AffineScalarFunc
+
+N_SAMPLES: int = 10_000
+"""Number of samples drawn per uncertain value."""
+
+_rng = np.random.default_rng()
+_variable_samples: ContextVar[dict[AffineScalarFunc, np.ndarray] | None] = ContextVar('_variable_samples', default=None)
+
+
+def seed(value: int | None=None) -> None:
+    """Reseed the generator samples are drawn from, and forget the samples drawn in the current `propagation` block."""
+    global _rng
+    _rng = np.random.default_rng(value)
+    shared = _variable_samples.get()
+    if shared is not None:
+        shared.clear()
+
+
+@contextmanager
+def propagation() -> Iterator[None]:
+    """Share the samples drawn for each `uncertainties.Variable` within a block, and forget them when it ends.
+
+    `uncertainties` variables can't be referenced weakly, so samples are only remembered for the duration of the block,
+    rather than for as long as their variable is alive. Nested blocks share the samples of the outermost one.
+    """
+    if _variable_samples.get() is not None:
+        yield
+        return
+    token = _variable_samples.set({})
+    try:
+        yield
+    finally:
+        _variable_samples.reset(token)
+
+
+class Samples(NDArrayOperatorsMixin):
+    """An uncertain value, represented by samples of its distribution.
+
+    `samples` has shape `(n,) + shape`: the first axis indexes the samples, and the remaining axes are those of the
+    value. Arithmetic, ufuncs and indexing act on the value's axes and broadcast over the sample axis; plain numbers,
+    arrays and `ufloat`s are promoted to `Samples` as needed.
+    """
+    __slots__ = ('samples',)
+
+    def __init__(self, samples: np.ndarray) -> None:
+        self.samples = np.ascontiguousarray(samples)
+
+    @property
+    def n(self) -> int:
+        """The number of samples."""
+        return self.samples.shape[0]
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.samples.shape[1:]
+
+    @property
+    def ndim(self) -> int:
+        return self.samples.ndim - 1
+
+    def __len__(self) -> int:
+        if self.ndim == 0:
+            raise TypeError("len() of unsized uncertain value")
+        return self.shape[0]
+
+    def __getitem__(self, index) -> Samples:
+        if not isinstance(index, tuple):
+            index = (index,)
+        return Samples(self.samples[(slice(None),) + index])
+
+    @property
+    def nominal_value(self) -> float | np.ndarray:
+        """The mean of the samples."""
+        return self.samples.mean(axis=0)
+
+    @property
+    def std_dev(self) -> float | np.ndarray:
+        """The sample standard deviation."""
+        return self.samples.std(axis=0, ddof=1)
+
+    def percentile(self, q: float | np.ndarray) -> float | np.ndarray:
+        """Return the `q`th percentiles of the samples. The result has the shape of `q` followed by that of the value."""
+        return np.percentile(self.samples, q, axis=0)
+
+    def to_ufloat(self) -> AffineScalarFunc | np.ndarray:
+        """Summarize the samples as a `ufloat`, or as an array of `ufloat`s for an array value."""
+        if self.ndim == 0:
+            return ufloat(self.nominal_value, self.std_dev)
+        return np.frompyfunc(ufloat, 2, 1)(self.nominal_value, self.std_dev)
+
+    def _promote(self, value: Any) -> Any:
+        """Return `value` in a form that broadcasts against `self.samples`, or `NotImplemented`."""
+        if isinstance(value, Samples):
+            return value.samples
+        if isinstance(value, AffineScalarFunc):
+            return from_ufloat(value, self.n).samples
+        if isinstance(value, (Number, np.number, np.ndarray)):
+            return value
+        return NotImplemented
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method not in ('__call__', 'reduce') or 'out' in kwargs:
+            return NotImplemented
+        inputs = [self._promote(value) for value in inputs]
+        if any(value is NotImplemented for value in inputs):
+            return NotImplemented
+        if method == 'reduce':
+            # reductions act on the value's axes, never on the sample axis
+            axis = kwargs.pop('axis', 0)
+            if axis is None:
+                axis = tuple(range(1, self.ndim + 1))
+            else:
+                axis = tuple(a + 1 for a in normalize_axis_tuple(axis, self.ndim))
+            return Samples(ufunc.reduce(inputs[0], axis=axis, **kwargs))
+        return Samples(ufunc(*inputs, **kwargs))
+
+    def __bool__(self) -> bool:
+        """An uncertain value is truthy if every sample is, and falsy if none is; otherwise its truth value is ambiguous."""
+        if self.samples.all():
+            return True
+        if not self.samples.any():
+            return False
+        raise ValueError("The truth value of an uncertain value whose samples disagree is ambiguous")
+
+    def __str__(self) -> str:
+        from qntpy.rep import rep
+        if self.ndim == 0:
+            return rep.ufloat_SI_repr(self.to_ufloat())
+        return rep.print_ndarray(np.asarray(np.frompyfunc(rep.ufloat_SI_repr, 1, 1)(self.to_ufloat()), dtype=str))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({str(self)}, n={self.n})'
+
+    @staticmethod
+    def __SI_rep__(value: Samples, num_rep, **kwargs) -> str:
+        return str(value)
+
+    @staticmethod
+    def __quantity_value__(value: Samples) -> tuple[Samples, None]:
+        return (value, None)
+
+
+def normal(nominal_value: float | np.ndarray, std_dev: float | np.ndarray, n: int | None=None) -> Samples:
+    """Draw `n` (default `N_SAMPLES`) samples from a normal distribution."""
+    shape = (n or N_SAMPLES,) + np.broadcast_shapes(np.shape(nominal_value), np.shape(std_dev))
+    return Samples(_rng.normal(nominal_value, std_dev, shape))
+
+
+def uniform(low: float | np.ndarray, high: float | np.ndarray, n: int | None=None) -> Samples:
+    """Draw `n` (default `N_SAMPLES`) samples from a uniform distribution on `[low, high)`."""
+    shape = (n or N_SAMPLES,) + np.broadcast_shapes(np.shape(low), np.shape(high))
+    return Samples(_rng.uniform(low, high, shape))
+
+
+def _standard_samples(variable: AffineScalarFunc, n: int) -> np.ndarray:
+    shared = _variable_samples.get()
+    samples = shared.get(variable) if shared is not None else None
+    if samples is None or samples.shape[0] != n:
+        samples = _rng.standard_normal(n)
+        if shared is not None:
+            shared[variable] = samples
+    return samples
+
+
+def from_ufloat(value: AffineScalarFunc, n: int | None=None) -> Samples:
+    """Sample the distribution of a `ufloat`.
+
+    `value` is a linear function of independent normally-distributed `Variable`s. Within a `propagation` block, the
+    samples drawn for each `Variable` are remembered, so values derived from a common `Variable` are sampled consistently.
+    """
+    n = n or N_SAMPLES
+    samples = np.full(n, value.nominal_value, dtype=float)
+    for variable, derivative in value.derivatives.items():
+        if derivative and variable.std_dev:
+            samples += derivative * variable.std_dev * _standard_samples(variable, n)
+    return Samples(samples)
+
+
+def sample(value: Any, n: int | None=None) -> Any:
+    """Convert the `ufloat` value of `value` (a `Quantity` or a `ufloat`) to `Samples`. Other values are returned unchanged."""
+    from qntpy.core.quantity import Quantity
+    if isinstance(value, Quantity):
+        return Quantity(sample(value.value, n), value.unit, value.digits)
+    if isinstance(value, AffineScalarFunc):
+        return from_ufloat(value, n)
+    return value
@@ -0,0 +1,137 @@
+"""Opt-in instrumentation of qntpy's hot paths.
+
+The core classes count how many objects they construct, how often unit algebra, commensurability checks,
+simplification, cache lookups and unit conversions happen. Counting is off by default; every hook is guarded
+by a check of the module-level `ENABLED` flag, so the hooks cost a single attribute lookup when disabled.
+
+Counts can be collected for a block of code:
+```
+>>> import qntpy
+>>> with qntpy.profile() as stats:
+...     (3*qntpy.m + 4*qntpy.m) / qntpy.s
+>>> stats['quantity.new']
+```
+or process-wide, with `enable()` and `stats()`. If `callsites` is `True`, each event is also attributed to the
+first stack frame outside of qntpy that caused it.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator
+
+ENABLED: bool = False
+"""Whether any collector is active. Hooks must check this before calling `record`."""
+
+# Event names.
+QUANTITY_NEW = 'quantity.new'
+UNIT_NEW = 'unit.new'
+DIMVEC_NEW = 'dimvec.new'
+UNIT_OP = 'unit.op'
+COMMENSURABILITY_CHECK = 'unit.commensurability_check'
+SIMPLIFY = 'simplify'
+CONVERSION = 'quantity.conversion'
+
+def cache_hit(cache: str) -> str:
+    """Return the name of the event recorded when the cache named `cache` is hit."""
+    return f'cache.{cache}.hit'
+
+def cache_miss(cache: str) -> str:
+    """Return the name of the event recorded when the cache named `cache` is missed."""
+    return f'cache.{cache}.miss'
+
+_package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Stats:
+    """Event counts collected while profiling.
+
+    `counts` maps event names to the number of times they occurred. If callsites are being collected,
+    `callsites` maps `(event, 'file:line')` pairs to counts; otherwise it is `None`.
+    """
+    def __init__(self, callsites: bool=False) -> None:
+        self.counts: Counter[str] = Counter()
+        self.callsites: Counter[tuple[str, str]] | None = Counter() if callsites else None
+
+    def __getitem__(self, event: str) -> int:
+        return self.counts[event]
+
+    def reset(self) -> None:
+        """Clear all counts."""
+        self.counts.clear()
+        if self.callsites is not None:
+            self.callsites.clear()
+
+    def report(self, top: int=10) -> str:
+        """Return a table of the event counts and, if collected, the `top` busiest callsites."""
+        lines = [f'{event:<40}{count:>12}' for event, count in sorted(self.counts.items())]
+        if self.callsites:
+            lines.append('')
+            lines += [f'{event:<40}{count:>12}  {site}' for (event, site), count in self.callsites.most_common(top)]
+        return '\n'.join(lines)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({dict(self.counts)})'
+
+
+_collectors: list[Stats] = []
+_global_stats: Stats | None = None
+
+def _callsite() -> str:
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_code.co_filename.startswith(_package_dir):
+        frame = frame.f_back
+    if frame is None:
+        return '<unknown>'
+    return f'{frame.f_code.co_filename}:{frame.f_lineno}'
+
+def record(event: str, n: int=1) -> None:
+    """Record `n` occurrences of `event` in every active collector. Only call this if `ENABLED` is `True`."""
+    site = None
+    for stats in _collectors:
+        stats.counts[event] += n
+        if stats.callsites is not None:
+            if site is None:
+                site = _callsite()
+            stats.callsites[(event, site)] += n
+
+def _update_enabled() -> None:
+    global ENABLED
+    ENABLED = bool(_collectors)
+
+@contextmanager
+def profile(callsites: bool=False) -> Iterator[Stats]:
+    """Count the events that occur within a `with` block, and yield the `Stats` they are counted in.
+
+    Profiles can be nested; each one counts every event that occurs while it is active.
+    """
+    stats = Stats(callsites)
+    _collectors.append(stats)
+    _update_enabled()
+    try:
+        yield stats
+    finally:
+        _collectors.remove(stats)
+        _update_enabled()
+
+def enable(callsites: bool=False) -> Stats:
+    """Start counting events process-wide, and return the `Stats` they are counted in (see `stats`)."""
+    global _global_stats
+    disable()
+    _global_stats = Stats(callsites)
+    _collectors.append(_global_stats)
+    _update_enabled()
+    return _global_stats
+
+def disable() -> None:
+    """Stop counting events process-wide. The counts collected so far remain available from `stats`."""
+    if _global_stats in _collectors:
+        _collectors.remove(_global_stats)
+    _update_enabled()
+
+def stats() -> Stats:
+    """Return the process-wide `Stats`, which are empty unless `enable` has been called."""
+    return _global_stats if _global_stats is not None else Stats()
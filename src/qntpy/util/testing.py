@@ -1,4 +1,7 @@
 from qntpy.core.unit import Unit
+from qntpy.util import profiling
 
 def commensurable(a: Unit, b: Unit) -> bool:
+    if profiling.ENABLED:
+        profiling.record(profiling.COMMENSURABILITY_CHECK)
     return a.vec == b.vec
\ No newline at end of file
@@ -0,0 +1,42 @@
+import numpy as np
+
+from qntpy.core.quantity import Quantity
+from qntpy.core.units import m
+from qntpy.constants.us import ft
+from qntpy.compat import chunked
+
+def make_memmap(tmp_path, shape=(10, 3)):
+    mm = np.memmap(tmp_path / 'values.dat', dtype=np.float64, mode='w+', shape=shape)
+    mm[:] = np.arange(np.prod(shape)).reshape(shape)
+    return mm
+
+def test_coherent_value_not_copied(tmp_path):
+    mm = make_memmap(tmp_path)
+    q = Quantity(mm, m)
+    assert q.value is mm
+
+def test_conversion_is_out_of_core(tmp_path, monkeypatch):
+    monkeypatch.setattr(chunked, 'CHUNK_SIZE', 7)
+    mm = make_memmap(tmp_path)
+    q = Quantity(mm, ft)
+    assert chunked.is_out_of_core(q.value)
+    assert np.allclose(q.value, np.asarray(mm) * 0.3048)
+
+def test_arithmetic_is_out_of_core(tmp_path, monkeypatch):
+    monkeypatch.setattr(chunked, 'CHUNK_SIZE', 5)
+    mm = make_memmap(tmp_path)
+    q = Quantity(mm, m)
+    total = q + q
+    product = np.multiply(q, q)
+    assert chunked.is_out_of_core(total.value)
+    assert chunked.is_out_of_core(product.value)
+    assert np.allclose(total.value, 2 * np.asarray(mm))
+    assert product.unit == m * m
+
+def test_chunked_reduction(tmp_path, monkeypatch):
+    monkeypatch.setattr(chunked, 'CHUNK_SIZE', 4)
+    mm = make_memmap(tmp_path)
+    q = Quantity(mm, m)
+    assert np.allclose(np.add.reduce(q).value, np.asarray(mm).sum(axis=0))
+    assert np.add.reduce(q, axis=None).value == np.asarray(mm).sum()
+    assert np.maximum.reduce(q, axis=None).value == 29
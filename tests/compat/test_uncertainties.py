@@ -0,0 +1,45 @@
+from uncertainties import ufloat
+
+from qntpy.core.quantity import Quantity
+from qntpy.core.units import m
+from qntpy.compat import uncertainties
+
+def chain(q, b, n):
+    for _ in range(n):
+        q = q*1.01 + Quantity(b, m)
+    return q
+
+def test_compact():
+    a, b = ufloat(2., 0.1), ufloat(3e-3, 2e-4)
+    q = chain(Quantity(a, m), b, 50)
+    assert uncertainties.pending_terms(q.value) > 50
+    std_dev = q.value.std_dev
+    assert uncertainties.pending_terms(q.compact().value) == 0
+    assert q.value.std_dev == std_dev
+    assert set(q.value.derivatives) == {a, b}
+
+def test_threshold():
+    a, b = ufloat(2., 0.1), ufloat(3e-3, 2e-4)
+    expected = chain(Quantity(a, m), b, 200).value
+    uncertainties.THRESHOLD = 8
+    try:
+        q = chain(Quantity(a, m), b, 200)
+        assert uncertainties.pending_terms(q.value) <= 9
+    finally:
+        uncertainties.THRESHOLD = None
+    assert abs(q.value.std_dev - expected.std_dev) < 1e-12
+    assert q.value.nominal_value == expected.nominal_value
+
+def test_threshold_inplace():
+    a, b = ufloat(2., 0.1), ufloat(3e-3, 2e-4)
+    expected = chain(Quantity(a, m), b, 200).value
+    uncertainties.THRESHOLD = 8
+    try:
+        q = Quantity(a, m)
+        for _ in range(200):
+            q *= 1.01
+            q += Quantity(b, m)
+        assert uncertainties.pending_terms(q.value) <= 9
+    finally:
+        uncertainties.THRESHOLD = None
+    assert abs(q.value.std_dev - expected.std_dev) < 1e-12
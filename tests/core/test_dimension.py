@@ -1,5 +1,15 @@
+import pytest
+
 from qntpy.core.dimension import Dim, DimVec
 
+@pytest.fixture
+def test_angle():
+    """Register a `TEST_ANGLE` dimension, and unregister it afterwards so that it doesn't leak into other tests."""
+    angle = Dim.register('TEST_ANGLE', 'A', 'rad')
+    yield angle
+    Dim._registry.remove(angle)
+    delattr(Dim, 'TEST_ANGLE')
+
 def test_validate_inputs():
     flag: bool
     try:
@@ -22,4 +32,68 @@ def test_inversion():
     vec1 = DimVec({Dim.L: 3, Dim.J: 2, Dim.I: 0})
     vec2 = DimVec({Dim.L:-3, Dim.J:-2, Dim.I: 0})
     vec1.invert()
-    assert vec1 == vec2
\ No newline at end of file
+    assert vec1 == vec2
+
+def test_register_dimension(test_angle):
+    angle = test_angle
+    assert Dim.TEST_ANGLE is angle
+    assert Dim.register('TEST_ANGLE', 'A', 'rad') is angle
+    assert len(Dim) == angle.index + 1
+    assert list(Dim)[angle.index] is angle
+    vec = DimVec({angle: 1, Dim.T: -1})
+    assert vec.exponents[angle.index] == 1
+    assert DimVec.from_exponents(vec.exponents) == vec
+    try:
+        Dim.register('TEST_ANGLE', 'Ang', 'rad')
+    except ValueError:
+        return
+    assert False, "Redefining a dimension should fail!"
+
+def test_exponents():
+    from qntpy.core.dimension import exponent_matrix
+    vec = DimVec({Dim.M: 1, Dim.L: 1, Dim.T: -2})
+    assert vec.exponents[Dim.M.index] == 1
+    assert vec.exponents[Dim.T.index] == -2
+    matrix = exponent_matrix([vec, -vec])
+    assert matrix.shape == (2, len(Dim))
+    assert (matrix[0] == -matrix[1]).all()
+
+def test_mutation_invalidates_caches():
+    vec = DimVec({Dim.M: 1, Dim.L: 1, Dim.T: -2})
+    mutations = [
+        lambda v: v.pop(Dim.M),
+        lambda v: v.popitem(),
+        lambda v: v.update({Dim.L: 2}),
+        lambda v: v.setdefault(Dim.I, 1),
+        lambda v: v.clear(),
+        lambda v: v.__ior__({Dim.T: -1}),
+    ]
+    for mutate in mutations:
+        mutated = DimVec(vec)
+        mutated.exponents, mutated.key, mutated.mag2  # fill the caches
+        mutate(mutated)
+        assert DimVec.from_exponents(mutated.exponents) == mutated
+        assert mutated.key == DimVec(mutated).key
+        assert mutated.mag2 == DimVec(mutated).mag2
+
+def test_information_dimension():
+    from qntpy.core.units import m, s
+    from qntpy.info.information import bit, byte, KiB, kB
+    from qntpy.util.exceptions import IncommensurableError
+    assert bool(bit)
+    assert (2*KiB).value == 2*8192
+    assert (2*kB).value == 2*8000
+    assert (2*byte/s).unit.symbol == 'b s⁻¹'
+    try:
+        1*byte + 1*m
+    except IncommensurableError:
+        return
+    assert False, "Bytes and meters should be incommensurable!"
+
+def test_float_exponents():
+    from qntpy.core.quantity import Quantity
+    from qntpy.core.units import m
+    assert str(Quantity(16., m*m)**0.5) == '4.0 m'
+    assert str(Quantity(2., m)**2.0) == '4.0 m²'
+    assert (m**2.0).vec.key == (m*m).vec.key
+    assert (Quantity(3., m**2.0) + Quantity(2., m*m)).value == 5.
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from qntpy.core.matrix import QuantityMatrix, inv, solve
+from qntpy.core.units import m, s, km, h
+from qntpy.util.exceptions import IncommensurableError
+
+def test_matrix_units():
+    state = QuantityMatrix([2., 36.], [km, km/h])
+    assert np.allclose(state.value, [2000., 10.])
+    assert state[1].unit == m/s and state.unit(0) == m
+    F = QuantityMatrix([[1., 0.1], [0., 1.]], [m, m/s], [1/m, s/m])
+    assert F[0, 1].unit == s
+    predicted = F @ state
+    assert predicted.row_units == [m, m/s] and np.allclose(predicted.value, [2001., 10.])
+    P = QuantityMatrix(np.diag([1., 4.]), [m, m/s], [m, m/s])
+    assert (F @ P @ F.T)[0, 1].unit == m*m/s
+    assert np.isclose((state @ inv(P) @ state), 2000.**2 + 25.)
+    with pytest.raises(IncommensurableError):
+        P @ state
+    with pytest.raises(IncommensurableError):
+        state + P
+
+def test_solve_and_inv():
+    A = QuantityMatrix([[2., 1.], [1., 3.]], [m, m/s], [1/m, s/m])
+    b = QuantityMatrix([3., 5.], [m, m/s])
+    x = solve(A, b)
+    assert x.row_units == [m, m/s] and np.allclose((A @ x - b).value, 0.)
+    identity = inv(A) @ A
+    assert np.allclose(identity.value, np.eye(2)) and identity[0, 1].unit == s
+    assert np.allclose(np.linalg.solve(A, b).value, x.value)
+
+def test_stacked_matrices():
+    rng = np.random.default_rng(0)
+    A = QuantityMatrix(rng.random((50, 2, 2)) + 2*np.eye(2), [m, m/s], [1/m, s/m])
+    b = QuantityMatrix(rng.random((50, 2)), [m, m/s])
+    x = solve(A, b)
+    assert x.shape == (50, 2)
+    assert np.allclose((A @ x).value, b.value)
+    assert (A @ inv(A)).shape == (50, 2, 2)
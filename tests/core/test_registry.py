@@ -0,0 +1,49 @@
+from qntpy.core.dimension import Dim, DimVec
+from qntpy.core.registry import UnitRegistry, default_registry
+import pytest
+
+from qntpy.core import units
+from qntpy.core.units import m, s, N, Pa, J
+from qntpy.constants import us
+from qntpy.info import information
+
+def test_dim_key():
+    force = DimVec({Dim.M: 1, Dim.L: 1, Dim.T: -2})
+    assert force.key == (N.vec).key
+    assert force.key != (-force).key
+    assert DimVec({}).key == 0
+    keys = {DimVec({dim: power}).key for dim in Dim for power in (-2, -1, 1, 2)}
+    assert len(keys) == 4*len(Dim)
+
+def test_units_for_dimension():
+    registry = UnitRegistry([m, s, N, Pa, J])
+    registry.register(us.ft, 'foot')
+    assert registry.units_for(m.vec) == (m, us.ft)
+    assert registry.units_for(N*m) == (J,)
+    assert registry.units_for(m*m) == ()
+    assert registry.lookup('foot') is us.ft
+    assert registry.lookup('ft') is us.ft
+    assert registry.commensurable(N/m/m, Pa)
+
+def test_default_registry():
+    assert default_registry.lookup('Pa') is Pa
+    assert default_registry.lookup('Btu') is us.Btu
+    psi = default_registry.lookup('psi')
+    assert psi in default_registry.units_for(Pa)
+    assert abs(psi.factor - 6894.757) < 1e-3
+
+def test_prefixed_units():
+    assert units.kN.factor == 1000 and units.kN.vec == N.vec
+    assert units.MPa.symbol == 'MPa'
+    assert units.mg.factor == pytest.approx(1e-6)
+    assert units.uA.symbol == 'μA'
+    assert units.kN is units.kN
+    GHz = units.GHz
+    assert default_registry.lookup('GHz') is GHz
+    assert us.kpsi.factor == pytest.approx(6894757, rel=1e-6)
+    assert information.Gbit.factor == 10**9
+    for name in ('kkg', 'kdegC', 'xm', 'Mft'):
+        with pytest.raises(AttributeError):
+            getattr(units, name)
+    with pytest.raises(AttributeError):
+        us.kft
@@ -0,0 +1,39 @@
+import numpy as np
+
+from qntpy.core.units import s
+from qntpy.info.information import bit
+from qntpy.info import sizes
+from qntpy.util.exceptions import IncommensurableError, InvalidUnitError
+
+def test_parse():
+    q = sizes.parse(np.array([["1.5 GiB", "820kB"], ["12 Mbit", "3 bytes"]]))
+    assert q.unit == bit
+    assert np.array_equal(q.value, [[1.5*8*2**30, 820e3*8], [12e6, 24]])
+    rates = sizes.parse(["10 MB/s", "1 Gbps"])
+    assert rates.unit == bit/s
+    assert np.array_equal(rates.value, [80e6, 1e9])
+    # a size of exactly one bit is still a `Quantity`, not the bare unit
+    one = sizes.parse("1 b")
+    assert one.unit == bit and one.value == 1.
+    assert sizes.parse(["1 bps"]).unit == bit/s
+
+def test_parse_errors():
+    for strings, error in ((["1 MB", "2 MB/s"], IncommensurableError), (["1 Bb"], InvalidUnitError), (["1 XB"], ValueError)):
+        try:
+            sizes.parse(strings)
+        except error:
+            pass
+        else:
+            assert False
+
+def test_humanize():
+    q = sizes.parse(["1536 MiB", "820000 B", "999.9 kB", "-4 MiB", "0 B"])
+    assert list(sizes.humanize(q)) == ["1.5 GiB", "820 kB", "1 MB", "-4 MiB", "0 B"]
+    assert list(sizes.humanize(q, 'decimal')) == ["1.61 GB", "820 kB", "1 MB", "-4.19 MB", "0 B"]
+    assert list(sizes.humanize(sizes.parse(["5 KiB/s"]), bits=True)) == ["40 Kib/s"]
+
+def test_symbols_match_information_units():
+    from qntpy.info import information
+    for name in ('kB', 'MiB', 'EB', 'EiB'):
+        assert sizes.parse([f"1 {name}"]).value[0] == getattr(information, name).factor
+    assert sizes.parse(["1 Kibit"]).value[0] == information.KiB.factor / information.byte.factor
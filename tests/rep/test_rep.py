@@ -0,0 +1,78 @@
+import numpy as np
+
+from qntpy.rep import NumberSystems
+from qntpy.rep.rep import array_dispatch, format_real, value_to_SI_rep
+
+NIST = NumberSystems.NIST
+
+def test_digit_grouping():
+    formatted = format_real(np.array([1234.5, 12345.678, 0.123456]), NIST, notation='fixed')
+    assert formatted.tolist() == ['1234.500 000', '12 345.678 000', '0.123 456']
+    assert value_to_SI_rep(1234567, NIST) == '1 234 567'
+    assert format_real(np.array([2997., 1234.]), NIST).tolist() == ['2997', '1234']
+
+def test_scientific_notation():
+    formatted = format_real(np.array([1e-9, -2.5e10]), NIST)
+    assert formatted.tolist() == ['1.0 ⨯ 10⁻⁹', '-2.5 ⨯ 10¹⁰']
+    formatted = format_real(np.array([1.5e4, 2.5e5]), NIST, notation='engineering')
+    assert formatted.tolist() == ['15 ⨯ 10³', '250 ⨯ 10³']
+
+def test_single_notation():
+    formatted = array_dispatch(np.arange(2000.)*0.999, NIST, edgeitems=2, precision=3)
+    assert formatted == '[ 0.000 ⨯ 10⁰, 9.990 ⨯ 10⁻¹, ...,  1.996 ⨯ 10³,  1.997 ⨯ 10³]'
+    assert format_real(np.array([1., 2., 3e9]), NIST).tolist() == ['1 ⨯ 10⁰', '2 ⨯ 10⁰', '3 ⨯ 10⁹']
+    assert format_real(np.array([0, -5, 123456789012345]), NIST).tolist() == ['0', '-5', '123 456 789 012 345']
+
+def test_non_finite():
+    assert format_real(np.array([np.nan, -np.inf, 1.]), NIST).tolist() == ['nan', '-inf', '1']
+
+def test_complex():
+    assert value_to_SI_rep(2-1.5j, NIST) == '2.0 - 1.5i'
+    assert value_to_SI_rep(complex(np.nan, -np.inf), NIST) == 'nan - infi'
+
+def test_float32_precision():
+    from qntpy.rep.rep import prefixed_rep
+    assert format_real(np.float32([1.1, 12.25]), NIST).tolist() == ['1.10', '12.25']
+    assert value_to_SI_rep(np.complex64(1.1 + 2.2j), NIST) == '1.1 + 2.2i'
+    assert prefixed_rep(np.float32(1100.), 'N', NIST) == '1.1 kN'
+
+def test_array_layout():
+    assert array_dispatch(np.arange(4.).reshape(2, 2), NIST) == '[[0, 1],\n [2, 3]]'
+
+def test_summarized_array():
+    formatted = array_dispatch(np.arange(10_000), NIST, edgeitems=2)
+    assert formatted == '[   0,    1, ..., 9998, 9999]'
+
+def test_prefix_lookup():
+    from qntpy.rep.rep import exponent_to_abbrev, exponent_to_prefix
+    assert exponent_to_abbrev(3, False) == 'k'
+    assert exponent_to_abbrev(0, True) == 'k'
+    assert exponent_to_prefix(-6, False) == 'micro'
+    try:
+        exponent_to_abbrev(4, False)
+    except ValueError:
+        return
+    assert False, "10^4 has no prefix!"
+
+def test_prefixed_rep():
+    from qntpy.rep.rep import prefixed_rep
+    assert prefixed_rep(12300., 'N', NIST) == '12.3 kN'
+    assert prefixed_rep(4.7e-6, 'F', NIST) == '4.7 μF'
+    assert prefixed_rep(np.array([1e3, 2e-3]), 'V', NIST) == '[1 kV, 2 mV]'
+    assert prefixed_rep(np.array([1e3, 2.5e3]), 'W', NIST, shared=True) == '[1.0, 2.5] kW'
+    assert prefixed_rep(2.5, 'g', NIST, is_kg=True) == '2.5 kg'
+    assert prefixed_rep(3e5, 'm s⁻¹', NIST) == '300 000 m s⁻¹'
+    # the prefix is chosen for the value as displayed, after rounding
+    assert prefixed_rep(999.99999999999, 'N', NIST) == '1 kN'
+    assert prefixed_rep(999.96, 'N', NIST, precision=1) == '1 kN'
+    assert prefixed_rep(999.94, 'N', NIST, precision=1) == '999.9 N'
+
+def test_quantity_display_mode():
+    from qntpy.core.units import N
+    from qntpy.rep import rep
+    try:
+        rep.set_display_options(prefix='auto')
+        assert str(12300*N) == '12.3 kN'
+    finally:
+        rep.set_display_options(prefix=None)
+    assert str(12300*N) == '12300 N'
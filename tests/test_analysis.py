@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from qntpy import analysis
+from qntpy.core.quantity import Quantity
+from qntpy.core.units import kg, m, s, N, Pa
+from qntpy.util.exceptions import IncommensurableError
+
+def test_integer_nullspace():
+    matrix = np.array([[1, 2, 0, -1], [0, 3, 1, 2], [1, 5, 1, 1]])
+    basis = analysis.integer_nullspace(matrix)
+    assert basis.shape == (2, 4) and not (matrix @ basis.T).any()
+    assert np.array_equal(analysis.integer_nullspace([[2, 4, 6]]), [[-2, 1, 0], [-3, 0, 1]])
+    assert analysis.integer_nullspace(np.eye(3, dtype=int)).shape == (0, 3)
+
+def test_pi_groups():
+    rho, L, mu = Quantity(1000., kg/m**3), Quantity(0.05, m), Quantity(1e-3, Pa*s)
+    v = Quantity(np.linspace(0.1, 2., 5), m/s)
+    groups = analysis.pi_groups(rho, v, L, mu, Quantity(2., N), names=['ρ', 'v', 'L', 'μ', 'F'])
+    assert [group.exponents for group in groups] == [(-1, -1, -1, 1, 0), (-1, -2, -2, 0, 1)]
+    assert str(groups[0]) == 'ρ⁻¹ v⁻¹ L⁻¹ μ'
+    reynolds = 1/groups[0](rho, v, L, mu, Quantity(2., N))
+    assert np.allclose(reynolds, 1000.*v.value*0.05/1e-3)
+    with pytest.raises(IncommensurableError):
+        groups[0](rho, L, v, mu, Quantity(2., N))
+    assert len(analysis.pi_groups(s, m, m/s**2, kg)) == 1
+
+def test_pi_group_of_integers():
+    group = analysis.pi_groups(kg/m**3, m/s, m, Pa*s)[0]
+    values = Quantity(np.int64(1000), kg/m**3), Quantity(np.int64(2), m/s), Quantity(np.array([1, 2]), m), Quantity(np.int64(1), Pa*s)
+    assert np.allclose(1/group(*values), [2000., 4000.])
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from qntpy.core.quantity import Quantity
+from qntpy.core.units import m, s
+from qntpy.constants.us import ft
+from qntpy.pandas import QuantityArray, QuantityDtype
+from qntpy.util.exceptions import IncommensurableError, InvalidUnitError
+
+def frame():
+    return pd.DataFrame({
+        'g': ['a', 'b', 'a', 'b'],
+        'd': QuantityArray([1000., 2000., 3000., 4000.], ft),
+        't': QuantityArray([2., 2., 4., 8.], s),
+    })
+
+def test_dtype():
+    df = frame()
+    assert df['d'].dtype == QuantityDtype(m)
+    assert str(df['d'].dtype) == 'quantity[m]'
+    assert np.allclose(df['d'].array.value_in(ft), [1000., 2000., 3000., 4000.])
+    assert pd.Series([1., 2.], dtype='quantity[m]')[0].value == 1.
+    with pytest.raises(InvalidUnitError):
+        QuantityDtype(ft)
+
+def test_arithmetic():
+    df = frame()
+    v = df['d'] / df['t']
+    assert v.dtype == QuantityDtype(m/s)
+    assert np.allclose(v.array.to_quantity().value, [152.4, 304.8, 228.6, 152.4])
+    assert list(df['d'] > Quantity(700., m)) == [False, False, True, True]
+    with pytest.raises(IncommensurableError):
+        df['d'] + df['t']
+
+def test_multiply_by_plain_columns():
+    series = pd.Series(QuantityArray([1., 1.], m))
+    for other in (pd.Series([1., 2.]), np.array([1., 2.])):
+        for product in (series * other, other * series):
+            assert product.dtype == QuantityDtype(m)
+            assert np.allclose(product.array.value_in(m), [1., 2.])
+
+def test_reductions_take_concat_groupby():
+    df = frame()
+    assert np.isclose(df['d'].sum().value, 3048.)
+    assert df['d'].var().unit == m**2
+    assert np.isnan(df.reindex([0, 5])['d'].array._data[1])
+    assert pd.concat([df, df])['d'].dtype == QuantityDtype(m)
+    sums = df.groupby('g')['d'].sum()
+    assert sums.dtype == QuantityDtype(m)
+    assert np.allclose(sums.array.value_in(ft), [4000., 6000.])
+    assert df.groupby('g')['t'].max()['b'].value == 8.
+
+def test_reductions_of_one():
+    series = pd.Series(QuantityArray([1., 2., 4.], m))
+    assert isinstance(series.min(), Quantity) and series.min().value == 1.
+    described = series.describe()
+    assert list(described[['min', '25%', 'max']]) == [1., 1.5, 4.]
+    assert series.quantile(0.5).value == 2.
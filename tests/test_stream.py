@@ -0,0 +1,54 @@
+import asyncio
+
+import numpy as np
+
+from qntpy import stream
+from qntpy.core import units
+from qntpy.constants import us
+from qntpy.util.exceptions import IncommensurableError
+
+async def collect(items):
+    return [item async for item in items]
+
+def test_pipeline():
+    feed = stream.source(["71.6 degF", "20 degC", "300 K", (32, us.degF), "5 m"])
+    readings = stream.check(stream.parse(feed), units.K, errors='drop')
+    windows = asyncio.run(collect(stream.convert(stream.batch(readings, 3))))
+    assert [len(window.value) for window in windows] == [3, 1]
+    assert np.allclose(windows[0].value, [295.15, 293.15, 300.])
+    assert windows[0].unit == units.K
+    celsius = asyncio.run(collect(stream.convert(stream.batch(stream.parse(stream.source(["300 K"])), 4), units.degC)))
+    assert np.allclose(celsius[0].value_in(units.degC), [26.85])
+
+def test_check_raises():
+    readings = stream.check(stream.parse(stream.source(["5 m", "1 s"])), units.m)
+    try:
+        asyncio.run(collect(readings))
+    except IncommensurableError:
+        pass
+    else:
+        assert False
+
+def test_batch_timeout():
+    async def feed():
+        for reading in ["1 m", "2 m"]:
+            yield reading
+        await asyncio.sleep(0.2)
+        yield "3 m"
+    batches = asyncio.run(collect(stream.batch(stream.parse(feed()), 10, timeout=0.05)))
+    assert [len(batch) for batch in batches] == [2, 1]
+
+def test_buffer_backpressure():
+    produced = []
+    async def producer():
+        for i in range(100):
+            produced.append(i)
+            yield i
+    async def consume_one():
+        items = stream.buffer(producer(), 5)
+        first = await items.__anext__()
+        await asyncio.sleep(0.01)
+        await items.aclose()
+        return first
+    assert asyncio.run(consume_one()) == 0
+    assert len(produced) < 10
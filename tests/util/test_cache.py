@@ -0,0 +1,50 @@
+import time
+
+import numpy as np
+import pytest
+
+import qntpy
+from qntpy.core.quantity import Quantity
+from qntpy.core.units import m, Pa, K, degC
+from qntpy.constants.us import ft, psi, degF
+
+def test_quantity_hash():
+    assert hash(Quantity(2, ft)) == hash(Quantity(0.6096, m))
+    assert len({Quantity(50, degF), Quantity(10, degC), Quantity(283.15, K)}) == 1
+    zero = Quantity(0., m)
+    assert zero == 0 and hash(zero) == hash(0) and hash(Quantity(-0., ft)) == hash(0)
+    assert {0: 'zero'}[zero] == 'zero'
+    with pytest.raises(TypeError):
+        hash(Quantity(np.arange(3.), m))
+
+def test_cached_canonical_keys():
+    calls = []
+    @qntpy.cached(maxsize=8)
+    def pressure_ratio(p, reference=None):
+        calls.append(p)
+        return p / Quantity(101325., Pa)
+    pressure_ratio(Quantity(2, psi))
+    pressure_ratio(Quantity(2*psi.value, Pa))
+    pressure_ratio(Quantity(np.arange(1., 4.), psi))
+    pressure_ratio(Quantity(np.arange(1., 4.), psi))
+    pressure_ratio(reference=1, p=Quantity(2, psi))
+    assert len(calls) == 3
+    info = pressure_ratio.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 3, 3)
+    pressure_ratio.cache_clear()
+    assert pressure_ratio.cache_info().currsize == 0
+
+def test_cached_eviction():
+    @qntpy.cached(maxsize=2)
+    def square(x):
+        return x*x
+    for x in (1., 2., 1., 3., 2.):
+        square(Quantity(x, m))
+    assert square.cache_info().evictions == 2
+    @qntpy.cached(ttl=0.01)
+    def identity(x):
+        return x
+    identity(1)
+    time.sleep(0.02)
+    identity(1)
+    assert identity.cache_info().expirations == 1
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from uncertainties import ufloat
+
+from qntpy.core.quantity import Quantity
+from qntpy.core.units import m
+from qntpy.util import montecarlo
+
+def test_nonlinear_propagation():
+    montecarlo.seed(0)
+    x = montecarlo.normal(1., 0.5, n=200_000)
+    y = np.exp(x)
+    # the mean of a log-normal distribution, which linear propagation gets wrong
+    assert np.isclose(y.nominal_value, np.exp(1.125), rtol=1e-2)
+    assert x.samples.flags.c_contiguous and y.n == 200_000
+
+def test_broadcasting_and_reduction():
+    montecarlo.seed(1)
+    x = montecarlo.normal(np.array([1., 2., 3.]), 0.1, n=1000)
+    assert x.shape == (3,) and x.samples.shape == (1000, 3)
+    total = np.sum(x * np.array([1., 1., 2.]))
+    assert total.shape == () and np.isclose(total.nominal_value, 9., rtol=1e-2)
+    assert x[1].shape == ()
+    assert np.sum(x[1]).shape == ()
+    with pytest.raises(np.exceptions.AxisError):
+        np.sum(x[1], axis=0)
+
+def test_correlated_ufloats():
+    montecarlo.seed(2)
+    a = ufloat(2., 0.1)
+    with montecarlo.propagation():
+        ratio = montecarlo.from_ufloat(a) / montecarlo.from_ufloat(2*a)
+        assert montecarlo._variable_samples.get()
+    assert np.allclose(ratio.samples, 0.5)
+    # samples aren't kept outside a block
+    assert montecarlo._variable_samples.get() is None
+    assert not np.allclose((montecarlo.from_ufloat(a) / montecarlo.from_ufloat(2*a)).samples, 0.5)
+
+def test_quantity_value_and_formatting():
+    montecarlo.seed(3)
+    q = Quantity(montecarlo.normal(2., 0.1), m)
+    area = q*q
+    assert area.unit == m**2
+    assert str(area).endswith(' m²')
+    assert str(montecarlo.Samples(np.array([1., 1.2]))) == '1.10(14)'
+    sampled = montecarlo.sample(Quantity(ufloat(3., 0.2), m))
+    assert isinstance(sampled.value, montecarlo.Samples)
@@ -0,0 +1,37 @@
+from qntpy.core.units import m, s
+from qntpy.constants.us import ft
+from qntpy.util import profiling
+
+def test_disabled_by_default():
+    assert profiling.ENABLED is False
+    (3*m) / s
+    assert profiling.stats().counts == {}
+
+def test_profile_counts_events():
+    with profiling.profile() as stats:
+        assert profiling.ENABLED
+        (3*m + 4*ft) / s
+    assert not profiling.ENABLED
+    assert stats[profiling.QUANTITY_NEW] >= 3
+    assert stats[profiling.COMMENSURABILITY_CHECK] == 1
+    assert stats[profiling.CONVERSION] == 1
+    assert stats[profiling.UNIT_OP] >= 1
+
+def test_nested_profiles_and_callsites():
+    with profiling.profile() as outer:
+        with profiling.profile(callsites=True) as inner:
+            3*m
+        3*m
+    assert inner[profiling.QUANTITY_NEW] == 1
+    assert outer[profiling.QUANTITY_NEW] == 2
+    assert inner.callsites
+    assert all(site.startswith(__file__) for _, site in inner.callsites)
+
+def test_process_wide_stats():
+    try:
+        profiling.enable()
+        3*m
+    finally:
+        profiling.disable()
+    3*m
+    assert profiling.stats()[profiling.QUANTITY_NEW] == 1